@@ -0,0 +1,132 @@
+# benchmarks/output_latency.py
+
+"""
+Measure the latency between an entry being put on the output queue (by another
+process, like the Transcriber/Translator) and a WebSocket client receiving it.
+
+Compares `WebSocketIO`, which pushes output into the event loop from a bridge
+thread, with the previous delivery loop polling `output_queue.empty()` every
+10 ms.
+
+Run from the repository root as a module, so `live_translation` is imported
+from the source tree without installing it:
+    python -m benchmarks.output_latency [--entries N] [--interval SECONDS]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import statistics
+import threading
+import time
+import websockets
+from live_translation.server._ws import WebSocketIO
+from live_translation.server.config import Config
+
+
+class PollingWebSocketIO(threading.Thread):
+    """Reference server delivering output with the previous polling loop."""
+
+    def __init__(self, port, output_queue, stop_event):
+        super().__init__(daemon=True)
+        self._port = port
+        self._output_queue = output_queue
+        self._stop_event = stop_event
+
+    def run(self):
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        async def handler(websocket):
+            while not self._stop_event.is_set():
+                if not self._output_queue.empty():
+                    entry = self._output_queue.get()
+                    await websocket.send(json.dumps(entry))
+                await asyncio.sleep(0.01)
+
+        async with websockets.serve(handler, "localhost", self._port):
+            while not self._stop_event.is_set():
+                await asyncio.sleep(0.1)
+
+
+def produce(output_queue, entries, interval):
+    """Producer process: put timestamped entries on the output queue."""
+    for _ in range(entries):
+        time.sleep(interval)
+        output_queue.put(
+            {
+                "transcription": "benchmark",
+                "translation": "",
+                "sent": time.perf_counter(),
+            }
+        )
+
+
+async def measure(port, output_queue, entries, interval) -> list:
+    """Connect a client and collect the delivery latency of each entry (ms)."""
+    async with websockets.connect(f"ws://localhost:{port}") as websocket:
+        producer = mp.Process(target=produce, args=(output_queue, entries, interval))
+        producer.start()
+        latencies = []
+        for _ in range(entries):
+            entry = json.loads(await websocket.recv())
+            latencies.append((time.perf_counter() - entry["sent"]) * 1000)
+        producer.join()
+    return latencies
+
+
+def run(name, server_factory, port, entries, interval):
+    stop_event = mp.Event()
+    output_queue = mp.Queue()
+    server = server_factory(port, output_queue, stop_event)
+    server.daemon = True
+    server.start()
+    time.sleep(0.5)  # Let the server bind
+
+    latencies = asyncio.run(measure(port, output_queue, entries, interval))
+    stop_event.set()
+    server.join(timeout=2)
+
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(
+        f"{name:>8}: mean {statistics.mean(latencies):6.2f} ms | "
+        f"p50 {statistics.median(latencies):6.2f} ms | p95 {p95:6.2f} ms | "
+        f"max {latencies[-1]:6.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.023)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    run(
+        "polling",
+        lambda port, output_queue, stop_event: PollingWebSocketIO(
+            port, output_queue, stop_event
+        ),
+        args.port,
+        args.entries,
+        args.interval,
+    )
+    run(
+        "bridge",
+        lambda port, output_queue, stop_event: WebSocketIO(
+            port,
+            mp.Queue(),
+            output_queue,
+            stop_event,
+            Config(ws_port=port, codec="pcm"),
+        ),
+        args.port + 1,
+        args.entries,
+        args.interval,
+    )
+
+
+if __name__ == "__main__":
+    main()
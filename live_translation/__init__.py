@@ -1,15 +1,45 @@
 # live_translation/__init__.py
 
-from .server.server import LiveTranslationServer
-from .server.config import Config as ServerConfig
-from .client.client import LiveTranslationClient
-from .client.config import Config as ClientConfig
+import importlib
+from typing import TYPE_CHECKING
+
+# Exports are imported on first access, so that e.g. the client doesn't load the
+# server's dependencies (torch, transformers, faster-whisper)
+_EXPORTS = {
+    "LiveTranslationServer": (".server.server", "LiveTranslationServer"),
+    "ServerConfig": (".server.config", "Config"),
+    "FileTranslator": (".server._offline", "FileTranslator"),
+    "LiveTranslationClient": (".client.client", "LiveTranslationClient"),
+    "ClientConfig": (".client.config", "Config"),
+}
+
+if TYPE_CHECKING:
+    from .server.server import LiveTranslationServer
+    from .server.config import Config as ServerConfig
+    from .server._offline import FileTranslator
+    from .client.client import LiveTranslationClient
+    from .client.config import Config as ClientConfig
 
 __all__ = [
     "LiveTranslationServer",
     "ServerConfig",
+    "FileTranslator",
     "LiveTranslationClient",
     "ClientConfig",
 ]
 
 __version__ = "0.9.0"
+
+
+def __getattr__(name):
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value  # Only look it up once
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
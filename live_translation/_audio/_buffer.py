@@ -0,0 +1,73 @@
+# _audio/_buffer.py
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity float32 ring buffer for accumulating speech audio.
+
+    Appending and trimming are O(1) in the number of buffered samples: appends copy
+    only the new chunk and trimming just advances the head. Every sample is stored
+    twice (at `i` and `i + capacity`), so any window of the buffer is available as
+    one contiguous numpy view without concatenating.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("🚨 'capacity' must be positive.")
+        self._capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=np.float32)
+        self._head = 0  # Absolute index of the oldest sample
+        self._tail = 0  # Absolute index one past the newest sample
+
+    def __len__(self):
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, chunk: np.ndarray):
+        """
+        Append a chunk of samples.
+        If the buffer would overflow, the oldest samples are dropped to make room.
+        """
+        n = len(chunk)
+        if n > self._capacity:
+            chunk = chunk[-self._capacity :]
+            n = self._capacity
+        overflow = len(self) + n - self._capacity
+        if overflow > 0:
+            self._head += overflow
+
+        pos = self._tail % self._capacity
+        first = min(n, self._capacity - pos)
+        self._write(pos, chunk[:first])
+        if first < n:
+            self._write(0, chunk[first:])
+        self._tail += n
+
+    def _write(self, pos: int, samples: np.ndarray):
+        """Write samples at `pos` and at its mirror position."""
+        end = pos + len(samples)
+        self._data[pos:end] = samples
+        self._data[pos + self._capacity : end + self._capacity] = samples
+
+    def trim(self, n: int):
+        """Drop the `n` oldest samples."""
+        self._head = min(self._head + n, self._tail)
+
+    def clear(self):
+        """Drop all samples."""
+        self._head = self._tail = 0
+
+    def view(self, start: int = 0) -> np.ndarray:
+        """
+        Return a contiguous view of the buffered samples from `start` (relative to
+        the oldest sample) to the newest one.
+        NOTE: The view is only valid until the next `append`. Copy it if it must
+        outlive that.
+        """
+        pos = (self._head + start) % self._capacity
+        return self._data[pos : pos + len(self) - start]
@@ -1,7 +1,7 @@
 # _audio/_codec.py
 
 import opuslib
-from ..server.config import Config
+from ._settings import AudioConfig
 
 
 class OpusCodec:
@@ -10,9 +10,10 @@ class OpusCodec:
 
     This class provides methods to encode raw audio data into Opus format
     and decode Opus data back into raw audio.
+    Works with the client or the server config.
     """
 
-    def __init__(self, cfg: Config):
+    def __init__(self, cfg: AudioConfig):
         self._cfg = cfg
         self._encoder = opuslib.Encoder(
             self._cfg.SAMPLE_RATE, self._cfg.CHANNELS, opuslib.APPLICATION_VOIP
@@ -3,10 +3,37 @@
 import multiprocessing as mp
 import queue
 import threading
-import numpy as np
 import time
+import numpy as np
 from ._vad import VoiceActivityDetector
+from ._buffer import AudioRingBuffer
+from ._shm import SegmentArena
 from ..server.config import Config
+from ..server._trace import stamp
+from ..server._metrics import PipelineStats
+from ..server._startup import report_ready, warmup_audio
+
+
+class _SessionState:
+    """VAD and buffering state of one client session."""
+
+    def __init__(
+        self,
+        sid,
+        vad: VoiceActivityDetector,
+        buffer: AudioRingBuffer,
+        enqueue_len: int = 0,
+    ):
+        self.sid = sid
+        self.vad = vad
+        self.buffer = buffer
+        self.silence_chunks_count = 0  # Track consecutive silence
+        self.last_sent_len = 0  # Track last enqueue position (samples)
+        self.unflushed = False  # Audio sent since the last end-of-utterance flush
+        self.trace = None  # Trace of the latest chunk (tracing only)
+        self.enqueue_len = enqueue_len  # New speech (samples) that triggers ENQUEUE
+        self.held = None  # Newest segment held back while the queue is full
+        self.held_trace = None
 
 
 class AudioProcessor(mp.Process):
@@ -21,14 +48,24 @@ class AudioProcessor(mp.Process):
         processed_queue: mp.Queue,
         stop_event: threading.Event,
         cfg: Config,
+        arena: SegmentArena = None,
+        stats: PipelineStats = None,
+        ready_queue: mp.Queue = None,
     ):
         super().__init__()
         self._audio_queue = audio_queue
         self._processed_queue = processed_queue
         self._stop_event = stop_event
         self._cfg = cfg
-        self._vad = None
-        self._audio_buffer = []
+        self._arena = arena
+        self._stats = stats
+        self._ready_queue = ready_queue
+        self._multi_session = cfg.MAX_SESSIONS > 1
+        self._bounded = cfg.PROCESSED_QUEUE_SIZE > 0
+        self._policy = cfg.OVERLOAD_POLICY
+        self.shed = 0  # Segments shed while the transcriber was behind
+        # Per-session state, allocated in the child process, see run()
+        self._sessions = {}
 
     def run(self):
         """
@@ -42,100 +79,338 @@ class AudioProcessor(mp.Process):
             - Append the new chunk to `audio_buffer` (context accumulation).
             - Check if we have at least `ENQUEUE_THRESHOLD` seconds of
             new speech:
-                - If yes, concatenate the buffer and send it to
-                `processed_queue` for transcription.
+                - If yes, send the buffer to `processed_queue` for transcription.
                 - Update `last_sent_len` to track how much has been sent.
             - If the total `audio_buffer` duration exceeds
             `MAX_BUFFER_DURATION`:
-                - Trim the buffer by removing `TRIM_FACTOR`.
-                - Update `audio_buffer_start_len` to track the new
-                starting position.
+                - Trim the buffer by removing `TRIM_FACTOR` of its oldest audio.
                 - Adjust `last_sent_len` to ensure proper tracking after
                 trimming.
         4. If silence is detected:
             - Increment `silence_chunks_count` to track consecutive silent chunks.
             - If `silence_chunks_count` reaches `SOFT_SILENCE_THRESHOLD` in chunks:
-                - If there is any speech in the buffer (new speech that hasn't exceeded
-                ENQUEUE_THRESHOLD yet to get enqueued normally):
-                    - Concatenate the buffer and send it to `processed_queue`.
+                - If there is any speech in the buffer that hasn't been sent yet
+                (new speech that hasn't exceeded ENQUEUE_THRESHOLD yet to get
+                enqueued normally):
+                    - Send the buffer to `processed_queue`.
                     - Update `last_sent_len` to track how much has been sent.
             - If silence_chunks_count reaches `SILENCE_THRESHOLD` in chunks:
                 - Reset the buffer (since speech has clearly stopped).
+                - Reset the VAD stream state.
                 - Reset `last_sent_len` and `silence_chunks_count`.
+
+        NOTE: Each session (client) has its own VAD stream, `audio_buffer` and
+        counters. The VAD model is loaded once and shared by all sessions.
+        With more than one session, raw chunks arrive as `(session_id, audio)`,
+        `(session_id, None)` marks a disconnected client, and segments are sent
+        as `(session_id, segment)`.
+
+        NOTE: With tracing, raw chunks arrive as `(session_id, audio, trace)` (the
+        id is None with a single session) and segments are sent as
+        `(session_id, segment, trace)`. A segment carries the trace of the chunk
+        that triggered it, stamped with the VAD decision and enqueue times.
+
+        NOTE: `audio_buffer` is a preallocated ring buffer sized for
+        `MAX_BUFFER_DURATION` plus one chunk, and lengths are tracked in samples.
+
+        NOTE: In 'incremental' transcription mode, only the audio after
+        `last_sent_len` is sent since the transcriber keeps its own buffer. At the
+        soft silence, an empty segment is sent after the last audio to mark the
+        end of the utterance.
+
+        NOTE: `get()` blocks until audio arrives, so an idle processor doesn't
+        wake up. A `None` item (put by `PipelineManager` on shutdown) stops it.
+
+        NOTE: The processed queue holds at most `PROCESSED_QUEUE_SIZE` segments.
+        While it is full, new segments are handled by `OVERLOAD_POLICY`, see
+        `_enqueue_buffer()`. Held segments are sent as soon as there is room.
+
+        NOTE: Once the VAD is loaded (and warmed up with `warmup`), the processor
+        reports itself ready on `ready_queue` (see `StartupMonitor`).
         """
-        self._vad = VoiceActivityDetector(self._cfg)
-        silence_chunks_count = 0  # Track consecutive silence
-        last_sent_len = 0  # Track last enqueue position
-        # Track the buffer start length to calculate buffer duration from
-        _audio_buffer_start_len = 0
+        started = time.monotonic()
+        self._enqueue_len = self._seconds_to_samples(self._cfg.ENQUEUE_THRESHOLD)
+        self._max_buffer_len = self._seconds_to_samples(self._cfg.MAX_BUFFER_DURATION)
+        self._soft_silence_chunks = self._seconds_to_chunks(
+            self._cfg.SOFT_SILENCE_THRESHOLD
+        )
+        self._silence_chunks = self._seconds_to_chunks(self._cfg.SILENCE_THRESHOLD)
+        self._incremental = self._cfg.TRANSCRIPTION_MODE == "incremental"
+        # One model for all sessions, so a new client doesn't stall the loop
+        self._vad_model = VoiceActivityDetector.load_model(self._cfg)
+        # Single session: audio chunks are untagged and state lives in `None`
+        if not self._multi_session:
+            self._open_session(None)
 
+        warmup = self._warmup() if self._cfg.WARMUP else None
+        report_ready(self._ready_queue, "audio_processor", started, warmup)
         print("🔄 AudioProcessor: Ready to process audio...")
 
         try:
             while not self._stop_event.is_set():
                 try:
-                    audio_data = self._audio_queue.get(timeout=0.5)
+                    # Only wake up without audio to send held segments
+                    item = self._audio_queue.get(timeout=self._hold_timeout())
                 except queue.Empty:
-                    continue  # Skip if queue is empty
-
-                audio_data_f32 = self._int2float(audio_data)
-
-                # Run _VAD
-                has_speech = self._vad.is_speech(audio_data_f32)
-
-                if has_speech:
-                    silence_chunks_count = 0
-
-                    # Append an audio chunk to the buffer
-                    self._audio_buffer.append(audio_data_f32)
-
-                    # Enqueue if Xs of new audio is available
-                    new_audio = self._audio_buffer[last_sent_len:]
-                    new_duration = self._buffer_duration_s(len(new_audio), 0)
-                    # If we have enough new audio, enqueue it
-                    if new_duration >= self._cfg.ENQUEUE_THRESHOLD:
-                        audio_segment = np.concatenate(self._audio_buffer)
-                        self._processed_queue.put(audio_segment)
-                        last_sent_len = len(self._audio_buffer)
-
-                    # Trim buffer if it exceeds max duration
-                    total_duration = self._buffer_duration_s(
-                        len(self._audio_buffer), _audio_buffer_start_len
-                    )
-                    if total_duration > self._cfg.MAX_BUFFER_DURATION:
-                        trim_size = int(len(self._audio_buffer) * self._cfg.TRIM_FACTOR)
-                        self._audio_buffer = self._audio_buffer[trim_size:]
-                        _audio_buffer_start_len = len(self._audio_buffer)
-                        last_sent_len = max(0, last_sent_len - trim_size)
-
-                else:
-                    silence_chunks_count += 1
-
-                    # Enqueue short speech segments or end of speech
-                    if (
-                        silence_chunks_count
-                        == self._seconds_to_chunks(self._cfg.SOFT_SILENCE_THRESHOLD)
-                        and self._audio_buffer
-                    ):
-                        audio_segment = np.concatenate(self._audio_buffer)
-                        self._processed_queue.put(audio_segment)
-                        last_sent_len = len(self._audio_buffer)
-
-                    # Reset buffer on long silence
-                    if silence_chunks_count >= self._seconds_to_chunks(
-                        self._cfg.SILENCE_THRESHOLD
-                    ):
-                        self._audio_buffer = []
-                        last_sent_len = 0
-                        silence_chunks_count = 0
-
-                time.sleep(0.01)
+                    self._send_held()
+                    continue
+                if item is None:
+                    break  # Shutdown sentinel
+                self._send_held()
+
+                sid, audio_data, trace = self._unpack(item)
+                if audio_data is None:
+                    # The client disconnected
+                    self._close_session(sid)
+                    continue
+
+                session = self._sessions.get(sid) or self._open_session(sid)
+                self._process_chunk(session, self._int2float(audio_data), trace)
         except KeyboardInterrupt:
             pass
         finally:
+            for session in self._sessions.values():
+                self._report_pregate(session)
+                if session.held is not None:
+                    # Send if there is room, never wait on shutdown
+                    if self._overloaded():
+                        self._shed_segment()
+                    else:
+                        self._send_held_segment(session)
+            if self.shed:
+                print(
+                    f"🚨 AudioProcessor: Shed {self.shed} segments while the "
+                    f"transcriber was behind ({self._policy})."
+                )
             self._cleanup()
             print("🔄 AudioProcessor: Stopped.")
 
+    def _warmup(self) -> float:
+        """
+        Run a synthetic utterance through the VAD model shared by the sessions.
+        Returns the duration (s).
+        """
+        started = time.monotonic()
+        # The warm-up doesn't touch the stream state of the sessions' VADs
+        vad = VoiceActivityDetector(self._cfg, self._vad_model)
+        vad.warmup(warmup_audio(self._cfg.SAMPLE_RATE))
+        return time.monotonic() - started
+
+    def _unpack(self, item) -> tuple:
+        """Split a raw audio item into (session id, audio, trace)."""
+        if self._cfg.TRACE:
+            return item
+        if self._multi_session:
+            return (*item, None)
+        return None, item, None
+
+    def _open_session(self, sid) -> _SessionState:
+        """Create the VAD and buffer state of a session."""
+        session = _SessionState(
+            sid,
+            VoiceActivityDetector(self._cfg, self._vad_model),
+            AudioRingBuffer(
+                self._cfg.MAX_BUFFER_DURATION * self._cfg.SAMPLE_RATE
+                + self._cfg.CHUNK_SIZE
+            ),
+            self._enqueue_len,
+        )
+        session.vad.reset()
+        self._sessions[sid] = session
+        return session
+
+    def _close_session(self, sid):
+        """Drop the state of a session."""
+        session = self._sessions.pop(sid, None)
+        if session is not None:
+            self._report_pregate(session)
+
+    def _report_pregate(self, session: _SessionState):
+        """Print how often the VAD pre-gate skipped the model for a session."""
+        if not self._cfg.VAD_PREGATE:
+            return
+        sid = session.sid
+        total = session.vad.model_calls + session.vad.gated
+        name = "" if sid is None else f" (session {sid})"
+        print(
+            f"🔄 AudioProcessor: VAD pre-gate skipped the model on "
+            f"{session.vad.gated}/{total} chunks{name}."
+        )
+
+    def _process_chunk(
+        self, session: _SessionState, audio_data_f32: np.ndarray, trace: dict = None
+    ):
+        """Run VAD on a chunk of a session and buffer/enqueue its speech."""
+        # Run _VAD
+        model_calls = session.vad.model_calls
+        has_speech = session.vad.is_speech(audio_data_f32)
+        session.trace = stamp(trace, "vad")
+        if self._stats is not None:
+            self._stats.record_vad(has_speech, session.vad.model_calls - model_calls)
+
+        if has_speech:
+            session.silence_chunks_count = 0
+
+            # Append an audio chunk to the buffer
+            session.buffer.append(audio_data_f32)
+
+            # Enqueue if Xs of new audio is available
+            if len(session.buffer) - session.last_sent_len >= session.enqueue_len:
+                self._enqueue_new_audio(session)
+
+            # Trim buffer if it exceeds max duration
+            if len(session.buffer) > self._max_buffer_len:
+                # Segments after the trim lack the trimmed audio, so they don't
+                # supersede a held one
+                if session.held is not None and not self._incremental:
+                    self._send_held_segment(session)
+                trim_size = int(len(session.buffer) * self._cfg.TRIM_FACTOR)
+                session.buffer.trim(trim_size)
+                session.last_sent_len = max(0, session.last_sent_len - trim_size)
+
+        else:
+            session.silence_chunks_count += 1
+
+            # Enqueue short speech segments or end of speech
+            if session.silence_chunks_count == self._soft_silence_chunks:
+                if len(session.buffer) > session.last_sent_len:
+                    self._enqueue_new_audio(session, final=True)
+                # Let the transcriber commit the end of the utterance
+                if self._incremental and session.unflushed:
+                    self._enqueue_flush(session)
+                    session.unflushed = False
+
+            # Reset buffer on long silence. Speech has clearly stopped, so
+            # the VAD starts a new stream as well.
+            if session.silence_chunks_count >= self._silence_chunks:
+                # The next segment starts a new utterance and won't supersede
+                # a held one
+                if session.held is not None:
+                    self._send_held_segment(session)
+                session.buffer.clear()
+                session.vad.reset()
+                session.last_sent_len = 0
+                session.silence_chunks_count = 0
+
+    def _enqueue_new_audio(self, session: _SessionState, final: bool = False):
+        """
+        Enqueue the session's buffer (only unsent audio in incremental mode).
+        `final` marks the last segment of an utterance.
+        """
+        self._enqueue_buffer(
+            session, session.last_sent_len if self._incremental else 0, final
+        )
+        session.last_sent_len = len(session.buffer)
+        session.unflushed = True
+
+    def _enqueue_buffer(
+        self, session: _SessionState, start: int = 0, final: bool = False
+    ):
+        """
+        Send the session's audio buffer from `start` (whole buffer by default) for
+        transcription.
+
+        A segment held back for the session is superseded by the new one, whose
+        buffer is a superset of it (a held segment is sent before the buffer is
+        trimmed or reset). In incremental mode, the new audio is appended to the
+        held audio instead.
+
+        If the processed queue is full, the segment is handled by the overload
+        policy:
+        - 'coalesce': Hold the segment back, see `_send_held()`.
+        - 'drop': Shed the segment, unless it is `final`.
+        - 'downshift': Hold the segment back and double the session's enqueue
+          interval (up to half the max buffer). It is halved back whenever a
+          segment is sent without waiting.
+        - 'block': Wait for room.
+        """
+        segment = session.buffer.view(start)
+        if session.held is not None:
+            held, session.held = session.held, None
+            if self._incremental:
+                segment = np.concatenate([held, segment])
+            else:
+                self._shed_segment()
+
+        if not self._overloaded():
+            if self._policy == "downshift":
+                session.enqueue_len = max(self._enqueue_len, session.enqueue_len // 2)
+            self._send(session, segment)
+        elif self._policy == "block" or (self._policy == "drop" and final):
+            self._send(session, segment)  # Waits for a transcriber to catch up
+        elif self._policy == "drop":
+            self._shed_segment()
+        else:
+            # Copy since later appends may overwrite the view
+            session.held = segment.copy()
+            session.held_trace = session.trace
+            if self._policy == "downshift":
+                session.enqueue_len = min(
+                    2 * session.enqueue_len, self._max_buffer_len // 2
+                )
+
+    def _overloaded(self) -> bool:
+        """Whether the processed queue is full."""
+        return self._bounded and self._processed_queue.full()
+
+    def _hold_timeout(self) -> float | None:
+        """Raw audio wait: short while segments are held, else forever."""
+        if any(s.held is not None for s in self._sessions.values()):
+            return self._cfg.CHUNK_SIZE / self._cfg.SAMPLE_RATE
+        return None
+
+    def _send_held(self):
+        """Send the held segments for which there is room."""
+        for session in self._sessions.values():
+            if session.held is not None and not self._overloaded():
+                self._send_held_segment(session)
+
+    def _send_held_segment(self, session: _SessionState):
+        """Send the session's held segment (waiting for room if needed)."""
+        segment, session.held = session.held, None
+        self._send(session, segment, session.held_trace)
+
+    def _shed_segment(self):
+        """Count a segment that won't be transcribed."""
+        self.shed += 1
+        if self._stats is not None:
+            self._stats.record_shed()
+
+    def _send(self, session: _SessionState, segment: np.ndarray, trace: dict = None):
+        """
+        Send a segment for transcription.
+        With a shared-memory arena, the segment is copied into the arena and only
+        a `SegmentRef` goes through the queue. Otherwise (or if the arena has no
+        free slot) a copy of the audio is sent by value.
+        """
+        if self._arena is not None:
+            ref = self._arena.write([segment])
+            if ref is not None:
+                self._put(session, ref, trace)
+                return
+        # Copy since the queue pickles lazily and later appends may overwrite the view
+        self._put(session, segment.copy(), trace)
+
+    def _enqueue_flush(self, session: _SessionState):
+        """Send an empty segment to mark the end of an utterance."""
+        # The held audio belongs to the utterance the flush ends
+        if session.held is not None:
+            self._send_held_segment(session)
+        self._put(session, np.empty(0, dtype=np.float32))
+
+    def _put(self, session: _SessionState, segment, trace: dict = None):
+        """
+        Put a segment on the processed queue, tagged with its session and trace
+        if any. The trace defaults to the session's latest chunk.
+        """
+        if self._cfg.TRACE:
+            trace = stamp(dict(trace or session.trace or {}), "enqueued")
+            self._processed_queue.put((session.sid, segment, trace))
+        elif self._multi_session:
+            self._processed_queue.put((session.sid, segment))
+        else:
+            self._processed_queue.put(segment)
+
     def _cleanup(self):
         """Clean up the processor."""
         try:
@@ -143,11 +418,9 @@ class AudioProcessor(mp.Process):
         except Exception as e:
             print(f"🚨 AudioProcessor Cleanup Error: {e}")
 
-    def _buffer_duration_s(self, curr_length, start_length):
-        """Calculate buffer duration in seconds since buffer's start_length."""
-        return (
-            (curr_length - start_length) * self._cfg.CHUNK_SIZE / self._cfg.SAMPLE_RATE
-        )
+    def _seconds_to_samples(self, seconds):
+        """Convert seconds to number of audio samples."""
+        return int(round(seconds * self._cfg.SAMPLE_RATE))
 
     def _seconds_to_chunks(self, seconds):
         """Convert seconds to number of audio chunks."""
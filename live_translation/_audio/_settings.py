@@ -0,0 +1,19 @@
+# _audio/_settings.py
+
+# Audio format shared by the client and the server. This module (and the codec)
+# is imported by the client, so it must not import torch or other server-only
+# dependencies.
+
+from typing import Protocol
+
+CHUNK_SIZE = 640  # 40 ms of audio at 16 kHz
+SAMPLE_RATE = 16000  # 16 kHz
+CHANNELS = 1  # Mono
+
+
+class AudioConfig(Protocol):
+    """Audio settings of a client or server config."""
+
+    CHUNK_SIZE: int
+    SAMPLE_RATE: int
+    CHANNELS: int
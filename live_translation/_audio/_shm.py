@@ -0,0 +1,259 @@
+# _audio/_shm.py
+
+import abc
+import multiprocessing as mp
+import queue
+from collections import namedtuple
+from multiprocessing import shared_memory
+import numpy as np
+
+
+# Descriptor of a speech segment stored in a `SegmentArena`.
+# offset/length are in samples from the start of the arena's audio data.
+SegmentRef = namedtuple("SegmentRef", ["offset", "length", "seq"])
+
+
+class _SharedBlock(abc.ABC):
+    """
+    Base for objects whose state lives in a named shared-memory block.
+
+    Subclasses list the numpy views they create in `_VIEWS` and build them in
+    `_attach()`. Pickling only sends the block's name, so a child process attaches
+    to the same memory instead of receiving a copy.
+    """
+
+    _VIEWS = ()
+
+    def _create(self, size: int):
+        self._owner = True
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._attach()
+
+    @abc.abstractmethod
+    def _attach(self):
+        """Build the numpy views listed in `_VIEWS` over `self._shm.buf`."""
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._VIEWS:
+            state.pop(name, None)
+        state["_shm"] = self._shm.name
+        state["_owner"] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(name=state["_shm"])
+        self._attach()
+
+    def close(self):
+        """Detach from the shared block. The creating process also unlinks it."""
+        if self._shm is None:
+            return
+        # Views must be released before the mapping can be closed
+        for name in self._VIEWS:
+            setattr(self, name, None)
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+
+class SharedAudioRing(_SharedBlock):
+    """
+    Single-producer/single-consumer ring buffer of int16 audio frames backed by
+    shared memory.
+
+    It mirrors the subset of the `mp.Queue` API used by the pipeline (`put`, `get`,
+    `empty`, `qsize`) so it can replace the raw audio queue between `WebSocketIO`
+    (producer) and `AudioProcessor` (consumer). Frames are copied into preallocated
+    slots instead of being pickled through a pipe, and a counting semaphore wakes
+    the consumer up as soon as a frame is available.
+
+    Layout of the shared block:
+        counters: uint64[3]  -> [frames written, frames read, frames dropped]
+        lengths:  int32[capacity]  -> number of valid samples in each slot
+        frames:   int16[capacity, frame_size]
+
+    NOTE: Only one process may `put` and only one process may `get`. The writer
+    only advances the write counter and the reader only advances the read counter.
+    The semaphore orders the slot write before the matching read.
+
+    NOTE: Like on a queue, `put(None)` wakes the consumer up with a `None`
+    (shutdown sentinel) once the frames before it are read.
+    """
+
+    _VIEWS = ("_counters", "_lengths", "_frames")
+
+    def __init__(self, capacity: int, frame_size: int):
+        if capacity < 1 or frame_size < 1:
+            raise ValueError("🚨 'capacity' and 'frame_size' must be positive.")
+
+        self._capacity = capacity
+        self._frame_size = frame_size
+        self._items = mp.Semaphore(0)
+        self._create(3 * 8 + capacity * 4 + capacity * frame_size * 2)
+        self._counters[:] = 0
+
+    def _attach(self):
+        """Create numpy views over the shared block."""
+        buf = self._shm.buf
+        lengths_off = 3 * 8
+        frames_off = lengths_off + self._capacity * 4
+        self._counters = np.ndarray((3,), dtype=np.uint64, buffer=buf)
+        self._lengths = np.ndarray(
+            (self._capacity,), dtype=np.int32, buffer=buf, offset=lengths_off
+        )
+        self._frames = np.ndarray(
+            (self._capacity, self._frame_size),
+            dtype=np.int16,
+            buffer=buf,
+            offset=frames_off,
+        )
+
+    def put(self, audio: np.ndarray):
+        """
+        Copy an int16 audio array into the ring.
+        Audio longer than one slot is split across consecutive slots. When the
+        ring is full, the frame is dropped and counted instead of blocking the
+        producer (the WebSocket event loop).
+        """
+        if audio is None:
+            # Shutdown sentinel: a wakeup without a frame
+            self._items.release()
+            return
+        audio = np.asarray(audio, dtype=np.int16)
+        for start in range(0, len(audio), self._frame_size):
+            self._put_frame(audio[start : start + self._frame_size])
+
+    def _put_frame(self, frame: np.ndarray):
+        written = int(self._counters[0])
+        if written - int(self._counters[1]) >= self._capacity:
+            self._counters[2] += 1
+            return
+
+        slot = written % self._capacity
+        self._frames[slot, : len(frame)] = frame
+        self._lengths[slot] = len(frame)
+        self._counters[0] = written + 1
+        self._items.release()
+
+    def get(self, block: bool = True, timeout: float = None) -> np.ndarray:
+        """
+        Return the oldest frame in the ring as a new array, or None for a
+        shutdown sentinel.
+        Raises `queue.Empty` if no frame is available within `timeout`.
+        """
+        if not self._items.acquire(block, timeout):
+            raise queue.Empty
+
+        read = int(self._counters[1])
+        if read == int(self._counters[0]):
+            return None  # Only the sentinel wakes the reader without a frame
+        slot = read % self._capacity
+        # Copy out since the slot is handed back to the producer below
+        frame = self._frames[slot, : self._lengths[slot]].copy()
+        self._counters[1] = read + 1
+        return frame
+
+    def get_nowait(self) -> np.ndarray:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        """Approximate number of frames waiting in the ring."""
+        return int(self._counters[0]) - int(self._counters[1])
+
+    def empty(self) -> bool:
+        return self.qsize() <= 0
+
+    @property
+    def dropped(self) -> int:
+        """Number of frames dropped because the ring was full."""
+        return int(self._counters[2])
+
+
+class SegmentArena(_SharedBlock):
+    """
+    Preallocated shared-memory arena of float32 speech segments.
+
+    The producer (`AudioProcessor`) copies a segment into a free slot and sends only
+    a small `SegmentRef` through the processed queue. The consumer (`Transcriber`)
+    wraps the slot as a read-only numpy view, and releases the slot once done with it.
+
+    Layout of the shared block:
+        seqs:  int64[slots]  -> sequence id of the segment held by a slot, -1 if free
+        audio: float32[slots, slot_size]
+
+    NOTE: A slot is only written by the producer while free, and only released by
+    the consumer holding its `SegmentRef`. The sequence id guards against reading
+    a slot that was released and reused.
+    """
+
+    _VIEWS = ("_seqs", "_audio")
+
+    def __init__(self, slots: int, slot_size: int):
+        if slots < 1 or slot_size < 1:
+            raise ValueError("🚨 'slots' and 'slot_size' must be positive.")
+
+        self._slots = slots
+        self._slot_size = slot_size
+        self._next_seq = 0
+        self._next_slot = 0
+        self._create(slots * 8 + slots * slot_size * 4)
+        self._seqs[:] = -1
+
+    def _attach(self):
+        """Create numpy views over the shared block."""
+        buf = self._shm.buf
+        self._seqs = np.ndarray((self._slots,), dtype=np.int64, buffer=buf)
+        self._audio = np.ndarray(
+            (self._slots, self._slot_size),
+            dtype=np.float32,
+            buffer=buf,
+            offset=self._slots * 8,
+        )
+
+    def write(self, chunks) -> SegmentRef | None:
+        """
+        Copy a segment made of consecutive float32 `chunks` into a free slot.
+        Returns None if the segment does not fit in a slot or all slots are busy,
+        in which case the caller should send the audio by value instead.
+        """
+        length = sum(len(chunk) for chunk in chunks)
+        if length > self._slot_size:
+            return None
+
+        for i in range(self._slots):
+            slot = (self._next_slot + i) % self._slots
+            if self._seqs[slot] == -1:
+                break
+        else:
+            return None
+
+        # Concatenate straight into shared memory, no intermediate array
+        np.concatenate(chunks, out=self._audio[slot, :length])
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._next_slot = (slot + 1) % self._slots
+        self._seqs[slot] = seq
+        return SegmentRef(slot * self._slot_size, length, seq)
+
+    def view(self, ref: SegmentRef) -> np.ndarray:
+        """Return a read-only, zero-copy view of the segment described by `ref`."""
+        slot, start = divmod(ref.offset, self._slot_size)
+        if self._seqs[slot] != ref.seq:
+            raise ValueError(f"🚨 Stale segment reference: {ref}")
+        audio = self._audio[slot, start : start + ref.length]
+        audio.flags.writeable = False
+        return audio
+
+    def release(self, ref: SegmentRef):
+        """Hand the slot holding `ref` back to the producer."""
+        slot = ref.offset // self._slot_size
+        if self._seqs[slot] == ref.seq:
+            self._seqs[slot] = -1
+
+    def in_use(self) -> int:
+        """Number of slots currently holding a segment."""
+        return int(np.count_nonzero(self._seqs != -1))
@@ -1,7 +1,7 @@
 # audio/_vad.py
 
-import torch
 import numpy as np
+from ._vad_backends import VAD_BACKENDS
 from ..server.config import Config
 
 
@@ -10,12 +10,24 @@ class VoiceActivityDetector:
     Wrapper for Silero VAD model.
     """
 
-    def __init__(self, cfg: Config):
+    # Pre-gate settings (see _pregate())
+    _PREGATE_MIN_RMS = 1e-3  # ~ -60 dBFS, digital silence
+    _PREGATE_NOISE_MARGIN = 2.0  # Gate chunks below margin * noise floor RMS
+    _PREGATE_ZCR_DELTA = 0.1  # ZCR change vs. the noise that may be speech
+    _PREGATE_NOISE_ALPHA = 0.05  # Noise floor EMA factor
+    _PREGATE_HANGOVER = 10  # Chunks never gated after speech (400 ms)
+
+    def __init__(self, cfg: Config, model=None):
         """
-        Initialize Silero VAD model.
+        Initialize Silero VAD model with the backend selected in the config
+        ('torch' or 'onnx', see `_vad_backends.py`).
         Silero VAD only supports:
         256 chunks at 8000 sample rate or 512 chunks for 16000
 
+        `model` is a backend from `load_model()` shared with other detectors
+        (e.g. one per client session). Each detector still keeps its own stream
+        state, see `_score()`.
+
         NOTE: Model is intentionally only loaded on CPU since model inference is still
         very fast on CPU and it might not be a good idea to move audio for to GPU for
         inference on very short audio segments.
@@ -24,33 +36,185 @@ class VoiceActivityDetector:
         https://github.com/snakers4/silero-vad#live-demonstration
         """
         self._cfg = cfg
-        self._model, _ = torch.hub.load(
-            repo_or_dir="snakers4/silero-vad", model="silero_vad", trust_repo=True
-        )
+        self._model = model if model is not None else self.load_model(cfg)
+        self._state = None  # Model state of this stream, None for a new stream
 
         self._aggressiveness = self._cfg.VAD_AGGRESSIVENESS / 10
 
+        # Streaming mode state (see is_speech())
+        self._streaming = self._cfg.VAD_STREAMING
+        self._frame_size = 512 if self._cfg.SAMPLE_RATE == 16000 else 256
+        self._residual = np.empty(0, dtype=np.float32)
+        self._last_decision = False
+
+        # Pre-gate state and stats
+        self._pregate_enabled = self._cfg.VAD_PREGATE
+        self._noise_rms = self._PREGATE_MIN_RMS
+        self._noise_zcr = None
+        self._hangover = 0
+        self.model_calls = 0  # Chunks scored by the model
+        self.gated = 0  # Chunks declared silent by the pre-gate alone
+
+    def reset(self):
+        """
+        Start a new stream: drop carried-over samples and reset the model's
+        recurrent state so the previous stream does not leak into the next one.
+        """
+        self._residual = np.empty(0, dtype=np.float32)
+        self._last_decision = False
+        self._hangover = 0
+        self._state = None
+
+    @staticmethod
+    def load_model(cfg: Config):
+        """Load the VAD model of the backend selected in the config."""
+        return VAD_BACKENDS[cfg.VAD_BACKEND](cfg.SAMPLE_RATE, cfg.VAD_MODEL_PATH)
+
+    def _score(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Score frames with the model, continuing this detector's stream. The model
+        may be shared, so the stream's state is swapped in before the call and
+        saved after it.
+        """
+        if self._state is None:
+            self._model.reset_states()
+        else:
+            self._model.set_state(self._state)
+        probs = self._model(frames)
+        self._state = self._model.get_state()
+        return probs
+
+    def warmup(self, audio: np.ndarray):
+        """
+        Score audio with the model frame by frame, then reset its state, so the
+        first real chunk doesn't pay for the runtime's lazy initialization. The
+        stream, pre-gate and stats are not affected.
+        """
+        size = self._frame_size
+        for i in range(0, len(audio) - size + 1, size):
+            self._model(audio[i : i + size][np.newaxis])
+        self._model.reset_states()
+
     def is_speech(self, audio: np.ndarray):
         """
         Run VAD on an audio segment and determine if it contains speech.
+
+        In streaming mode, audio is treated as the continuation of the previous
+        call: samples that don't fill a whole VAD frame are carried over to the next
+        call, so every sample goes through the model exactly once and in order.
+
+        With the pre-gate enabled, obvious silence is detected from the chunk's
+        energy and zero-crossing rate without calling the model.
         """
         # validate audio segment type float32
         if audio.dtype != np.float32:
             raise ValueError("🚨 Audio segment must be of type float32")
 
+        if self._pregate_enabled:
+            rms, zcr = self._features(audio)
+            if self._pregate(rms, zcr):
+                self.gated += 1
+                self._update_noise(rms, zcr)
+                # The model doesn't see this audio, so the stream restarts after it
+                if self._streaming:
+                    self._residual = self._residual[:0]
+                    self._state = None
+                self._last_decision = False
+                return False
+
+        self.model_calls += 1
+        result = self._run_model(audio)
+
+        if self._pregate_enabled:
+            if result:
+                self._hangover = self._PREGATE_HANGOVER
+            else:
+                self._update_noise(rms, zcr)
+        return result
+
+    def _run_model(self, audio: np.ndarray):
+        """Score audio with the Silero model."""
+        if self._streaming:
+            return self._is_speech_streaming(audio)
+
         chunks = self._slice_audio(audio)
 
-        with torch.inference_mode():
-            for chunk in chunks:
-                tensor_chunk = torch.tensor(chunk, dtype=torch.float32)
-                conf = self._model(tensor_chunk, self._cfg.SAMPLE_RATE).item()
-                # If any chunk has a confidence above the threshold,
-                # consider the whole audio as speech
-                if conf > self._aggressiveness:
-                    return True
+        for chunk in chunks:
+            conf = self._score(chunk[np.newaxis])[0]
+            # If any chunk has a confidence above the threshold,
+            # consider the whole audio as speech
+            if conf > self._aggressiveness:
+                return True
 
         return False
 
+    def _is_speech_streaming(self, audio: np.ndarray):
+        """Streaming mode of is_speech()."""
+        frames = self._stream_frames(audio)
+        # Not enough audio for a single frame yet: keep the previous decision
+        if len(frames) == 0:
+            return self._last_decision
+
+        # Every frame must go through the model to keep its state consistent,
+        # so there is no early exit on the first speech frame
+        decision = bool((self._score(frames) > self._aggressiveness).any())
+
+        self._last_decision = decision
+        return decision
+
+    @staticmethod
+    def _features(audio: np.ndarray):
+        """Return the RMS energy and zero-crossing rate of an audio chunk."""
+        if len(audio) < 2:
+            return 0.0, 0.0
+        rms = float(np.sqrt(np.dot(audio, audio) / len(audio)))
+        signs = np.signbit(audio)
+        zcr = np.count_nonzero(signs[1:] != signs[:-1]) / (len(audio) - 1)
+        return rms, zcr
+
+    def _pregate(self, rms: float, zcr: float) -> bool:
+        """
+        Return True if a chunk is obviously silent and the model can be skipped.
+
+        A chunk is gated when it is digital silence, or when its energy is close to
+        the adaptive noise floor and its zero-crossing rate is close to the noise's
+        (a ZCR change at low energy may be an unvoiced speech onset, e.g. "s").
+        Chunks right after speech are never gated, so soft speech endings still
+        go through the model.
+        """
+        if self._hangover > 0:
+            self._hangover -= 1
+            return False
+        if rms < self._PREGATE_MIN_RMS:
+            return True
+        return (
+            self._noise_zcr is not None
+            and rms < self._PREGATE_NOISE_MARGIN * self._noise_rms
+            and abs(zcr - self._noise_zcr) < self._PREGATE_ZCR_DELTA
+        )
+
+    def _update_noise(self, rms: float, zcr: float):
+        """Track the noise floor (RMS and ZCR) over silent chunks."""
+        alpha = self._PREGATE_NOISE_ALPHA
+        self._noise_rms = max(
+            self._PREGATE_MIN_RMS, (1 - alpha) * self._noise_rms + alpha * rms
+        )
+        if self._noise_zcr is None:
+            self._noise_zcr = zcr
+        else:
+            self._noise_zcr = (1 - alpha) * self._noise_zcr + alpha * zcr
+
+    def _stream_frames(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Prepend the samples carried over from the previous call and split into
+        whole VAD frames. The remainder is carried over to the next call.
+        """
+        if len(self._residual):
+            audio = np.concatenate((self._residual, audio))
+        usable = len(audio) - len(audio) % self._frame_size
+        self._residual = audio[usable:].copy()
+        return audio[:usable].reshape(-1, self._frame_size)
+
     def _slice_audio(self, audio: np.ndarray, vad_frame_size: int = 512):
         """
         Break audio into valid chunks for VAD processing due to Sileros restrictions.
@@ -0,0 +1,155 @@
+# _audio/_vad_backends.py
+
+import os
+import numpy as np
+
+
+class TorchVADBackend:
+    """
+    Silero VAD through PyTorch.
+
+    By default the model is loaded with `torch.hub` (needs network or a warm hub
+    cache). `model_path` can point to a local TorchScript file (e.g.
+    `silero_vad.jit`) or to a local clone of the silero-vad repository.
+    """
+
+    def __init__(self, sample_rate: int, model_path: str = None):
+        # Imported here so that other backends don't pull torch into the process
+        import torch
+
+        self._torch = torch
+        self._sample_rate = sample_rate
+        if model_path is None:
+            self._model, _ = torch.hub.load(
+                repo_or_dir="snakers4/silero-vad", model="silero_vad", trust_repo=True
+            )
+        elif os.path.isdir(model_path):
+            self._model, _ = torch.hub.load(
+                repo_or_dir=model_path, model="silero_vad", source="local"
+            )
+        else:
+            self._model = torch.jit.load(model_path, map_location="cpu")
+            self._model.eval()
+
+    def __call__(self, frames: np.ndarray) -> np.ndarray:
+        """Score consecutive frames of shape (n, frame_size), in order."""
+        probs = np.empty(len(frames), dtype=np.float32)
+        with self._torch.inference_mode():
+            for i, frame in enumerate(frames):
+                tensor = self._torch.from_numpy(np.ascontiguousarray(frame))
+                probs[i] = self._model(tensor, self._sample_rate).item()
+        return probs
+
+    # Stream state of the Silero model (as in silero-vad's `reset_states()`)
+    _STATE = ("_state", "_context", "_last_sr", "_last_batch_size")
+
+    def reset_states(self):
+        self._model.reset_states()
+
+    def get_state(self):
+        return {name: getattr(self._model, name) for name in self._STATE}
+
+    def set_state(self, state):
+        for name, value in state.items():
+            setattr(self._model, name, value)
+
+
+class OnnxVADBackend:
+    """
+    Silero VAD (v5) through ONNX Runtime, without torch.
+
+    `model_path` is either:
+        - A directory holding `silero_encoder_v5.onnx` and
+        `silero_decoder_v5.onnx`. By default, the copies bundled with
+        faster-whisper are used, so no download is needed.
+        - A single `silero_vad.onnx` file as released by silero-vad.
+
+    Like the torch model, the backend keeps the recurrent state and the audio
+    context (last samples of the previous frame) between calls.
+    `get_state()`/`set_state()` swap them to share one backend between streams.
+    """
+
+    ENCODER_FILE = "silero_encoder_v5.onnx"
+    DECODER_FILE = "silero_decoder_v5.onnx"
+
+    def __init__(self, sample_rate: int, model_path: str = None):
+        import onnxruntime
+
+        if model_path is None:
+            from faster_whisper.utils import get_assets_path
+
+            model_path = get_assets_path()
+
+        self._sample_rate = sample_rate
+        self._context_size = 64 if sample_rate == 16000 else 32
+
+        # The model is tiny and called on 32 ms frames: one thread is the fastest
+        opts = onnxruntime.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        opts.log_severity_level = 4
+
+        def session(path):
+            return onnxruntime.InferenceSession(
+                path, providers=["CPUExecutionProvider"], sess_options=opts
+            )
+
+        if os.path.isdir(model_path):
+            self._encoder = session(os.path.join(model_path, self.ENCODER_FILE))
+            self._decoder = session(os.path.join(model_path, self.DECODER_FILE))
+            self._model = None
+        else:
+            self._encoder = self._decoder = None
+            self._model = session(model_path)
+        self.reset_states()
+
+    def __call__(self, frames: np.ndarray) -> np.ndarray:
+        """Score consecutive frames of shape (n, frame_size), in order."""
+        frames = np.asarray(frames, dtype=np.float32)
+        # Prepend to each frame the tail of the frame before it
+        context = np.empty((len(frames), self._context_size), dtype=np.float32)
+        context[0] = self._context
+        context[1:] = frames[:-1, -self._context_size :]
+        inputs = np.concatenate((context, frames), axis=1)
+        self._context = frames[-1, -self._context_size :].copy()
+
+        if self._model is not None:
+            return self._run_single(inputs)
+
+        # The encoder is stateless, so all frames go through it in one call.
+        # Only the small decoder runs frame by frame to carry the state.
+        encoded = self._encoder.run(None, {"input": inputs})[0].squeeze(-1)
+        probs = np.empty(len(frames), dtype=np.float32)
+        for i in range(len(frames)):
+            out, self._state = self._decoder.run(
+                None, {"input": encoded[i : i + 1], "state": self._state}
+            )
+            probs[i] = out.item()
+        return probs
+
+    def _run_single(self, inputs: np.ndarray) -> np.ndarray:
+        """Run the single-file silero model frame by frame."""
+        sr = np.array(self._sample_rate, dtype=np.int64)
+        probs = np.empty(len(inputs), dtype=np.float32)
+        for i in range(len(inputs)):
+            out, self._state = self._model.run(
+                None, {"input": inputs[i : i + 1], "state": self._state, "sr": sr}
+            )
+            probs[i] = out.item()
+        return probs
+
+    def reset_states(self):
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros(self._context_size, dtype=np.float32)
+
+    def get_state(self):
+        return self._state, self._context
+
+    def set_state(self, state):
+        self._state, self._context = state
+
+
+VAD_BACKENDS = {
+    "torch": TorchVADBackend,
+    "onnx": OnnxVADBackend,
+}
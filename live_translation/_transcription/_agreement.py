@@ -0,0 +1,93 @@
+# transcription/_agreement.py
+
+import re
+from collections import namedtuple
+
+# A transcribed word with absolute start/end times in seconds.
+# NOTE: Whisper words keep their leading space, so joining them gives the text.
+Word = namedtuple("Word", ["start", "end", "text"])
+
+
+class LocalAgreement:
+    """
+    LocalAgreement-2 policy for streaming transcription.
+
+    The growing audio buffer is transcribed again after every new chunk. A word is
+    committed (considered stable) once two consecutive hypotheses agree on it, i.e.
+    it is in the common prefix of both. The rest of the latest hypothesis is the
+    unstable tail, which may still change.
+
+    See:
+    https://github.com/ufal/whisper_streaming
+    """
+
+    # Words starting this close before the last committed word's end may be a
+    # re-transcription of it, see update()
+    _TIME_TOLERANCE = 0.1  # seconds
+    _MAX_OVERLAP = 5  # words
+
+    def __init__(self):
+        self._committed = []  # Committed words of the current utterance
+        self._hypothesis = []  # Uncommitted words of the latest hypothesis
+
+    @property
+    def committed_end(self) -> float:
+        """End time of the last committed word, 0 if nothing is committed."""
+        return self._committed[-1].end if self._committed else 0.0
+
+    def committed_before(self, time: float) -> list:
+        """Committed words that end before `time`."""
+        return [w for w in self._committed if w.end <= time]
+
+    def update(self, words: list) -> tuple[list, list]:
+        """
+        Add a new hypothesis for the buffer.
+        Returns the newly committed words and the unstable tail.
+        """
+        # Only words after the committed part are candidates
+        words = [
+            w for w in words if w.start > self.committed_end - self._TIME_TOLERANCE
+        ]
+        words = self._drop_overlap(words)
+
+        committed = []
+        for new, old in zip(words, self._hypothesis):
+            if self._normalize(new.text) != self._normalize(old.text):
+                break
+            committed.append(new)
+
+        self._committed.extend(committed)
+        self._hypothesis = words[len(committed) :]
+        return committed, list(self._hypothesis)
+
+    def complete(self) -> list:
+        """
+        End of the utterance: commit the latest hypothesis as is and start over.
+        Returns the newly committed words.
+        """
+        committed = self._hypothesis
+        self._committed = []
+        self._hypothesis = []
+        return committed
+
+    def _drop_overlap(self, words: list) -> list:
+        """
+        Drop leading words that repeat the last committed words. Words cut at the
+        buffer's start can be transcribed again with slightly shifted timestamps.
+        """
+        if not words or not self._committed:
+            return words
+        if abs(words[0].start - self.committed_end) >= 1:
+            return words
+
+        for n in range(min(self._MAX_OVERLAP, len(words), len(self._committed)), 0, -1):
+            tail = [self._normalize(w.text) for w in self._committed[-n:]]
+            head = [self._normalize(w.text) for w in words[:n]]
+            if tail == head:
+                return words[n:]
+        return words
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Compare words regardless of case and punctuation."""
+        return re.sub(r"[^\w']", "", text.lower())
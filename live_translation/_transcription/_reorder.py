@@ -0,0 +1,39 @@
+# transcription/_reorder.py
+
+
+class SequenceReorderer:
+    """
+    Restore the order of items produced by parallel transcriber workers.
+
+    Every segment taken from the processed audio queue gets a sequence number and
+    produces exactly one item (possibly an empty placeholder), so items can be
+    released strictly in sequence order. If more than `max_pending` items are
+    waiting on a missing one (e.g. a worker died), the gap is skipped instead of
+    stalling the output forever.
+    """
+
+    def __init__(self, max_pending: int = 64):
+        self._next = 0
+        self._pending = {}
+        self._max_pending = max_pending
+
+    def push(self, seq: int, item) -> list:
+        """Add an item and return the items that are now ready, in order."""
+        if seq < self._next:
+            return []  # Late item after its gap was skipped
+        self._pending[seq] = item
+
+        if len(self._pending) > self._max_pending:
+            missing = self._next
+            self._next = min(self._pending)
+            print(f"🚨 Reorder: Skipping missing items {missing}-{self._next - 1}")
+
+        ready = []
+        while self._next in self._pending:
+            ready.append(self._pending.pop(self._next))
+            self._next += 1
+        return ready
+
+    def __len__(self):
+        """Number of items waiting for an earlier one."""
+        return len(self._pending)
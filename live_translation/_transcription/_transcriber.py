@@ -1,13 +1,19 @@
 # transcription/_transcriber.py
 
 from datetime import datetime, timezone
-import queue
+import os
+import time
 import multiprocessing as mp
-import torch
 import threading
 import numpy as np
 from faster_whisper import WhisperModel
+from ._agreement import LocalAgreement, Word
+from .._audio._buffer import AudioRingBuffer
+from .._audio._shm import SegmentArena, SegmentRef
 from ..server import config
+from ..server._trace import stamp
+from ..server._metrics import PipelineStats
+from ..server._startup import report_ready, warmup_audio
 
 
 class Transcriber(mp.Process):
@@ -15,8 +21,33 @@ class Transcriber(mp.Process):
     Transcriber retrieves audio segments from an audio queue,
     transcribes them using a Whisper model, and pushes the resulting text into
     a transcription queue.
+
+    In 'incremental' transcription mode, segments only hold new audio and are
+    accumulated in the Transcriber's own buffer. Stable words are committed with
+    `LocalAgreement` and only newly committed text is pushed, together with the
+    unstable tail. An empty segment marks the end of an utterance.
+
+    Several Transcriber workers can consume the same queue. Each segment gets a
+    sequence number when it is dequeued, and every item pushed carries it (`seq`)
+    so that the next stage can restore the order with `SequenceReorderer`. With
+    more than one worker, empty or failed segments still push an item with an
+    empty transcription, so the sequence has no gaps.
+
+    With more than one session, segments arrive as `(session_id, segment)` and
+    every item pushed carries the `session` id, so the output can be routed back
+    to its client.
+
+    With tracing, segments arrive as `(session_id, segment, trace)` and every
+    item pushed carries the `trace`, stamped with the transcription start and
+    end times.
+
+    Workers block on the processed queue until a segment arrives, and stop on a
+    `None` item (one per worker is put by `PipelineManager` on shutdown).
     """
 
+    # Max committed text passed to Whisper as context in incremental mode
+    PROMPT_CHARS = 200
+
     def __init__(
         self,
         processed_audio_queue: mp.Queue,
@@ -24,8 +55,19 @@ class Transcriber(mp.Process):
         stop_event: threading.Event,
         cfg: config.Config,
         output_queue: mp.Queue,
+        arena: SegmentArena = None,
+        worker_id: int = 0,
+        seq_counter=None,
+        stats: PipelineStats = None,
+        ready_queue: mp.Queue = None,
     ):
-        """Initialize the Transcriber."""
+        """
+        Initialize the Transcriber.
+        `seq_counter` is a shared `mp.Value` numbering segments across workers.
+        `stats` collects the real-time factor of transcriptions for metrics.
+        `ready_queue` is told once the model is loaded and warmed up (see
+        `StartupMonitor`).
+        """
 
         super().__init__()
         self._audio_queue = processed_audio_queue
@@ -33,46 +75,92 @@ class Transcriber(mp.Process):
         self._stop_event = stop_event
         self._cfg = cfg
         self._output_queue = output_queue
+        self._arena = arena
+        self._worker_id = worker_id
+        self._stats = stats
+        self._ready_queue = ready_queue
+        self._seq_counter = seq_counter if seq_counter is not None else mp.Value("q", 0)
+        self._placeholders = self._cfg.TRANSCRIBER_WORKERS > 1
+        self._multi_session = self._cfg.MAX_SESSIONS > 1
+        self._incremental = self._cfg.TRANSCRIPTION_MODE == "incremental"
+        # Incremental mode state, allocated in the child process, see run()
+        self._stream = None
+        self._stream_offset = 0.0  # Utterance time of the stream's first sample
+        self._agreement = None
 
     def run(self):
         """Load the Whisper model and transcribe audio segments."""
 
         self._stop_event = self._stop_event
+        started = time.monotonic()
         try:
-            print("🔄 Transcriber: Loading Whisper model...")
-            self.whisper_model = WhisperModel(
-                self._cfg.WHISPER_MODEL, compute_type="float32", device=self._cfg.DEVICE
+            self.load_model()
+            if self._incremental:
+                self._stream = AudioRingBuffer(
+                    2 * self._cfg.MAX_BUFFER_DURATION * self._cfg.SAMPLE_RATE
+                )
+                self._agreement = LocalAgreement()
+            warmup = self._warmup() if self._cfg.WARMUP else None
+            report_ready(
+                self._ready_queue, f"transcriber_{self._worker_id}", started, warmup
             )
-            print("📝 Transcriber: Ready to transcribe audio...")
+            print(f"📝 Transcriber {self._worker_id}: Ready to transcribe audio...")
 
             while not (self._stop_event.is_set() and self._audio_queue.empty()):
-                # Get audio segment from the queue
-                try:
-                    audio_segment = self._audio_queue.get(timeout=0.5)
-                except queue.Empty:
-                    continue
+                # Get audio segment from the queue. The lock makes sequence numbers
+                # follow the queue order across workers.
+                with self._seq_counter.get_lock():
+                    audio_segment = self._audio_queue.get()
+                    if audio_segment is None:
+                        break  # Shutdown sentinel
+                    seq = self._seq_counter.value
+                    self._seq_counter.value += 1
+
+                if self._cfg.TRACE:
+                    sid, audio_segment, trace = audio_segment
+                elif self._multi_session:
+                    sid, audio_segment = audio_segment
+                    trace = None
+                else:
+                    sid, trace = None, None
+                stamp(trace, "transcribe_start")
 
+                # Segments handed off through the shared-memory arena arrive as
+                # descriptors and are read in place
+                segment_ref = (
+                    audio_segment if isinstance(audio_segment, SegmentRef) else None
+                )
+
+                transcription, unstable = "", None
                 try:
-                    # Normalize and transcribe the audio segment
-                    audio_segment = audio_segment.astype(np.float32)
-                    with torch.inference_mode():
-                        segments, _ = self.whisper_model.transcribe(
-                            audio_segment, language=self._cfg.SRC_LANG
+                    if segment_ref is not None:
+                        audio_segment = self._arena.view(segment_ref)
+                    # No copy if the segment is already float32
+                    audio_segment = np.asarray(audio_segment, dtype=np.float32)
+                    started = time.monotonic()
+                    if self._incremental:
+                        transcription, unstable = self._transcribe_incremental(
+                            audio_segment
+                        )
+                    else:
+                        transcription = self._transcribe_window(audio_segment)
+                    if self._stats is not None and len(audio_segment):
+                        self._stats.record_transcription(
+                            len(audio_segment) / self._cfg.SAMPLE_RATE,
+                            time.monotonic() - started,
                         )
-
-                    transcription = " ".join(seg.text for seg in segments)
-                    if transcription.strip():
-                        if self._cfg.TRANSCRIBE_ONLY:
-                            entry = {
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                                "transcription": transcription,
-                                "translation": "",
-                            }
-                            self._output_queue.put(entry)
-                        else:
-                            self._transcription_queue.put(transcription)
                 except Exception as e:
                     print(f"🚨 Transcriber Error: {e}")
+                finally:
+                    # Segments are fully decoded by now; hand the slot back
+                    if segment_ref is not None:
+                        self._arena.release(segment_ref)
+                stamp(trace, "transcribe_end")
+
+                # In incremental mode, updates that only change the unstable
+                # tail (e.g. the first hypothesis of an utterance) are pushed too
+                if transcription.strip() or unstable or self._placeholders:
+                    self._push(seq, transcription, unstable, sid, trace)
         except Exception as e:
             print(f"🚨 Critical Transcriber Error: {e}")
         except KeyboardInterrupt:
@@ -81,6 +169,156 @@ class Transcriber(mp.Process):
             self._cleanup()
             print("📝 Transcriber: Stopped.")
 
+    def load_model(self):
+        """
+        Load the Whisper model as `whisper_model`. Called by run() in the worker
+        process, and by `FileTranslator` to transcribe files without a pipeline.
+        """
+        print("🔄 Transcriber: Loading Whisper model...")
+        self.whisper_model = WhisperModel(
+            self._cfg.WHISPER_MODEL,
+            device=self._cfg.DEVICE,
+            compute_type=self._cfg.COMPUTE_TYPE,
+            cpu_threads=self._cpu_threads(),
+            num_workers=self._cfg.NUM_WORKERS,
+        )
+        self._report_settings()
+
+    def _warmup(self) -> float:
+        """
+        Transcribe a synthetic utterance so the first real segment doesn't pay
+        for lazy allocations and thread pool spin-up. Word timestamps are used
+        in incremental mode like real segments. Returns the duration (s).
+        """
+        started = time.monotonic()
+        segments, _ = self.whisper_model.transcribe(
+            warmup_audio(self._cfg.SAMPLE_RATE),
+            language=self._cfg.SRC_LANG,
+            word_timestamps=self._incremental,
+        )
+        for _ in segments:  # Segments are decoded lazily
+            pass
+        return time.monotonic() - started
+
+    def _push(
+        self,
+        seq: int,
+        transcription: str,
+        unstable: str | None,
+        sid=None,
+        trace: dict = None,
+    ):
+        """Push a transcription to the output (transcribe only) or translation."""
+        if self._cfg.TRANSCRIBE_ONLY:
+            item = {
+                "seq": seq,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "transcription": transcription,
+                "translation": "",
+            }
+            queue_ = self._output_queue
+        else:
+            item = {"seq": seq, "transcription": transcription}
+            queue_ = self._transcription_queue
+        if unstable is not None:
+            item["unstable"] = unstable
+        if sid is not None:
+            item["session"] = sid
+        if trace is not None:
+            item["trace"] = trace
+        queue_.put(item)
+
+    def _cpu_threads(self) -> int:
+        """
+        Whisper threads for this worker. With several workers, the thread budget
+        (`cpu_threads`, or all cores if 0) is split between them so they don't
+        oversubscribe the CPU.
+        """
+        workers = self._cfg.TRANSCRIBER_WORKERS
+        if workers == 1:
+            return self._cfg.CPU_THREADS
+        budget = self._cfg.CPU_THREADS or os.cpu_count() or 1
+        return max(1, budget // workers)
+
+    def _report_settings(self):
+        """Print the effective Whisper inference settings."""
+        compute_type = getattr(
+            self.whisper_model.model, "compute_type", self._cfg.COMPUTE_TYPE
+        )
+        threads = self._cpu_threads() or "default"
+        print(
+            f"📝 Transcriber {self._worker_id}: Whisper '{self._cfg.WHISPER_MODEL}' on "
+            f"{self._cfg.DEVICE} (compute_type={compute_type}, "
+            f"cpu_threads={threads}, num_workers={self._cfg.NUM_WORKERS})"
+        )
+
+    def _transcribe_window(self, audio: np.ndarray) -> str:
+        """Transcribe a whole audio window."""
+        segments, _ = self.whisper_model.transcribe(audio, language=self._cfg.SRC_LANG)
+        return " ".join(seg.text for seg in segments)
+
+    def _transcribe_incremental(self, audio: np.ndarray) -> tuple[str, str]:
+        """
+        Add new audio to the stream and transcribe it.
+        Returns the newly committed text and the unstable tail.
+
+        ALGORITHM:
+        1. Append the new audio to the stream buffer.
+        2. Transcribe the whole buffer with word timestamps, using committed text
+        that is no longer in the buffer as the prompt.
+        3. Commit the words that agree with the previous hypothesis.
+        4. If the buffer exceeds `MAX_BUFFER_DURATION`, trim it up to the end of
+        the last committed word. Committed audio is never transcribed again.
+        On an empty segment (end of utterance), commit the latest hypothesis and
+        reset the stream.
+        """
+        sample_rate = self._cfg.SAMPLE_RATE
+
+        if len(audio) == 0:
+            committed = self._agreement.complete()
+            self._stream.clear()
+            self._stream_offset = 0.0
+            return self._join(committed), ""
+
+        # Make room if nothing could be committed for a long time
+        overflow = len(self._stream) + len(audio) - self._stream.capacity
+        if overflow > 0:
+            self._trim_stream(overflow)
+        self._stream.append(audio)
+
+        prompt = self._join(self._agreement.committed_before(self._stream_offset))
+        segments, _ = self.whisper_model.transcribe(
+            self._stream.view(),
+            language=self._cfg.SRC_LANG,
+            word_timestamps=True,
+            initial_prompt=prompt[-self.PROMPT_CHARS :] or None,
+            condition_on_previous_text=False,
+        )
+        words = [
+            Word(self._stream_offset + w.start, self._stream_offset + w.end, w.word)
+            for seg in segments
+            for w in seg.words or ()
+        ]
+        committed, unstable = self._agreement.update(words)
+
+        max_len = self._cfg.MAX_BUFFER_DURATION * sample_rate
+        if len(self._stream) > max_len:
+            cut = self._agreement.committed_end - self._stream_offset
+            if cut > 0:
+                self._trim_stream(int(cut * sample_rate))
+
+        return self._join(committed), self._join(unstable)
+
+    def _trim_stream(self, n: int):
+        """Drop the `n` oldest samples of the stream and move its offset."""
+        n = min(n, len(self._stream))
+        self._stream.trim(n)
+        self._stream_offset += n / self._cfg.SAMPLE_RATE
+
+    @staticmethod
+    def _join(words: list) -> str:
+        return "".join(w.text for w in words).strip()
+
     def _cleanup(self):
         """Clean up the Whisper model."""
         try:
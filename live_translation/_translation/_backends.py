@@ -0,0 +1,112 @@
+# translation/_backends.py
+
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING
+from ..server import config
+
+if TYPE_CHECKING:
+    from transformers import MarianTokenizer
+
+# Where Opus-MT models converted to CTranslate2 are cached
+CT2_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "live_translation", "ct2"
+)
+
+
+class TransformersBackend:
+    """Marian/Opus-MT through PyTorch `transformers` (float32)."""
+
+    def __init__(
+        self, model_name: str, tokenizer: "MarianTokenizer", cfg: config.Config
+    ):
+        # Imported here so that the pipeline's parent process (and the stages it
+        # forks) don't load torch and transformers
+        import torch
+        from transformers import MarianMTModel
+
+        self._torch = torch
+        self._tokenizer = tokenizer
+        self._device = cfg.DEVICE
+        self.model = MarianMTModel.from_pretrained(
+            model_name, torch_dtype=torch.float32
+        ).to(self._device)
+
+    def translate_batch(self, texts: list) -> list:
+        """Translate several texts with one padded `generate` call."""
+        inputs = self._tokenizer(texts, return_tensors="pt", padding=True).to(
+            self._device
+        )
+
+        with self._torch.inference_mode():
+            translated_tokens = self.model.generate(
+                **inputs,
+            )
+        return self._tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)
+
+
+class CTranslate2Backend:
+    """
+    Marian/Opus-MT through CTranslate2, e.g. with int8 quantization on CPU.
+
+    The Hugging Face model is converted to the CTranslate2 format once and cached
+    in `CT2_CACHE_DIR`. Weights are kept in float32 there and quantized to
+    `trans_compute_type` when loading, so one conversion serves every compute type.
+    """
+
+    def __init__(
+        self, model_name: str, tokenizer: "MarianTokenizer", cfg: config.Config
+    ):
+        import ctranslate2
+
+        self._tokenizer = tokenizer
+        self._translator = ctranslate2.Translator(
+            self.converted_model(model_name),
+            device=cfg.DEVICE,
+            compute_type=cfg.TRANS_COMPUTE_TYPE,
+        )
+
+    @staticmethod
+    def converted_model(model_name: str) -> str:
+        """Return the path of the converted model, converting it if needed."""
+        output_dir = os.path.join(CT2_CACHE_DIR, model_name.replace("/", "--"))
+        if os.path.isfile(os.path.join(output_dir, "model.bin")):
+            return output_dir
+
+        from ctranslate2.converters import TransformersConverter
+
+        print(f"🔄 Translator: Converting {model_name} to CTranslate2 (one time)...")
+        os.makedirs(CT2_CACHE_DIR, exist_ok=True)
+        # Convert next to the final location and move it in place once complete,
+        # so an interrupted conversion is never mistaken for a cached model
+        tmp_dir = tempfile.mkdtemp(dir=CT2_CACHE_DIR)
+        try:
+            TransformersConverter(model_name).convert(tmp_dir, force=True)
+            # Leftovers of an incomplete model would block the move
+            shutil.rmtree(output_dir, ignore_errors=True)
+            os.replace(tmp_dir, output_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return output_dir
+
+    def translate_batch(self, texts: list) -> list:
+        """Translate several texts with one `translate_batch` call."""
+        sources = [
+            self._tokenizer.convert_ids_to_tokens(self._tokenizer.encode(text))
+            for text in texts
+        ]
+        results = self._translator.translate_batch(sources)
+        return [
+            self._tokenizer.decode(
+                self._tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                skip_special_tokens=True,
+            )
+            for result in results
+        ]
+
+
+TRANSLATION_BACKENDS = {
+    "transformers": TransformersBackend,
+    "ctranslate2": CTranslate2Backend,
+}
@@ -0,0 +1,97 @@
+# translation/_cache.py
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+
+class TranslationCache:
+    """
+    Bounded LRU cache of translations keyed by (model name, normalized text).
+
+    Text is normalized by collapsing whitespace, so re-transcriptions that only
+    differ in spacing share an entry. With a `path`, the cache can be saved to and
+    loaded from a JSON file, so a restarted server starts warm.
+    """
+
+    def __init__(self, capacity: int, path: str = None):
+        self._capacity = capacity
+        self._path = path
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        # A string key (rather than a tuple) keeps the cache JSON-serializable
+        return f"{model}\n{' '.join(text.split())}"
+
+    def get(self, model: str, text: str) -> str | None:
+        """Return the cached translation of `text`, or None on a miss."""
+        key = self._key(model, text)
+        translation = self._entries.get(key)
+        if translation is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return translation
+
+    def put(self, model: str, text: str, translation: str):
+        """Cache a translation, evicting the least recently used one if full."""
+        if self._capacity <= 0:
+            return
+        key = self._key(model, text)
+        self._entries[key] = translation
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def load(self):
+        """Load entries saved by `save()`, if any."""
+        if not self._path or not os.path.isfile(self._path):
+            return
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"🚨 Translation cache: Could not load {self._path}: {e}")
+            return
+        self.update(entries)
+
+    def items(self) -> list:
+        """The `(key, translation)` entries, least recently used first."""
+        return list(self._entries.items())
+
+    def update(self, entries: list):
+        """
+        Add entries returned by `items()` (e.g. of another process's cache).
+        Given least recently used first, so the newest entries survive eviction.
+        """
+        for key, translation in entries:
+            model, _, text = key.partition("\n")
+            self.put(model, text, translation)
+
+    def save(self):
+        """
+        Save the entries to `path`. Written to a unique temporary file that
+        replaces it atomically, so concurrent saves never mix their files.
+        """
+        if not self._path:
+            return
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=f"{os.path.basename(self._path)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.items(), f, ensure_ascii=False)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
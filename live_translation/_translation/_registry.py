@@ -0,0 +1,29 @@
+# translation/_registry.py
+
+# Opus-MT language pairs (source, target) known to exist on Hugging Face, for
+# each translation model. Used to validate a language pair without a network
+# round-trip. NOT exhaustive: other pairs are validated from the local
+# Hugging Face cache, or online with `verify_model_online`.
+_ROUND_TRIP_EN = (
+    "af ar ca cs cy da de es et fi fr ga he hi hu id is it mt mul nl ro ru sk "
+    "sq sv tl uk ur vi xh zh"
+).split()
+
+OPUS_MT_PAIRS = {
+    "Helsinki-NLP/opus-mt": frozenset(
+        [("en", lang) for lang in _ROUND_TRIP_EN]
+        + [(lang, "en") for lang in _ROUND_TRIP_EN]
+        + [("en", "jap"), ("ja", "en"), ("ko", "en"), ("pl", "en"), ("tr", "en")]
+        + [("bg", "en"), ("de", "es"), ("es", "de"), ("de", "fr"), ("fr", "de")]
+        + [("es", "fr"), ("fr", "es")]
+    ),
+    "Helsinki-NLP/opus-mt-tc-big": frozenset(
+        [("en", "ar"), ("en", "fr"), ("en", "it"), ("en", "pt"), ("en", "tr")]
+        + [("ar", "en"), ("fr", "en"), ("he", "en"), ("tr", "en"), ("zh", "en")]
+    ),
+}
+
+
+def is_known_pair(trans_model: str, src_lang: str, tgt_lang: str) -> bool:
+    """Whether the registry lists the model for a language pair."""
+    return (src_lang, tgt_lang) in OPUS_MT_PAIRS.get(trans_model, ())
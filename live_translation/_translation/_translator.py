@@ -1,18 +1,44 @@
 # translation/_translator.py
 
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-import torch
+import re
+import time
 import queue
 import multiprocessing as mp
 import threading
-from transformers import MarianMTModel, MarianTokenizer
+from ._backends import TRANSLATION_BACKENDS
+from ._cache import TranslationCache
+from .._transcription._reorder import SequenceReorderer
 from ..server import config
+from ..server._metrics import PipelineStats
+from ..server._startup import WARMUP_SENTENCE, report_ready
+
+# Sentence boundaries: whitespace after ., ! or ?, or right after CJK punctuation
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])")
 
 
 class Translator(mp.Process):
     """
     Translator retrieves transcriptions from a queue, translates them using
     the M2M-100 model, and prints the translation.
+
+    Transcriptions are `{"seq", "transcription"[, "unstable"][, "session"]}`
+    items. With several transcriber workers, they are put back in order by `seq`
+    first.
+
+    With `translation_batch_size` > 1, queued transcriptions are translated in
+    micro-batches: after the first one arrives, up to B are collected or until
+    `translation_batch_timeout_ms` passes, and translated with one `generate` call.
+
+    Transcriptions are translated sentence by sentence. Each transcription is the
+    text of the whole rolling buffer, so sentences already in the previous
+    transcription of the same session reuse their translation and only new or
+    changed sentences are translated. Translations are also cached in a
+    `TranslationCache`. Cache hits skip the tokenizer and the model entirely.
+
+    With tracing, items carry a `trace` that is stamped with the translation
+    start and end times of their batch and passed on to the output.
     """
 
     def __init__(
@@ -21,46 +47,63 @@ class Translator(mp.Process):
         stop_event: threading.Event,
         cfg: config.Config,
         output_queue: mp.Queue,
+        stats: PipelineStats = None,
+        ready_queue: mp.Queue = None,
     ):
-        """Initialize the Translator."""
+        """
+        Initialize the Translator.
+        `stats` collects translation latencies and cache totals for metrics.
+        `ready_queue` is told once the model is loaded and warmed up (see
+        `StartupMonitor`).
+        """
         super().__init__()
         self._transcription_queue = transcription_queue
         self._stop_event = stop_event
         self._cfg = cfg
         self._output_queue = output_queue
+        self._stats = stats
+        self._ready_queue = ready_queue
+        self._reorderer = (
+            SequenceReorderer() if self._cfg.TRANSCRIBER_WORKERS > 1 else None
+        )
+        # Items received (and in order) but not translated yet
+        self._ready = deque()
+        # Set once the shutdown sentinel is received
+        self._ended = False
+        # Session id -> {sentence: translation} of its previous transcription,
+        # kept for the `MAX_SESSIONS` most recent sessions
+        self._previous = OrderedDict()
 
         self._model_name = (
             f"{self._cfg.TRANS_MODEL}-{self._cfg.SRC_LANG}-{self._cfg.TGT_LANG}"
         )
 
-        print(f"🔄 Translator: Loading {self._model_name} model...")
-        self._tokenizer = MarianTokenizer.from_pretrained(self._model_name)
+        self._cache = TranslationCache(
+            self._cfg.TRANS_CACHE_SIZE, self._cfg.TRANS_CACHE_PATH
+        )
+        # Loaded in the child process with the model, see load()
+        self._tokenizer = None
 
     def run(self):
+        started = time.monotonic()
         try:
-            self.model = MarianMTModel.from_pretrained(
-                self._model_name, torch_dtype=torch.float32
-            ).to(self._cfg.DEVICE)
-            print("🌍 Translator: Ready to translate text...")
-
-            while not (self._stop_event.is_set() and self._transcription_queue.empty()):
-                # Get transcription from the queue
-                try:
-                    text = self._transcription_queue.get(timeout=0.5)
-                except queue.Empty:
-                    continue
-
-                try:
-                    translation = self._translate(text)
-                    if not self._cfg.TRANSCRIBE_ONLY:
-                        entry = {
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "transcription": text,
-                            "translation": translation,
-                        }
-                        self._output_queue.put(entry)
-                except Exception as e:
-                    print(f"🚨 Translator Error: {e}")
+            self.load()
+            warmup = self._warmup() if self._cfg.WARMUP else None
+            report_ready(self._ready_queue, "translator", started, warmup)
+            print(
+                f"🌍 Translator: Ready to translate text ({self._cfg.TRANS_BACKEND})..."
+            )
+
+            while not (
+                (
+                    self._ended
+                    or (self._stop_event.is_set() and self._transcription_queue.empty())
+                )
+                and not self._ready
+            ):
+                batch = self._next_batch()
+                if batch:
+                    self._process_batch(batch)
         except Exception as e:
             print(f"🚨 Critical Translator Error: {e}")
         except KeyboardInterrupt:
@@ -69,21 +112,199 @@ class Translator(mp.Process):
             self._cleanup()
             print("🌍 Translator: Stopped.")
 
-    def _translate(self, text: str) -> str:
-        if not text.strip():
-            return ""
+    def load(self):
+        """
+        Load the tokenizer, translation cache and backend. Called by run() in the
+        translator process, and by `FileTranslator` to translate files without a
+        pipeline.
+        """
+        # Imported here so that the pipeline's parent process doesn't load it
+        from transformers import MarianTokenizer
+
+        print(f"🔄 Translator: Loading {self._model_name} model...")
+        self._tokenizer = MarianTokenizer.from_pretrained(self._model_name)
+        self._cache.load()
+        self._backend = TRANSLATION_BACKENDS[self._cfg.TRANS_BACKEND](
+            self._model_name, self._tokenizer, self._cfg
+        )
+
+    def _warmup(self) -> float:
+        """
+        Translate a fixed sentence with the backend, bypassing the cache, so the
+        first real transcription doesn't pay for the model's lazy
+        initialization. Returns the duration (s).
+        """
+        started = time.monotonic()
+        self._backend.translate_batch([WARMUP_SENTENCE])
+        return time.monotonic() - started
+
+    def translate_all(self, texts: list) -> list:
+        """
+        Translate independent texts (e.g. the segments of a recording) in
+        batches of `TRANSLATION_BATCH_SIZE`. Needs load() first.
+        """
+        size = self._cfg.TRANSLATION_BATCH_SIZE
+        translations = []
+        for i in range(0, len(texts), size):
+            translations.extend(self._translate_texts(texts[i : i + size]))
+        return translations
 
-        inputs = self._tokenizer(text, return_tensors="pt").to(self._cfg.DEVICE)
+    def cache_items(self) -> list:
+        """Cached translations, see `TranslationCache.items()`."""
+        return self._cache.items()
 
-        with torch.inference_mode():
-            translated_tokens = self.model.generate(
-                **inputs,
+    def save_cache(self):
+        """Save the translation cache and report its stats."""
+        try:
+            self._cache.save()
+        except Exception as e:
+            print(f"🚨 Translator Cleanup Error: {e}")
+        print(
+            f"🌍 Translator: Cache hits {self._cache.hits}, "
+            f"misses {self._cache.misses}."
+        )
+
+    def _next_batch(self) -> list:
+        """
+        Return the next transcription items to translate, in order.
+        Blocks until a first item arrives, then collects up to
+        `TRANSLATION_BATCH_SIZE` items or until `TRANSLATION_BATCH_TIMEOUT_MS` has
+        passed. A `None` item (put by `PipelineManager` on shutdown) ends the
+        input.
+        """
+        size = self._cfg.TRANSLATION_BATCH_SIZE
+        deadline = None
+        while not self._ended and len(self._ready) < size:
+            if self._ready:
+                if deadline is None:
+                    deadline = (
+                        time.monotonic() + self._cfg.TRANSLATION_BATCH_TIMEOUT_MS / 1000
+                    )
+                timeout = deadline - time.monotonic()
+            elif self._stop_event.is_set() and self._transcription_queue.empty():
+                break  # Drained on shutdown
+            else:
+                timeout = None  # Nothing to translate, wait for an item
+            try:
+                if timeout is None or timeout > 0:
+                    item = self._transcription_queue.get(timeout=timeout)
+                else:
+                    # Past the deadline, only take what is already queued
+                    item = self._transcription_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._ended = True  # Shutdown sentinel
+                break
+
+            # Each entry keeps the time its transcription was received
+            item["timestamp"] = datetime.now(timezone.utc).isoformat()
+            if self._reorderer is not None:
+                items = self._reorderer.push(item["seq"], item)
+            else:
+                items = [item]
+            # Empty placeholders only keep the sequence contiguous. Items with
+            # only an unstable tail are passed on with an empty translation.
+            self._ready.extend(
+                i for i in items if i["transcription"].strip() or i.get("unstable")
+            )
+
+        return [self._ready.popleft() for _ in range(min(size, len(self._ready)))]
+
+    def _process_batch(self, items: list):
+        """Translate transcription items and push the results to the output."""
+        try:
+            started = time.monotonic()
+            translations = self._translate_texts(
+                [i["transcription"] for i in items], [i.get("session") for i in items]
             )
-        translated_text = self._tokenizer.decode(
-            translated_tokens[0], skip_special_tokens=True
+            ended = time.monotonic()
+            if self._stats is not None:
+                self._stats.record_translation(
+                    ended - started, self._cache.hits, self._cache.misses
+                )
+            if not self._cfg.TRANSCRIBE_ONLY:
+                for item, translation in zip(items, translations):
+                    entry = {
+                        "timestamp": item["timestamp"],
+                        "transcription": item["transcription"],
+                        "translation": translation,
+                    }
+                    if "unstable" in item:
+                        entry["unstable"] = item["unstable"]
+                    if "session" in item:
+                        entry["session"] = item["session"]
+                    if "trace" in item:
+                        entry["trace"] = {
+                            **item["trace"],
+                            "translate_start": started,
+                            "translate_end": ended,
+                        }
+                    self._output_queue.put(entry)
+        except Exception as e:
+            print(f"🚨 Translator Error: {e}")
+
+    def _translate_texts(self, texts: list, sessions: list = None) -> list:
+        """
+        Translate consecutive transcriptions sentence by sentence. Sentences of
+        the previous transcription of the same session are reused, the new or
+        changed ones of all texts are translated in one batch.
+        """
+        sessions = sessions or [None] * len(texts)
+        sentences = [self._split_sentences(text) for text in texts]
+        previous = {sid: self._previous.get(sid, {}) for sid in sessions}
+        missing = list(
+            dict.fromkeys(
+                s
+                for parts, sid in zip(sentences, sessions)
+                for s in parts
+                if s not in previous[sid]
+            )
+        )
+        translated = {}
+        if missing:
+            translated = dict(zip(missing, self._translate_batch(missing)))
+
+        results = []
+        for parts, sid in zip(sentences, sessions):
+            translations = [
+                translated[s] if s in translated else previous[sid][s] for s in parts
+            ]
+            self._remember(sid, dict(zip(parts, translations)))
+            results.append(" ".join(translations))
+        return results
+
+    def _remember(self, sid, sentences: dict):
+        """Keep the sentences of a session's latest transcription."""
+        self._previous[sid] = sentences
+        self._previous.move_to_end(sid)
+        while len(self._previous) > self._cfg.MAX_SESSIONS:
+            self._previous.popitem(last=False)
+
+    @staticmethod
+    def _split_sentences(text: str) -> list:
+        """Split text into sentences, dropping empty ones."""
+        return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+    def _translate_batch(self, texts: list) -> list:
+        """
+        Translate several texts. Cached translations are reused and the rest are
+        translated in one call to the translation backend.
+        """
+        translations = [self._cache.get(self._model_name, text) for text in texts]
+        # Translate each distinct missing text once
+        missing = list(
+            dict.fromkeys(t for t, tr in zip(texts, translations) if tr is None)
         )
-        return translated_text
+        if missing:
+            translated = dict(zip(missing, self._backend.translate_batch(missing)))
+            for text, translation in translated.items():
+                self._cache.put(self._model_name, text, translation)
+            translations = [
+                translated[text] if tr is None else tr
+                for text, tr in zip(texts, translations)
+            ]
+        return translations
 
     def _cleanup(self):
-        """Clean up the translation model."""
-        pass
+        self.save_cache()
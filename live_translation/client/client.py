@@ -15,14 +15,36 @@ class LiveTranslationClient:
     Users can pass a callback to receive each server result.
     Automatically retries connection if server is unavailable.
     Allows programmatic exit via callback return value.
+
+    The microphone is captured in PyAudio callback mode: PortAudio's thread
+    hands each frame to the event loop, so capture never blocks sending or
+    receiving, and frames are sent at the pace the device produces them.
+    Frames wait in a queue of at most `MAX_QUEUED_FRAMES`. If sending falls
+    behind, the oldest frame is dropped (`dropped_frames`). Frames the device
+    lost before the callback got them are counted in `overflowed_frames`.
     """
 
+    # Max captured frames waiting to be sent (1s of audio)
+    MAX_QUEUED_FRAMES = 25
+
     def __init__(self, cfg: Config):
         self.cfg = cfg
         self.opus = OpusCodec(self.cfg) if self.cfg.CODEC == "opus" else None
         self._exit_requested = False
+        self.dropped_frames = 0  # Frames dropped while the queue was full
+        self.overflowed_frames = 0  # Frames reported with an input overflow
 
     async def _send_audio(self, websocket):
+        loop = asyncio.get_running_loop()
+        frames = asyncio.Queue(maxsize=self.MAX_QUEUED_FRAMES)
+        # How long to wait for a frame before checking for exit again
+        frame_timeout = 2 * self.cfg.CHUNK_SIZE / self.cfg.SAMPLE_RATE
+
+        def on_audio(in_data, frame_count, time_info, status):
+            # Runs in PortAudio's thread, only hands the frame to the loop
+            loop.call_soon_threadsafe(self._queue_frame, frames, in_data, status)
+            return None, pyaudio.paContinue
+
         pa = pyaudio.PyAudio()
         stream = pa.open(
             format=pyaudio.paInt16,
@@ -30,29 +52,48 @@ class LiveTranslationClient:
             rate=self.cfg.SAMPLE_RATE,
             input=True,
             frames_per_buffer=self.cfg.CHUNK_SIZE,
+            stream_callback=on_audio,
         )
 
         print("🎤 Mic open, streaming to server...")
         try:
             while not self._exit_requested:
-                data = stream.read(self.cfg.CHUNK_SIZE, exception_on_overflow=False)
-                # If using Opus codec, encode the audio data from PCM to Opus format
+                try:
+                    data = await asyncio.wait_for(frames.get(), frame_timeout)
+                except asyncio.TimeoutError:
+                    continue
+                # If using Opus codec, encode the audio data from PCM to Opus
+                # format, off the event loop
                 if self.opus:
                     try:
-                        data = self.opus.encode(data)
+                        data = await loop.run_in_executor(None, self.opus.encode, data)
                     except Exception as e:
                         print(f"🚨 Opus encoding error: {e}")
 
                 await websocket.send(data)
-                await asyncio.sleep(0.01)
         except Exception as e:
             print(f"🚨 Audio send error: {e}")
         finally:
+            # Waits for a running callback, so none is called after this
             stream.stop_stream()
             stream.close()
             pa.terminate()
+            if self.dropped_frames or self.overflowed_frames:
+                print(
+                    f"🚨 Audio frames lost: {self.dropped_frames} dropped while "
+                    f"sending was behind, {self.overflowed_frames} input overflows."
+                )
             print("🛑 Audio streaming stopped.")
 
+    def _queue_frame(self, frames: asyncio.Queue, data: bytes, status: int):
+        """Queue a captured frame for sending, dropping the oldest if full."""
+        if status & pyaudio.paInputOverflow:
+            self.overflowed_frames += 1
+        if frames.full():
+            frames.get_nowait()
+            self.dropped_frames += 1
+        frames.put_nowait(data)
+
     async def _receive_output(
         self, websocket, callback, callback_args, callback_kwargs
     ):
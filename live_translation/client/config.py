@@ -1,5 +1,7 @@
 # client/config.py
 
+from .._audio import _settings
+
 
 class Config:
     """
@@ -20,9 +22,9 @@ class Config:
         self.CODEC = codec
 
         # Immutable audio settings (must match server)
-        self._CHUNK_SIZE = 640  # 40 ms of audio at 16 kHz
-        self._SAMPLE_RATE = 16000  # Hz
-        self._CHANNELS = 1  # Mono
+        self._CHUNK_SIZE = _settings.CHUNK_SIZE
+        self._SAMPLE_RATE = _settings.SAMPLE_RATE
+        self._CHANNELS = _settings.CHANNELS
 
         self._validate()
 
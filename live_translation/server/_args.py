@@ -23,16 +23,26 @@ def get_args():
         ),
     )
 
+    add_vad_args(parser)
+
     parser.add_argument(
-        "--vad_aggressiveness",
-        type=int,
-        choices=range(10),
-        default=8,
+        "--vad_streaming",
+        action="store_true",
         help=(
-            "Voice Activity Detection (VAD) aggressiveness level (0-9).\n"
-            "Higher values mean VAD has to be more confident to "
-            "detect speech vs silence.\n"
-            "Default is 8."
+            "Run VAD as a continuous stream over exact 512-sample frames.\n"
+            "Every sample is scored once (one model call per chunk instead of "
+            "two) and the model's state carries across chunks.\n"
+            "Default is False."
+        ),
+    )
+
+    parser.add_argument(
+        "--vad_pregate",
+        action="store_true",
+        help=(
+            "Skip the VAD model on obvious silence, detected from energy and "
+            "zero-crossing rate against an adaptive noise floor.\n"
+            "Default is False."
         ),
     )
 
@@ -58,7 +68,242 @@ def get_args():
         ),
     )
 
+    parser.add_argument(
+        "--ipc_transport",
+        type=str,
+        choices=["queue", "shm"],
+        default="queue",
+        help=(
+            "Transport for audio between pipeline stages ('queue', 'shm').\n"
+            "  - 'queue': Pickle audio through multiprocessing queues.\n"
+            "  - 'shm': Pass raw audio through a shared-memory ring buffer and "
+            "speech segments through a shared-memory arena "
+            "(lower CPU and jitter).\n"
+            "Default is 'queue'."
+        ),
+    )
+
+    parser.add_argument(
+        "--transcription_mode",
+        type=str,
+        choices=["window", "incremental"],
+        default="window",
+        help=(
+            "How speech is transcribed ('window', 'incremental').\n"
+            "  - 'window': Transcribe the whole speech buffer again for every "
+            "second of new speech.\n"
+            "  - 'incremental': Transcribe only new audio and commit words once "
+            "two consecutive transcriptions agree on them (lower CPU and latency, "
+            "no repeated text).\n"
+            "Default is 'window'."
+        ),
+    )
+
     # Models Settings
+    add_whisper_args(parser)
+
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of Whisper model workers, allowing that many transcriptions "
+            "to run in parallel.\n"
+            "Default is 1."
+        ),
+    )
+
+    parser.add_argument(
+        "--transcriber_workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of Transcriber processes transcribing speech segments in "
+            "parallel.\n"
+            "Output order is restored before translation and delivery.\n"
+            "NOTE: The --cpu_threads budget (all cores if 0) is split between "
+            "workers.\n"
+            "NOTE: 'incremental' transcription mode requires 1 worker.\n"
+            "Default is 1."
+        ),
+    )
+
+    add_translation_args(parser)
+
+    parser.add_argument(
+        "--translation_batch_timeout_ms",
+        type=int,
+        default=50,
+        help=(
+            "Max time in milliseconds to wait for more transcriptions to fill a "
+            "translation batch.\n"
+            "Default is 50."
+        ),
+    )
+
+    # Language Settings
+    add_language_args(parser)
+
+    # Logging Settings
+    parser.add_argument(
+        "--log",
+        type=str,
+        choices=["print", "file"],
+        default=None,
+        help=(
+            "Optional logging mode for saving transcription output.\n"
+            "  - 'file': Save each result to a structured .jsonl file in "
+            "./transcripts/transcript_{TIMESTAMP}.jsonl.\n"
+            "  - 'print': Print each result to stdout.\n"
+            "Default is None (no logging)."
+        ),
+    )
+
+    parser.add_argument(
+        "--ws_port",
+        type=int,
+        default=8765,
+        help=(
+            "WebSocket port the of the server.\n"
+            "Used to listen for client audio and publish output (e.g., 8765)."
+        ),
+    )
+
+    parser.add_argument(
+        "--max_sessions",
+        type=int,
+        default=1,
+        help=(
+            "Max number of clients served at once.\n"
+            "Each client gets its own VAD and audio buffer state, while the "
+            "loaded models are shared.\n"
+            "NOTE: More than 1 session requires the 'queue' IPC transport and "
+            "'window' transcription mode.\n"
+            "Default is 1."
+        ),
+    )
+
+    parser.add_argument(
+        "--processed_queue_size",
+        type=int,
+        default=0,
+        help=(
+            "Max speech segments waiting for the transcriber, so a transcriber "
+            "behind real time sheds load (see --overload_policy).\n"
+            "0 makes the queue unbounded.\n"
+            "Default is 0."
+        ),
+    )
+
+    parser.add_argument(
+        "--overload_policy",
+        type=str,
+        choices=["coalesce", "drop", "downshift", "block"],
+        default="block",
+        help=(
+            "What to do with new speech segments while the transcriber is "
+            "behind real time (the processed queue is full):\n"
+            "  - 'coalesce': Hold the newest segment of each client back and "
+            "send it once there is room. Superseded segments are shed.\n"
+            "  - 'drop': Drop new partial segments, but still send the ones "
+            "ending an utterance. Requires 'window' transcription mode.\n"
+            "  - 'downshift': Like 'coalesce', and also send segments less "
+            "often until the transcriber catches up.\n"
+            "  - 'block': Wait for room, nothing is shed.\n"
+            "Only used with a bounded --processed_queue_size.\n"
+            "Default is 'block'."
+        ),
+    )
+
+    parser.add_argument(
+        "--metrics_port",
+        type=int,
+        default=None,
+        help=(
+            "Optional port of an HTTP listener serving pipeline metrics in the "
+            "Prometheus text format on /metrics (e.g., 9100).\n"
+            "Process RSS/CPU metrics need psutil: "
+            "`pip install live-translation[metrics]`.\n"
+            "Default is None (no metrics)."
+        ),
+    )
+
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=(
+            "Trace the latency of each pipeline stage.\n"
+            "Adds a per-stage breakdown (ms) to each output entry as 'trace' and "
+            "prints per-stage latency histograms on shutdown.\n"
+            "NOTE: Requires the 'queue' IPC transport."
+        ),
+    )
+
+    parser.add_argument(
+        "--no_warmup",
+        action="store_true",
+        help=(
+            "Skip the warm-up pass that runs a synthetic utterance through the "
+            "VAD, Whisper and translation models at startup.\n"
+            "Starts faster, but the first utterance is slower."
+        ),
+    )
+
+    add_general_args(parser)
+
+    return parser.parse_args()
+
+
+# Arguments shared with the offline file CLI (see `_file_args.py`)
+
+
+def add_vad_args(parser: argparse.ArgumentParser):
+    """Add the VAD model arguments."""
+    parser.add_argument(
+        "--vad_aggressiveness",
+        type=int,
+        choices=range(10),
+        default=8,
+        help=(
+            "Voice Activity Detection (VAD) aggressiveness level (0-9).\n"
+            "Higher values mean VAD has to be more confident to "
+            "detect speech vs silence.\n"
+            "Default is 8."
+        ),
+    )
+
+    parser.add_argument(
+        "--vad_backend",
+        type=str,
+        choices=["torch", "onnx"],
+        default="torch",
+        help=(
+            "Inference backend for the Silero VAD model ('torch', 'onnx').\n"
+            "  - 'torch': Load the model with PyTorch (torch.hub unless "
+            "--vad_model_path is set).\n"
+            "  - 'onnx': Run the model with ONNX Runtime using the weights bundled "
+            "with faster-whisper unless --vad_model_path is set "
+            "(no network access, smaller footprint).\n"
+            "Default is 'torch'."
+        ),
+    )
+
+    parser.add_argument(
+        "--vad_model_path",
+        type=str,
+        default=None,
+        help=(
+            "Optional local path to the VAD model weights.\n"
+            "  - 'torch': A TorchScript file or a local clone of silero-vad.\n"
+            "  - 'onnx': A silero_vad.onnx file or a directory holding "
+            "silero_encoder_v5.onnx and silero_decoder_v5.onnx.\n"
+            "Default is None."
+        ),
+    )
+
+
+def add_whisper_args(parser: argparse.ArgumentParser):
+    """Add the device and Whisper model arguments."""
     parser.add_argument(
         "--device",
         type=str,
@@ -94,6 +339,34 @@ def get_args():
         ),
     )
 
+    parser.add_argument(
+        "--compute_type",
+        type=str,
+        default="float32",
+        help=(
+            "CTranslate2 compute type for Whisper inference "
+            "(e.g. 'float32', 'int8', 'int8_float32', 'float16', 'default').\n"
+            "NOTE: 'int8' or 'int8_float32' are 2-4x faster on CPU with a small "
+            "accuracy loss.\n"
+            "Must be supported by the CTranslate2 build on the selected device.\n"
+            "Default is 'float32'."
+        ),
+    )
+
+    parser.add_argument(
+        "--cpu_threads",
+        type=int,
+        default=0,
+        help=(
+            "Number of threads used by Whisper on CPU.\n"
+            "0 uses the CTranslate2 default (4, or OMP_NUM_THREADS if set).\n"
+            "Default is 0."
+        ),
+    )
+
+
+def add_translation_args(parser: argparse.ArgumentParser):
+    """Add the translation model, cache and batching arguments."""
     parser.add_argument(
         "--trans_model",
         type=str,
@@ -107,49 +380,100 @@ def get_args():
         ),
     )
 
-    # Language Settings
     parser.add_argument(
-        "--src_lang",
+        "--trans_backend",
         type=str,
-        default="en",
+        choices=["transformers", "ctranslate2"],
+        default="transformers",
         help=(
-            "Source/Input language for transcription (e.g., 'en', 'fr').\n"
-            "Default is 'en'."
+            "Inference backend for the translation model "
+            "('transformers', 'ctranslate2').\n"
+            "  - 'transformers': PyTorch transformers in float32.\n"
+            "  - 'ctranslate2': CTranslate2, typically several times faster on CPU. "
+            "The model is converted once and cached in "
+            "~/.cache/live_translation/ct2.\n"
+            "Default is 'transformers'."
         ),
     )
 
     parser.add_argument(
-        "--tgt_lang",
+        "--trans_compute_type",
         type=str,
-        default="es",
-        help=("Target language for translation (e.g., 'es', 'de').\nDefault is 'es'."),
+        default="int8",
+        help=(
+            "CTranslate2 compute type for translation "
+            "(e.g. 'int8', 'int8_float32', 'float32', 'default').\n"
+            "Only used with --trans_backend ctranslate2.\n"
+            "Default is 'int8'."
+        ),
     )
 
-    # Logging Settings
     parser.add_argument(
-        "--log",
+        "--trans_cache_size",
+        type=int,
+        default=1024,
+        help=(
+            "Max number of translations kept in the translator's LRU cache.\n"
+            "0 disables caching.\n"
+            "Default is 1024."
+        ),
+    )
+
+    parser.add_argument(
+        "--trans_cache_path",
         type=str,
-        choices=["print", "file"],
         default=None,
         help=(
-            "Optional logging mode for saving transcription output.\n"
-            "  - 'file': Save each result to a structured .jsonl file in "
-            "./transcripts/transcript_{TIMESTAMP}.jsonl.\n"
-            "  - 'print': Print each result to stdout.\n"
-            "Default is None (no logging)."
+            "Optional JSON file to persist the translation cache across runs.\n"
+            "Default is None (in-memory only)."
         ),
     )
 
     parser.add_argument(
-        "--ws_port",
+        "--verify_model_online",
+        action="store_true",
+        help=(
+            "Look the translation model up on Hugging Face when its language "
+            "pair is neither a known OpusMT pair nor in the local Hugging Face "
+            "cache.\n"
+            "Default is False (network-free validation)."
+        ),
+    )
+
+    parser.add_argument(
+        "--translation_batch_size",
         type=int,
-        default=8765,
+        default=1,
         help=(
-            "WebSocket port the of the server.\n"
-            "Used to listen for client audio and publish output (e.g., 8765)."
+            "Max number of transcriptions translated together in one batch.\n"
+            "1 disables batching.\n"
+            "Default is %(default)s."
+        ),
+    )
+
+
+def add_language_args(parser: argparse.ArgumentParser):
+    """Add the source and target language arguments."""
+    parser.add_argument(
+        "--src_lang",
+        type=str,
+        default="en",
+        help=(
+            "Source/Input language for transcription (e.g., 'en', 'fr').\n"
+            "Default is 'en'."
         ),
     )
 
+    parser.add_argument(
+        "--tgt_lang",
+        type=str,
+        default="es",
+        help=("Target language for translation (e.g., 'es', 'de').\nDefault is 'es'."),
+    )
+
+
+def add_general_args(parser: argparse.ArgumentParser):
+    """Add the transcribe only and version arguments."""
     parser.add_argument(
         "--transcribe_only",
         action="store_true",
@@ -162,5 +486,3 @@ def get_args():
         action="store_true",
         help="Print version and exit.",
     )
-
-    return parser.parse_args()
@@ -0,0 +1,83 @@
+# _file_args.py
+
+import argparse
+from ._args import (
+    add_general_args,
+    add_language_args,
+    add_translation_args,
+    add_vad_args,
+    add_whisper_args,
+)
+
+# Defaults that differ from the server's. Files are translated all at once, so
+# batching translations only helps.
+OFFLINE_DEFAULTS = {"translation_batch_size": 16}
+
+
+def get_args():
+    """Parse command-line arguments for offline file translation."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Live Translation Files - Transcribe and translate recorded audio "
+            "files faster than real time."
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help=(
+            "Audio files (WAV, Opus, or any format FFmpeg reads) and directories "
+            "of audio files to process."
+        ),
+    )
+
+    # Output Settings
+    parser.add_argument(
+        "--output_dir",
+        type=str,
+        default="transcripts",
+        help=(
+            "Directory to write one {name}.jsonl per input file to, in the same "
+            "format as --log file of the server, plus the start and end of each "
+            "segment in seconds.\n"
+            "Default is 'transcripts'."
+        ),
+    )
+
+    # Parallelism Settings
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of files processed in parallel, each by a worker process "
+            "with its own models.\n"
+            "NOTE: The --cpu_threads budget (all cores if 0) is split between "
+            "jobs.\n"
+            "Default is 1."
+        ),
+    )
+
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=8,
+        help=(
+            "Number of speech windows (up to 30 seconds each) Whisper transcribes "
+            "together in one batch.\n"
+            "Default is 8."
+        ),
+    )
+
+    # Settings shared with the server
+    add_vad_args(parser)
+    add_whisper_args(parser)
+    add_translation_args(parser)
+    add_language_args(parser)
+    add_general_args(parser)
+
+    parser.set_defaults(**OFFLINE_DEFAULTS)
+
+    return parser.parse_args()
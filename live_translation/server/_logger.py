@@ -9,17 +9,18 @@ class OutputLogger:
     """
     Logs transcription/translation results to file or stdout.
     Controlled via cfg.LOG = 'file', 'print', or None.
+    A `path` logs to that file instead (overwriting it), whatever cfg.LOG is.
     """
 
-    def __init__(self, cfg):
-        self._mode = cfg.LOG
+    def __init__(self, cfg, path: str = None):
+        self._mode = "file" if path else cfg.LOG
         self._file = None
-        self._file_path = None
+        self._file_path = path
 
         if self._mode == "file":
-            self._file_path = self._next_available_path()
-            os.makedirs(os.path.dirname(self._file_path), exist_ok=True)
-            self._file = open(self._file_path, "a", encoding="utf-8")
+            self._file_path = self._file_path or self._next_available_path()
+            os.makedirs(os.path.dirname(self._file_path) or ".", exist_ok=True)
+            self._file = open(self._file_path, "w" if path else "a", encoding="utf-8")
             print(f"📁 Logging to: {self._file_path}")
 
     def write(self, entry: dict):
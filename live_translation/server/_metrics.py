@@ -0,0 +1,334 @@
+# server/_metrics.py
+
+import bisect
+import os
+import multiprocessing as mp
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ._trace import BUCKETS_MS
+
+PREFIX = "live_translation"
+
+
+class SharedHistogram:
+    """
+    Histogram that can be observed from several processes. Bucket counts live in
+    a shared `mp.Array`, so it must be created before the processes are started.
+    """
+
+    def __init__(self, bounds: tuple, ctx=None):
+        ctx = ctx or mp.get_context()
+        self.bounds = tuple(bounds)
+        self._counts = ctx.Array("q", len(self.bounds) + 1)  # +1 for overflow
+        self._sum = ctx.Value("d", 0.0, lock=False)  # Guarded by the array lock
+
+    def observe(self, value: float):
+        with self._counts.get_lock():
+            self._counts[bisect.bisect_left(self.bounds, value)] += 1
+            self._sum.value += value
+
+    def snapshot(self) -> tuple[list, float]:
+        """Return the cumulative bucket counts (then overall) and the sum."""
+        with self._counts.get_lock():
+            counts, total = self._counts[:], self._sum.value
+        cumulative, running = [], 0
+        for n in counts:
+            running += n
+            cumulative.append(running)
+        return cumulative, total
+
+
+class PipelineStats:
+    """
+    Counters and histograms updated by the pipeline processes and exported by
+    `MetricsServer`. All values are shared memory, created by the parent.
+    """
+
+    # Bucket bounds of the Whisper real-time factor (processing / audio time)
+    RTF_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 5)
+    # Bucket bounds (s) of the translation latency of a batch
+    TRANSLATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+    def __init__(self, ctx=None):
+        ctx = ctx or mp.get_context()
+        self.vad_chunks = ctx.Value("q", 0)
+        self.vad_speech_chunks = ctx.Value("q", 0)
+        self.vad_model_calls = ctx.Value("q", 0)
+        self.shed_segments = ctx.Value("q", 0)
+        self.audio_seconds = ctx.Value("d", 0.0)
+        self.transcription_seconds = ctx.Value("d", 0.0)
+        self.cache_hits = ctx.Value("q", 0)
+        self.cache_misses = ctx.Value("q", 0)
+        self.whisper_rtf = SharedHistogram(self.RTF_BUCKETS, ctx)
+        self.translation_latency = SharedHistogram(self.TRANSLATION_BUCKETS, ctx)
+
+    @staticmethod
+    def _add(value, n):
+        with value.get_lock():
+            value.value += n
+
+    def record_vad(self, speech: bool, model_calls: int):
+        """Count a chunk seen by the VAD (audio processor)."""
+        self._add(self.vad_chunks, 1)
+        self._add(self.vad_speech_chunks, int(speech))
+        self._add(self.vad_model_calls, model_calls)
+
+    def record_shed(self):
+        """Count a segment shed by the overload policy (audio processor)."""
+        self._add(self.shed_segments, 1)
+
+    def record_transcription(self, audio_seconds: float, seconds: float):
+        """Count a transcribed segment (transcriber)."""
+        self._add(self.audio_seconds, audio_seconds)
+        self._add(self.transcription_seconds, seconds)
+        self.whisper_rtf.observe(seconds / audio_seconds)
+
+    def record_translation(self, seconds: float, cache_hits: int, cache_misses: int):
+        """Count a translated batch and the cache totals (translator)."""
+        self.translation_latency.observe(seconds)
+        self.cache_hits.value = cache_hits
+        self.cache_misses.value = cache_misses
+
+
+class _Exposition:
+    """Lines of the Prometheus text format."""
+
+    def __init__(self):
+        self.lines = []
+
+    def metric(self, name: str, kind: str, help_: str):
+        self.lines.append(f"# HELP {PREFIX}_{name} {help_}")
+        self.lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+
+    def sample(self, name: str, value, labels: dict = None):
+        label_str = ""
+        if labels:
+            label_str = "{%s}" % ",".join(f'{k}="{v}"' for k, v in labels.items())
+        self.lines.append(f"{PREFIX}_{name}{label_str} {value}")
+
+    def histogram(
+        self, name: str, bounds, cumulative: list, total: float, labels: dict = None
+    ):
+        labels = labels or {}
+        for bound, count in zip(bounds, cumulative):
+            self.sample(f"{name}_bucket", count, {**labels, "le": f"{bound:g}"})
+        self.sample(f"{name}_bucket", cumulative[-1], {**labels, "le": "+Inf"})
+        self.sample(f"{name}_sum", total, labels)
+        self.sample(f"{name}_count", cumulative[-1], labels)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+class MetricsServer(threading.Thread):
+    """
+    HTTP listener serving pipeline metrics in the Prometheus text format on
+    `/metrics`:
+    - queue depths of the pipeline queues and segments shed under load
+    - VAD speech ratio and model calls (rate them for calls per second)
+    - Whisper real-time factor and translation latency histograms
+    - translation cache hits and misses
+    - RSS and CPU time of each pipeline process (needs `psutil`)
+    - connected sessions
+    - per-stage latency histograms, with `trace` enabled
+    """
+
+    def __init__(
+        self,
+        port: int,
+        stop_event: threading.Event,
+        stats: PipelineStats,
+        queues: dict,
+        processes: dict,
+        ws_io,
+    ):
+        """
+        `queues` and `processes` map names to the pipeline's queues and
+        processes. The server process itself is reported as 'server'.
+        """
+        super().__init__()
+        self._port = port
+        self._stop_event = stop_event
+        self._stats = stats
+        self._queues = queues
+        self._processes = processes
+        self._ws_io = ws_io
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+            print(
+                "🚨 Metrics: psutil is not installed, process RSS and CPU are not "
+                "exported. Install it with `pip install live-translation[metrics]`."
+            )
+        self._psutil = psutil
+
+    def run(self):
+        render = self.render
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes are not worth a line each
+
+        try:
+            httpd = ThreadingHTTPServer(("0.0.0.0", self._port), Handler)
+        except OSError as e:
+            print(f"🚨 Metrics: Could not listen on port {self._port}: {e}")
+            return
+        httpd.daemon_threads = True
+        print(
+            f"📈 Metrics: Serving on \033[91mhttp://0.0.0.0:{self._port}/metrics\033[0m"
+        )
+        serve = threading.Thread(target=httpd.serve_forever, daemon=True)
+        serve.start()
+        self._stop_event.wait()
+        httpd.shutdown()
+        httpd.server_close()
+
+    def render(self) -> str:
+        """Return the current metrics in the Prometheus text format."""
+        out = _Exposition()
+        stats = self._stats
+
+        out.metric("queue_depth", "gauge", "Items waiting in a pipeline queue.")
+        for name, queue_ in self._queues.items():
+            try:
+                out.sample("queue_depth", queue_.qsize(), {"queue": name})
+            except (NotImplementedError, OSError, ValueError):
+                pass  # qsize() is not available on macOS
+
+        out.metric("sessions", "gauge", "Connected clients.")
+        out.sample("sessions", self._ws_io.session_count)
+
+        chunks = stats.vad_chunks.value
+        speech = stats.vad_speech_chunks.value
+        out.metric("vad_chunks_total", "counter", "Audio chunks seen by the VAD.")
+        out.sample("vad_chunks_total", chunks)
+        out.metric("vad_speech_chunks_total", "counter", "Audio chunks with speech.")
+        out.sample("vad_speech_chunks_total", speech)
+        out.metric("vad_speech_ratio", "gauge", "Share of audio chunks with speech.")
+        out.sample("vad_speech_ratio", speech / chunks if chunks else 0.0)
+        out.metric(
+            "vad_model_calls_total",
+            "counter",
+            "Audio chunks scored by the VAD model (not skipped by the pre-gate).",
+        )
+        out.sample("vad_model_calls_total", stats.vad_model_calls.value)
+
+        out.metric(
+            "shed_segments_total",
+            "counter",
+            "Speech segments shed while the transcriber was behind.",
+        )
+        out.sample("shed_segments_total", stats.shed_segments.value)
+
+        audio_seconds = stats.audio_seconds.value
+        seconds = stats.transcription_seconds.value
+        out.metric(
+            "transcribed_audio_seconds_total", "counter", "Audio transcribed (s)."
+        )
+        out.sample("transcribed_audio_seconds_total", audio_seconds)
+        out.metric(
+            "transcription_seconds_total", "counter", "Time spent transcribing (s)."
+        )
+        out.sample("transcription_seconds_total", seconds)
+        out.metric(
+            "whisper_real_time_factor",
+            "gauge",
+            "Transcription time per second of audio since startup "
+            "(above 1 means falling behind real time).",
+        )
+        out.sample(
+            "whisper_real_time_factor",
+            seconds / audio_seconds if audio_seconds else 0.0,
+        )
+        out.metric(
+            "whisper_segment_real_time_factor",
+            "histogram",
+            "Real-time factor of each transcribed segment.",
+        )
+        out.histogram(
+            "whisper_segment_real_time_factor",
+            stats.whisper_rtf.bounds,
+            *stats.whisper_rtf.snapshot(),
+        )
+        out.metric(
+            "translation_seconds", "histogram", "Latency of each translation batch."
+        )
+        out.histogram(
+            "translation_seconds",
+            stats.translation_latency.bounds,
+            *stats.translation_latency.snapshot(),
+        )
+
+        hits, misses = stats.cache_hits.value, stats.cache_misses.value
+        out.metric("translation_cache_hits_total", "counter", "Translation cache hits.")
+        out.sample("translation_cache_hits_total", hits)
+        out.metric(
+            "translation_cache_misses_total", "counter", "Translation cache misses."
+        )
+        out.sample("translation_cache_misses_total", misses)
+        out.metric(
+            "translation_cache_hit_ratio", "gauge", "Share of cache lookups that hit."
+        )
+        out.sample(
+            "translation_cache_hit_ratio",
+            hits / (hits + misses) if hits + misses else 0.0,
+        )
+
+        if self._psutil is not None:
+            self._render_processes(out)
+
+        latency = self._ws_io.latency
+        if latency is not None:
+            out.metric(
+                "stage_latency_seconds",
+                "histogram",
+                "Latency of each pipeline stage (with trace enabled).",
+            )
+            bounds = [ms / 1000 for ms in BUCKETS_MS]
+            for stage in latency.stages():
+                out.histogram(
+                    "stage_latency_seconds",
+                    bounds,
+                    latency.cumulative(stage),
+                    latency.total(stage) / 1000,
+                    {"stage": stage},
+                )
+
+        return out.text()
+
+    def _render_processes(self, out: _Exposition):
+        """Add the RSS and CPU time of each running pipeline process."""
+        pids = {"server": os.getpid()}
+        pids.update((name, p.pid) for name, p in self._processes.items() if p.pid)
+        samples = []
+        for name, pid in pids.items():
+            try:
+                proc = self._psutil.Process(pid)
+                with proc.oneshot():
+                    rss = proc.memory_info().rss
+                    cpu = proc.cpu_times()
+            except self._psutil.Error:
+                continue  # Already gone
+            samples.append((name, rss, cpu.user + cpu.system))
+
+        out.metric("process_resident_memory_bytes", "gauge", "Process RSS (bytes).")
+        for name, rss, _ in samples:
+            out.sample("process_resident_memory_bytes", rss, {"process": name})
+        out.metric(
+            "process_cpu_seconds_total", "counter", "Process user and system CPU (s)."
+        )
+        for name, _, cpu in samples:
+            out.sample("process_cpu_seconds_total", cpu, {"process": name})
@@ -0,0 +1,269 @@
+# server/_offline.py
+
+import os
+import time
+import multiprocessing as mp
+from datetime import datetime, timezone
+import numpy as np
+import torch
+from faster_whisper import BatchedInferencePipeline, decode_audio
+from .config import Config
+from ._logger import OutputLogger
+from .._audio._vad import VoiceActivityDetector
+from .._transcription._transcriber import Transcriber
+from .._translation._cache import TranslationCache
+from .._translation._translator import Translator
+
+# Files picked up when a directory is given
+AUDIO_EXTENSIONS = (".wav", ".opus", ".ogg", ".oga", ".flac", ".mp3", ".m4a")
+
+# Models of a worker process of the pool, see _init_worker()
+_worker = None
+
+
+class FileTranslator:
+    """
+    Transcribes and translates recorded audio files as fast as the hardware
+    allows, with the VAD, `Transcriber` and `Translator` of the live pipeline.
+
+    Each file is:
+    1. decoded to 16 kHz mono (WAV, Opus or anything else FFmpeg reads),
+    2. cut into speech segments by the VAD, at pauses of `SOFT_SILENCE_THRESHOLD`
+    and at most every `MAX_SEGMENT_DURATION` seconds,
+    3. transcribed with batched Whisper, `batch_size` windows per model call,
+    4. translated in batches of `TRANSLATION_BATCH_SIZE` (unless transcribe only),
+    and written to `{output_dir}/{name}.jsonl` in the `OutputLogger` format, with
+    the `start` and `end` of each segment in seconds from the start of the file.
+
+    With `jobs` > 1, files are processed in parallel by that many worker
+    processes, each with its own models. The Whisper thread budget
+    (`cpu_threads`) is split between them like between transcriber workers.
+    Workers send their translation cache back with each file, and the parent
+    merges and saves them to `trans_cache_path` once.
+    """
+
+    # Max speech segment length (s), Whisper's window
+    MAX_SEGMENT_DURATION = 30
+
+    def __init__(
+        self,
+        cfg: Config,
+        output_dir: str = "transcripts",
+        jobs: int = 1,
+        batch_size: int = 8,
+    ):
+        if jobs < 1:
+            raise ValueError("🚨 'jobs' must be greater than or equal 1. ")
+        if batch_size < 1:
+            raise ValueError("🚨 'batch_size' must be greater than or equal 1. ")
+        self.cfg = cfg
+        self._output_dir = output_dir
+        self._jobs = jobs
+        self._batch_size = batch_size
+
+    def run(self, paths: list) -> list:
+        """
+        Process audio files, and the audio files in directories, of `paths`.
+        Returns the path of the JSONL output of each file (None if it failed).
+        """
+        files = self.collect(paths)
+        if not files:
+            print("🚨 FileTranslator: No audio files found.")
+            return []
+        tasks = list(zip(files, self._output_paths(files)))
+        jobs = min(self._jobs, len(tasks))
+        print(f"🚀 FileTranslator: Processing {len(tasks)} file(s) with {jobs} job(s)")
+
+        # Workers split the Whisper thread budget like transcriber workers do
+        cfg = self.cfg.replace(transcriber_workers=jobs)
+
+        if jobs == 1:
+            worker = _FileWorker(cfg, self._batch_size)
+            try:
+                return [worker.process(*task) for task in tasks]
+            finally:
+                worker.close()
+
+        # Spawn workers on CUDA, see LiveTranslationServer
+        ctx = mp.get_context("spawn" if cfg.DEVICE == "cuda" else None)
+        pool = ctx.Pool(
+            jobs, initializer=_init_worker, initargs=(cfg, self._batch_size)
+        )
+        try:
+            results = pool.starmap(_process_in_worker, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        self._save_cache([items for _, items in results])
+        return [output for output, _ in results]
+
+    def _save_cache(self, worker_items: list):
+        """Merge the translation caches of the workers and save them."""
+        if self.cfg.TRANSCRIBE_ONLY or not self.cfg.TRANS_CACHE_PATH:
+            return
+        cache = TranslationCache(self.cfg.TRANS_CACHE_SIZE, self.cfg.TRANS_CACHE_PATH)
+        cache.load()
+        for items in worker_items:
+            cache.update(items)
+        try:
+            cache.save()
+        except Exception as e:
+            print(f"🚨 FileTranslator: Could not save the translation cache: {e}")
+
+    @staticmethod
+    def collect(paths: list) -> list:
+        """Expand directories into the audio files they hold, in order."""
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, dirs, names in os.walk(path):
+                    dirs.sort()
+                    files.extend(
+                        os.path.join(root, name)
+                        for name in sorted(names)
+                        if name.lower().endswith(AUDIO_EXTENSIONS)
+                    )
+            elif os.path.isfile(path):
+                files.append(path)
+            else:
+                raise ValueError(f"🚨 Audio file or directory not found: '{path}'. ")
+        return files
+
+    def _output_paths(self, files: list) -> list:
+        """One `{name}.jsonl` per file, numbered if names collide."""
+        paths, seen = [], {}
+        for path in files:
+            name = os.path.splitext(os.path.basename(path))[0]
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = f"{name}_{count}"
+            paths.append(os.path.join(self._output_dir, f"{name}.jsonl"))
+        return paths
+
+
+class _FileWorker:
+    """Models of one process, processing files one at a time."""
+
+    def __init__(self, cfg: Config, batch_size: int):
+        self._cfg = cfg
+        self._batch_size = batch_size
+        self._vad = VoiceActivityDetector(cfg)
+
+        # The stages are not started as processes, only their models are loaded
+        transcriber = Transcriber(None, None, None, cfg, None)
+        transcriber.load_model()
+        self._whisper = BatchedInferencePipeline(transcriber.whisper_model)
+
+        self._translator = None
+        if not cfg.TRANSCRIBE_ONLY:
+            self._translator = Translator(None, None, cfg, None)
+            self._translator.load()
+
+    def process(self, path: str, output_path: str) -> str | None:
+        """Transcribe and translate a file. Returns the output path."""
+        started = time.monotonic()
+        try:
+            audio = decode_audio(path, sampling_rate=self._cfg.SAMPLE_RATE)
+            clips = self.segment(audio)
+            segments = self.transcribe(audio, clips)
+            texts = [text for _, _, text in segments]
+            if self._translator is not None:
+                translations = self._translator.translate_all(texts)
+            else:
+                translations = [""] * len(texts)
+        except Exception as e:
+            print(f"🚨 FileTranslator Error: {path}: {e}")
+            return None
+
+        logger = OutputLogger(self._cfg, path=output_path)
+        try:
+            for (start, end, text), translation in zip(segments, translations):
+                logger.write(
+                    {
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "transcription": text,
+                        "translation": translation,
+                        "start": round(start, 2),
+                        "end": round(end, 2),
+                    }
+                )
+        finally:
+            logger.close()
+
+        duration = len(audio) / self._cfg.SAMPLE_RATE
+        elapsed = time.monotonic() - started
+        print(
+            f"✅ FileTranslator: {path}: {duration:.1f}s of audio in {elapsed:.1f}s "
+            f"({duration / max(elapsed, 1e-6):.1f}x real time), "
+            f"{len(segments)} segment(s)"
+        )
+        return output_path
+
+    def segment(self, audio: np.ndarray) -> list:
+        """
+        Return the speech segments of a recording as Whisper clip timestamps
+        (`{"start", "end"}` in seconds). The VAD scores `CHUNK_SIZE` chunks like
+        in the live pipeline. A segment ends after `SOFT_SILENCE_THRESHOLD` of
+        silence, or is split once it reaches `MAX_SEGMENT_DURATION`.
+        """
+        chunk = self._cfg.CHUNK_SIZE
+        rate = self._cfg.SAMPLE_RATE
+        pause = int(self._cfg.SOFT_SILENCE_THRESHOLD * rate)
+        max_len = FileTranslator.MAX_SEGMENT_DURATION * rate
+
+        self._vad.reset()
+        spans, start, end = [], None, 0
+        for i in range(0, len(audio), chunk):
+            if self._vad.is_speech(audio[i : i + chunk]):
+                if start is None:
+                    start = i
+                elif i + chunk - start > max_len:
+                    spans.append((start, i))
+                    start = i
+                end = min(i + chunk, len(audio))
+            elif start is not None and i + chunk - end >= pause:
+                spans.append((start, end))
+                start = None
+        if start is not None:
+            spans.append((start, end))
+
+        return [{"start": s / rate, "end": e / rate} for s, e in spans]
+
+    def transcribe(self, audio: np.ndarray, clips: list) -> list:
+        """
+        Transcribe the speech segments of a recording in batches.
+        Returns `(start, end, text)` tuples, in seconds from the start of the file.
+        """
+        if not clips:
+            return []
+        with torch.inference_mode():
+            segments, _ = self._whisper.transcribe(
+                audio,
+                language=self._cfg.SRC_LANG,
+                clip_timestamps=clips,
+                batch_size=self._batch_size,
+            )
+            return [
+                (seg.start, seg.end, seg.text.strip())
+                for seg in segments
+                if seg.text.strip()
+            ]
+
+    def cache_items(self) -> list:
+        """Translation cache entries of the worker (none if transcribe only)."""
+        return self._translator.cache_items() if self._translator else []
+
+    def close(self):
+        if self._translator is not None:
+            self._translator.save_cache()
+
+
+def _init_worker(cfg: Config, batch_size: int):
+    global _worker
+    _worker = _FileWorker(cfg, batch_size)
+
+
+def _process_in_worker(path: str, output_path: str) -> tuple:
+    """Process a file. Returns its output path and the worker's cache entries."""
+    return _worker.process(path, output_path), _worker.cache_items()
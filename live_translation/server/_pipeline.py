@@ -2,34 +2,74 @@
 
 import os
 import multiprocessing as mp
+import queue
 import signal
-import time
+import threading
 from ._ws import WebSocketIO
+from ._metrics import MetricsServer, PipelineStats
+from ._startup import StartupMonitor
 from .._audio._processor import AudioProcessor
+from .._audio._shm import SegmentArena, SharedAudioRing
 from .._transcription._transcriber import Transcriber
 from .._translation._translator import Translator
 from . import config
 
 
 class PipelineManager:
+    # Seconds of raw audio the shared-memory ring can hold (ipc_transport='shm')
+    RAW_RING_SECONDS = 10
+    # Speech segments that can be in flight in the shared-memory arena at once
+    SEGMENT_SLOTS = 8
+
     def __init__(self, cfg: config.Config):
         """
         Initialize config, queues, stop event, thread, and processes.
         """
         self._cfg = cfg
 
-        # Multiprocessing context and manager
+        # Multiprocessing context. A native event is checked without a round-trip
+        # to a manager process. Stages don't poll it: they block on their input
+        # queue and are woken up by a `None` sentinel on shutdown.
         ctx = mp.get_context()
-        self._manager = ctx.Manager()
-        self._stop_event = self._manager.Event()
+        self._stop_event = ctx.Event()
         self._parent_pid = os.getpid()
 
         # Queues for inter-process communication
-        self._raw_audio_queue = mp.Queue()
-        self._processed_audio_queue = mp.Queue()
+        if self._cfg.IPC_TRANSPORT == "shm":
+            # Ring holds up to RAW_RING_SECONDS of audio before dropping frames
+            ring_frames = int(
+                self.RAW_RING_SECONDS * self._cfg.SAMPLE_RATE / self._cfg.CHUNK_SIZE
+            )
+            self._raw_audio_queue = SharedAudioRing(ring_frames, self._cfg.CHUNK_SIZE)
+            # A segment is at most MAX_BUFFER_DURATION plus the chunk that
+            # triggered its trimming
+            slot_size = (
+                self._cfg.MAX_BUFFER_DURATION * self._cfg.SAMPLE_RATE
+                + self._cfg.CHUNK_SIZE
+            )
+            # Each transcriber worker may hold a segment while more are queued
+            slots = max(self.SEGMENT_SLOTS, 2 * self._cfg.TRANSCRIBER_WORKERS)
+            self._segment_arena = SegmentArena(slots, slot_size)
+        else:
+            self._raw_audio_queue = mp.Queue()
+            self._segment_arena = None
+        # Bounded with `processed_queue_size`, so a slow transcriber sheds load
+        # instead of falling further behind, see `overload_policy`
+        self._processed_audio_queue = mp.Queue(self._cfg.PROCESSED_QUEUE_SIZE)
         self._transcription_queue = mp.Queue()
         self._output_queue = mp.Queue()
 
+        # Stats shared by the stages, only collected with a metrics listener
+        self._stats = PipelineStats(ctx) if self._cfg.METRICS_PORT else None
+
+        # Stages report themselves ready on this queue once their models are
+        # loaded, and `_ready_event` is set once all of them are
+        self._ready_queue = ctx.Queue()
+        self._ready_event = threading.Event()
+        # Set once startup is over, ready or not
+        self._startup_done = threading.Event()
+        self._startup = None
+
         # Thread
         self.ws_io = WebSocketIO(
             self._cfg.WS_PORT,
@@ -37,6 +77,8 @@ class PipelineManager:
             self._output_queue,
             self._stop_event,
             self._cfg,
+            ready_event=self._ready_event,
+            startup_done=self._startup_done,
         )
         # Processes
         self._audio_processor = AudioProcessor(
@@ -44,15 +86,29 @@ class PipelineManager:
             self._processed_audio_queue,
             self._stop_event,
             self._cfg,
+            arena=self._segment_arena,
+            stats=self._stats,
+            ready_queue=self._ready_queue,
         )
 
-        self._transcriber = Transcriber(
-            self._processed_audio_queue,
-            self._transcription_queue,
-            self._stop_event,
-            self._cfg,
-            self._output_queue,
-        )
+        # Transcriber workers share the processed queue and number segments
+        # through a shared counter so their output can be put back in order
+        self._segment_seq = ctx.Value("q", 0)
+        self._transcribers = [
+            Transcriber(
+                self._processed_audio_queue,
+                self._transcription_queue,
+                self._stop_event,
+                self._cfg,
+                self._output_queue,
+                arena=self._segment_arena,
+                worker_id=i,
+                seq_counter=self._segment_seq,
+                stats=self._stats,
+                ready_queue=self._ready_queue,
+            )
+            for i in range(self._cfg.TRANSCRIBER_WORKERS)
+        ]
 
         if not self._cfg.TRANSCRIBE_ONLY:
             self._translator = Translator(
@@ -60,24 +116,57 @@ class PipelineManager:
                 self._stop_event,
                 self._cfg,
                 self._output_queue,
+                stats=self._stats,
+                ready_queue=self._ready_queue,
             )
 
         # List of pipeline components
         self._threads = [self.ws_io]
-        self._processes = [self._audio_processor, self._transcriber]
+        self._processes = [self._audio_processor, *self._transcribers]
         if not self._cfg.TRANSCRIBE_ONLY:
             self._processes.append(self._translator)
 
+        # Processes by the name they report themselves ready with
+        self._stages = {"audio_processor": self._audio_processor}
+        self._stages.update(
+            (f"transcriber_{i}", t) for i, t in enumerate(self._transcribers)
+        )
+        if not self._cfg.TRANSCRIBE_ONLY:
+            self._stages["translator"] = self._translator
+
+        if self._stats is not None:
+            self._metrics = MetricsServer(
+                self._cfg.METRICS_PORT,
+                self._stop_event,
+                self._stats,
+                {
+                    "raw": self._raw_audio_queue,
+                    "processed": self._processed_audio_queue,
+                    "transcription": self._transcription_queue,
+                    "output": self._output_queue,
+                },
+                self._stages,
+                self.ws_io,
+            )
+            self._threads.append(self._metrics)
+
     def signal_handler(self, sig, frame):
         """Handle Ctrl+C: Parent process only should handles it."""
         if os.getpid() != self._parent_pid:
             return  # Ignore SIGINT in child processes
 
         print("\n🛑 Stopping the pipeline...\n")
-        self._stop_event.set()
+        # The handler runs on the thread waiting on the event in run(). Setting
+        # an `mp.Event` waits for its waiters to wake up, so set it from another
+        # thread.
+        threading.Thread(target=self._stop_event.set, daemon=True).start()
 
-    def _start_pipeline(self):
-        """Start the audio thread and processes."""
+    def _start_pipeline(self, on_ready=None):
+        """
+        Start the audio thread and processes. The processes load their models
+        in parallel, and a `StartupMonitor` reports when all of them are ready
+        (the WebSocket listener waits for it).
+        """
         print("🚀 Starting the pipeline...")
 
         # Register all components as daemon processes
@@ -94,6 +183,18 @@ class PipelineManager:
         for process in self._processes:
             process.start()
 
+        self._startup = StartupMonitor(
+            self._ready_queue,
+            self._stages,
+            self._stop_event,
+            self._ready_event,
+            on_ready,
+            done_event=self._startup_done,
+        )
+        self._startup.daemon = True
+        self._startup.start()
+        self._threads.append(self._startup)
+
     def _stop_pipeline(self):
         """Gracefully stop all components."""
 
@@ -101,8 +202,21 @@ class PipelineManager:
         for thread in self._threads:
             thread.join(timeout=5)
 
-        for process in self._processes:
-            process.join(timeout=5)
+        # Wake each stage up with a sentinel once the stages before it stopped,
+        # so it exits right after the work already queued for it
+        self._raw_audio_queue.put(None)
+        self._audio_processor.join(timeout=5)
+        for _ in self._transcribers:
+            try:
+                # The queue is bounded, don't wait forever on a stuck worker
+                self._processed_audio_queue.put(None, timeout=5)
+            except queue.Full:
+                break
+        for transcriber in self._transcribers:
+            transcriber.join(timeout=5)
+        if not self._cfg.TRANSCRIBE_ONLY:
+            self._transcription_queue.put(None)
+            self._translator.join(timeout=5)
 
         # Forcefully terminate any stuck processes
         for process in self._processes:
@@ -113,27 +227,49 @@ class PipelineManager:
                 )
                 process.terminate()
 
+        # Release shared memory once no stage is attached to it anymore
+        if isinstance(self._raw_audio_queue, SharedAudioRing):
+            if self._raw_audio_queue.dropped:
+                print(
+                    f"🚨 Shared-memory ring dropped {self._raw_audio_queue.dropped} "
+                    "audio frames (audio processor fell behind)."
+                )
+            self._raw_audio_queue.close()
+        if self._segment_arena is not None:
+            self._segment_arena.close()
+
         print("✅ All server pipeline processes stopped.")
 
-    def run(self):
-        """Run the pipeline manager and handle shutdown signals."""
+    def run(self, on_ready=None):
+        """
+        Run the pipeline manager and handle shutdown signals.
+        `on_ready` is called with the load time (s) of each stage once the
+        pipeline is ready.
+        """
         # Register signal handler only in the parent process
         if os.getpid() == self._parent_pid:
             signal.signal(signal.SIGINT, self.signal_handler)
 
         try:
-            self._start_pipeline()
+            self._start_pipeline(on_ready)
 
-            while not self._stop_event.is_set():
-                time.sleep(0.1)
+            # Blocks until Ctrl+C or stop(), see signal_handler()
+            self._stop_event.wait()
         finally:
             self._stop_pipeline()
 
-    def run_async(self):
+    def run_async(self, on_ready=None):
         """Run the pipeline manager for non-blocking execution."""
-        self._start_pipeline()
+        self._start_pipeline(on_ready)
         return self
 
+    def wait_ready(self, timeout: float = None) -> bool:
+        """
+        Block until every stage has loaded its models and the server accepts
+        clients. Returns False on timeout.
+        """
+        return self._ready_event.wait(timeout)
+
     def stop(self):
         """Stop the pipeline."""
         self._stop_event.set()
@@ -0,0 +1,109 @@
+# server/_startup.py
+
+import queue
+import threading
+import time
+import numpy as np
+
+# Fixed sentence translated by the translator's warm-up pass
+WARMUP_SENTENCE = "This sentence warms the translation model up before real speech."
+
+
+def warmup_audio(sample_rate: int) -> np.ndarray:
+    """
+    Synthetic utterance run through the VAD and Whisper by the warm-up pass:
+    0.5s of silence, 1s of a voiced-like tone (220 Hz and its harmonics) and
+    0.5s of silence, as float32.
+    """
+    silence = np.zeros(sample_rate // 2, dtype=np.float32)
+    t = np.arange(sample_rate, dtype=np.float32) / sample_rate
+    tone = sum(np.sin(2 * np.pi * 220 * k * t) / k for k in (1, 2, 3)) * np.float32(0.2)
+    return np.concatenate([silence, tone.astype(np.float32), silence])
+
+
+def report_ready(ready_queue, name: str, started: float, warmup: float = None):
+    """
+    Report a pipeline stage as ready, with the time (s) it took to load since
+    `started` (a `time.monotonic()` value) and the duration (s) of its warm-up
+    pass if any. No-op without a ready queue.
+    """
+    if ready_queue is not None:
+        ready_queue.put((name, time.monotonic() - started, warmup))
+
+
+class StartupMonitor(threading.Thread):
+    """
+    Waits for every pipeline stage to report itself ready (see `report_ready()`),
+    then prints the startup timing report, sets `ready_event` and calls
+    `on_ready` with the load time of each stage. `done_event` is set once it
+    stops waiting, whether the pipeline is ready or stopped while starting.
+
+    Stages load their models in parallel in their own processes, and warm them
+    up before reporting ready (the load time includes the warm-up). A stage
+    that exits before reporting ready stops the pipeline.
+    """
+
+    def __init__(
+        self,
+        ready_queue,
+        stages: dict,
+        stop_event: threading.Event,
+        ready_event: threading.Event,
+        on_ready=None,
+        done_event: threading.Event = None,
+    ):
+        """`stages` maps the name each stage reports to its process."""
+        super().__init__()
+        self._ready_queue = ready_queue
+        self._stages = stages
+        self._stop_event = stop_event
+        self._ready_event = ready_event
+        self._on_ready = on_ready
+        self._done_event = done_event
+        self.durations = {}  # Stage name -> load time (s)
+        self.warmups = {}  # Stage name -> warm-up duration (s), if warmed up
+
+    def run(self):
+        try:
+            self._wait_ready()
+        finally:
+            if self._done_event is not None:
+                self._done_event.set()
+
+    def _wait_ready(self):
+        started = time.monotonic()
+        pending = set(self._stages)
+        while pending and not self._stop_event.is_set():
+            try:
+                name, seconds, warmup = self._ready_queue.get(timeout=0.5)
+            except queue.Empty:
+                failed = [n for n in pending if not self._stages[n].is_alive()]
+                if failed:
+                    print(
+                        f"🚨 Startup: {', '.join(sorted(failed))} stopped before "
+                        "being ready. Stopping the pipeline."
+                    )
+                    self._stop_event.set()
+                    return
+                continue
+            except (EOFError, OSError, ValueError):
+                return  # Queue closed
+            self.durations[name] = seconds
+            if warmup is not None:
+                self.warmups[name] = warmup
+            pending.discard(name)
+
+        if pending:
+            return  # Stopped while starting
+
+        for name in self._stages:
+            warmup = self.warmups.get(name)
+            detail = "" if warmup is None else f" (warm-up {warmup:.2f}s)"
+            print(f"⏱️ Startup: {name} loaded in {self.durations[name]:.2f}s{detail}")
+        print(f"✅ Pipeline ready in {time.monotonic() - started:.2f}s")
+        self._ready_event.set()
+        if self._on_ready is not None:
+            try:
+                self._on_ready(dict(self.durations))
+            except Exception as e:
+                print(f"🚨 Startup: on_ready callback error: {e}")
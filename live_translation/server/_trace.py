@@ -0,0 +1,97 @@
+# server/_trace.py
+
+import bisect
+import time
+
+# Pipeline stages as (name, start stamp, end stamp). Stamps are `time.monotonic()`
+# values, which share one system-wide clock across the pipeline's processes.
+STAGES = (
+    ("decode", "received", "decoded"),
+    ("vad", "decoded", "vad"),
+    ("buffer", "vad", "enqueued"),
+    ("transcribe_wait", "enqueued", "transcribe_start"),
+    ("transcribe", "transcribe_start", "transcribe_end"),
+    ("translate_wait", "transcribe_end", "translate_start"),
+    ("translate", "translate_start", "translate_end"),
+    ("total", "received", "sent"),
+)
+
+# Upper bounds (ms) of the latency histogram buckets
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+def stamp(trace: dict | None, name: str) -> dict | None:
+    """Record the current time as `name` on a trace (no-op without a trace)."""
+    if trace is not None:
+        trace[name] = time.monotonic()
+    return trace
+
+
+def breakdown(trace: dict) -> dict:
+    """Return the duration (ms) of each stage the trace has both stamps of."""
+    return {
+        f"{name}_ms": round((trace[end] - trace[start]) * 1000, 2)
+        for name, start, end in STAGES
+        if start in trace and end in trace
+    }
+
+
+class LatencyHistograms:
+    """
+    Per-stage latency histograms, aggregated from trace breakdowns.
+    Buckets are cumulative counts of durations up to each bound in `BUCKETS_MS`,
+    like Prometheus histograms.
+    """
+
+    def __init__(self):
+        self._counts = {}  # Stage -> count per bucket (+1 for overflow)
+        self._sums = {}  # Stage -> sum of durations (ms)
+
+    def record(self, durations: dict):
+        """Add the durations of a `breakdown()`."""
+        for key, ms in durations.items():
+            stage = key.removesuffix("_ms")
+            counts = self._counts.setdefault(stage, [0] * (len(BUCKETS_MS) + 1))
+            counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+            self._sums[stage] = self._sums.get(stage, 0.0) + ms
+
+    def stages(self) -> list:
+        """Recorded stages, in pipeline order."""
+        return [name for name, _, _ in STAGES if name in self._counts]
+
+    def count(self, stage: str) -> int:
+        return sum(self._counts.get(stage, ()))
+
+    def total(self, stage: str) -> float:
+        return self._sums.get(stage, 0.0)
+
+    def cumulative(self, stage: str) -> list:
+        """Cumulative counts up to each bound of `BUCKETS_MS`, then overall."""
+        counts, running = [], 0
+        for n in self._counts.get(stage, [0] * (len(BUCKETS_MS) + 1)):
+            running += n
+            counts.append(running)
+        return counts
+
+    def percentile(self, stage: str, q: float) -> float:
+        """Upper bound (ms) of the bucket holding the `q` quantile (0-1)."""
+        cumulative = self.cumulative(stage)
+        if not cumulative[-1]:
+            return 0.0
+        rank = q * cumulative[-1]
+        for bound, n in zip(BUCKETS_MS, cumulative):
+            if n >= rank:
+                return float(bound)
+        return float("inf")
+
+    def report(self):
+        """Print a summary of each stage."""
+        for stage in self.stages():
+            count = self.count(stage)
+            print(
+                f"⏱️ Latency {stage}: n={count}, "
+                f"mean={self.total(stage) / count:.1f} ms, "
+                f"p50<={self.percentile(stage, 0.5):g} ms, "
+                f"p95<={self.percentile(stage, 0.95):g} ms, "
+                f"p99<={self.percentile(stage, 0.99):g} ms"
+            )
@@ -1,35 +1,90 @@
 # _ws.py
 
 import asyncio
+import itertools
+import queue
 import threading
 import json
 import time
 import numpy as np
 import websockets
 from ._logger import OutputLogger
+from ._trace import LatencyHistograms, breakdown, stamp
 from .._audio._codec import OpusCodec
+from .._audio._shm import SharedAudioRing
+from .._transcription._reorder import SequenceReorderer
 
 
 class WebSocketIO(threading.Thread):
     """
-    WebSocket handler for a single client.
+    WebSocket handler for up to `max_sessions` clients (a single one by default).
     - Receives audio from the client and pushes to audio_queue
     - Sends transcription/translation from output_queue to client
     - Optionally logs output to file or print
+
+    NOTE: In transcribe only mode with several transcriber workers, entries come
+    straight from the workers and are put back in order by their `seq` here.
+
+    NOTE: With more than one session, each client gets a session id. Its audio
+    is pushed as `(session_id, audio)` and `(session_id, None)` when it
+    disconnects. Output entries carry their `session` and are routed to that
+    client's pending output only.
+
+    NOTE: Output is pushed into the event loop by a bridge thread blocking on
+    `output_queue` (see `_bridge_output()`), so entries are sent as soon as they
+    are produced instead of being polled for.
+
+    NOTE: With a `ready_event`, the listener only accepts clients once it is
+    set, i.e. once every stage has loaded its models (see `StartupMonitor`), so
+    no audio piles up in the queues while the pipeline is starting. It waits
+    for `startup_done`, set once startup is over, ready or not.
+
+    NOTE: With tracing, each audio frame gets a trace stamped when it is
+    received and decoded, and is pushed as `(session_id, audio, trace)`. Output
+    entries come back with the trace stamped by every stage. Their per-stage
+    breakdown is sent to the client as `trace` and aggregated in histograms that
+    are printed on shutdown.
     """
 
-    def __init__(self, port, audio_queue, output_queue, stop_event, cfg):
+    def __init__(
+        self,
+        port,
+        audio_queue,
+        output_queue,
+        stop_event,
+        cfg,
+        ready_event=None,
+        startup_done=None,
+    ):
         super().__init__()
         self._port = port
         self._audio_queue = audio_queue
         self._output_queue = output_queue
         self._stop_event = stop_event
+        self._ready_event = ready_event
+        self._startup_done = startup_done
+        # send_output() task of each connected client, cancelled on stop
+        self._senders = set()
         self._loop = None
         self._logger = OutputLogger(cfg) if cfg.LOG else None
         self._opus = OpusCodec(cfg) if cfg.CODEC == "opus" else None
         self._connection_lock = asyncio.Lock()
+        self._max_sessions = cfg.MAX_SESSIONS
+        # Output entries waiting to be sent (single session)
+        self._output = asyncio.Queue()
+        # Session id -> output entries waiting to be sent (multi-session only)
+        self._sessions = {}
+        self._session_ids = itertools.count()
+        self._latency = LatencyHistograms() if cfg.TRACE else None
+        self._reorderer = (
+            SequenceReorderer()
+            if cfg.TRANSCRIBE_ONLY and cfg.TRANSCRIBER_WORKERS > 1
+            else None
+        )
 
     def run(self):
+        if not self._wait_ready():
+            return  # Stopped while the pipeline was starting
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         while not self._stop_event.is_set():
@@ -39,14 +94,19 @@ class WebSocketIO(threading.Thread):
             except Exception as e:
                 print(f"🚨 WebSocketIO error: {e}. Retrying in 2 seconds...")
                 time.sleep(2)
+        if self._latency is not None:
+            self._latency.report()
 
     async def _start_server(self):
         async def handler(websocket):
+            sid = None  # Single session: audio and output are untagged
+
             # Helper functions to handle audio reception, output sending, and heartbeat
             async def receive_audio():
                 try:
                     async for message in websocket:
                         if isinstance(message, bytes):
+                            trace = stamp({}, "received") if self._latency else None
                             # Decode the audio message if opus codec is used
                             if self._opus:
                                 try:
@@ -58,28 +118,27 @@ class WebSocketIO(threading.Thread):
                                 # Default to raw PCM audio
                                 audio = np.frombuffer(message, dtype=np.int16)
 
-                            self._audio_queue.put(audio)
+                            self._put_audio(sid, audio, stamp(trace, "decoded"))
                 except Exception as e:
                     print(f"🚨 WebSocketIO: receive_audio() error: {e}")
 
             async def send_output():
+                output = self._output if sid is None else self._sessions[sid]
                 try:
-                    while not self._stop_event.is_set():
-                        if not self._output_queue.empty():
-                            entry = self._output_queue.get()
-                            try:
-                                await websocket.send(
-                                    json.dumps(entry, ensure_ascii=False)
-                                )
-                                if self._logger:
-                                    self._logger.write(entry)
-                            except websockets.ConnectionClosed:
-                                print(
-                                    "🚨 WebSocketIO: Trying to send output on "
-                                    "a closed connection"
-                                )
-                                break
-                        await asyncio.sleep(0.01)
+                    while True:
+                        entry = await output.get()
+                        if self._latency is not None and "trace" in entry:
+                            entry["trace"] = self._finish_trace(entry["trace"])
+                        try:
+                            await websocket.send(json.dumps(entry, ensure_ascii=False))
+                            if self._logger:
+                                self._logger.write(entry)
+                        except websockets.ConnectionClosed:
+                            print(
+                                "🚨 WebSocketIO: Trying to send output on "
+                                "a closed connection"
+                            )
+                            break
                 except Exception as e:
                     print(f"🚨 WebSocketIO: send_output() error: {e}")
 
@@ -91,24 +150,16 @@ class WebSocketIO(threading.Thread):
                 except websockets.ConnectionClosed:
                     raise ClientDisconnected("Client disconnected during heartbeat")
 
-            # Handler logic starts here
-            if self._connection_lock.locked():
-                print("🔒 WebSocketIO: Rejecting extra client.")
-                await websocket.close(
-                    code=1008, reason="\033[91mOnly one client allowed!\033[0m"
-                )
-                return
-
-            async with self._connection_lock:
-                print("🔌 WebSocketIO: Client connected.")
-
+            async def serve():
                 # Use asyncio.TaskGroup instead of asyncio.gather
                 # for better error handling and cancellation. See:
                 # https://docs.python.org/3/library/asyncio-task.html#running-tasks-concurrently # noqa: E501
                 try:
                     async with asyncio.TaskGroup() as tg:
                         tg.create_task(receive_audio())
-                        tg.create_task(send_output())
+                        sender = tg.create_task(send_output())
+                        self._senders.add(sender)
+                        sender.add_done_callback(self._senders.discard)
                         tg.create_task(heartbeat())
 
                 except* ClientDisconnected:
@@ -117,31 +168,166 @@ class WebSocketIO(threading.Thread):
                 except* Exception as e:
                     print(f"🚨 WebSocketIO handler error: {e}")
 
+            # Handler logic starts here
+            if self._max_sessions > 1:
+                if len(self._sessions) >= self._max_sessions:
+                    print("🔒 WebSocketIO: Rejecting extra client.")
+                    await websocket.close(
+                        code=1008,
+                        reason=(
+                            f"\033[91mOnly {self._max_sessions} clients allowed!\033[0m"
+                        ),
+                    )
+                    return
+
+                sid = next(self._session_ids)
+                self._sessions[sid] = asyncio.Queue()
+                print(f"🔌 WebSocketIO: Client connected (session {sid}).")
+                try:
+                    await serve()
+                finally:
+                    # Pending and late output of the session is dropped
+                    del self._sessions[sid]
+                    self._put_audio(sid, None)
+                return
+
+            if self._connection_lock.locked():
+                print("🔒 WebSocketIO: Rejecting extra client.")
+                await websocket.close(
+                    code=1008, reason="\033[91mOnly one client allowed!\033[0m"
+                )
+                return
+
+            async with self._connection_lock:
+                print("🔌 WebSocketIO: Client connected.")
+                await serve()
+
                 # Cleanup: flush queues on disconnect or error
                 self._flush_queues()
 
         # Start the WebSocket server and log immediately after successful bind
         server = None
+        loop = asyncio.get_running_loop()
+        bridge = threading.Thread(target=self._bridge_output, args=(loop,), daemon=True)
         try:
             server = await websockets.serve(handler, "0.0.0.0", self._port)
             print(
                 f"🌐 WebSocketIO: Listening on \033[91mws://0.0.0.0:{self._port}\033[0m"
             )
+            bridge.start()
             async with server:
-                while not self._stop_event.is_set():
-                    await asyncio.sleep(0.1)
+                # Wait for the stop event in a worker thread instead of polling it
+                await loop.run_in_executor(None, self._stop_event.wait)
+                # Senders wait on their output queue, wake them up to exit
+                for sender in self._senders:
+                    sender.cancel()
         finally:
             if server:
                 server.close()
                 await server.wait_closed()
+            if bridge.is_alive():
+                self._output_queue.put(None)  # Wake the bridge up
+                bridge.join(timeout=1)
+
+    def _wait_ready(self) -> bool:
+        """Wait for the pipeline to be ready. Returns False if stopped first."""
+        if self._ready_event is None:
+            return True
+        print("🌐 WebSocketIO: Waiting for the pipeline to be ready...")
+        (self._startup_done or self._ready_event).wait()
+        return self._ready_event.is_set()
+
+    @property
+    def session_count(self) -> int:
+        """Number of connected clients."""
+        if self._max_sessions > 1:
+            return len(self._sessions)
+        return int(self._connection_lock.locked())
+
+    @property
+    def latency(self) -> LatencyHistograms | None:
+        """Per-stage latency histograms (with tracing only)."""
+        return self._latency
+
+    def _put_audio(self, sid, audio, trace: dict = None):
+        """Push audio (None on disconnect), tagged with its session and trace."""
+        if self._latency is not None:
+            self._audio_queue.put((sid, audio, trace))
+        elif sid is None:
+            self._audio_queue.put(audio)
+        else:
+            self._audio_queue.put((sid, audio))
+
+    def _finish_trace(self, trace: dict) -> dict:
+        """Stamp a trace as sent and return its per-stage breakdown (ms)."""
+        durations = breakdown(stamp(trace, "sent"))
+        self._latency.record(durations)
+        return durations
+
+    def _ordered(self, entry: dict) -> list:
+        """
+        Return the entries ready to be sent after receiving `entry`, in order.
+        Sequence numbers are internal and not sent to the client, and empty
+        placeholders (without an unstable tail either) are dropped.
+        """
+        seq = entry.pop("seq", None)
+        if self._reorderer is not None and seq is not None:
+            entries = self._reorderer.push(seq, entry)
+        else:
+            entries = [entry]
+        return [e for e in entries if e["transcription"].strip() or e.get("unstable")]
+
+    def _bridge_output(self, loop: asyncio.AbstractEventLoop):
+        """
+        Bridge thread: block on the output queue and hand each entry to the
+        event loop as soon as it arrives. A `None` item stops the bridge.
+        """
+        while True:
+            try:
+                entry = self._output_queue.get()
+            except (EOFError, OSError, ValueError):
+                break  # Queue closed
+            if entry is None:
+                break
+            try:
+                loop.call_soon_threadsafe(self._dispatch_output, entry)
+            except RuntimeError:
+                break  # Event loop closed
+
+    def _dispatch_output(self, entry: dict):
+        """
+        Route an output entry to the client it belongs to (on the event loop).
+        Entries are dropped if their client is gone, or if no client is connected
+        with a single session. They are still ordered first, so that later ones
+        aren't held back.
+        """
+        for entry in self._ordered(entry):
+            sid = entry.pop("session", None)
+            if self._max_sessions == 1:
+                if self._connection_lock.locked():
+                    self._output.put_nowait(entry)
+            elif sid in self._sessions:
+                self._sessions[sid].put_nowait(entry)
 
     def _flush_queues(self):
-        """Flush the audio and output queues."""
+        """
+        Flush the pending output and the audio queue once the client is gone.
+        Runs on the event loop, so it never blocks on a queue other stages read
+        from. `output_queue` is only read by the bridge thread, and output that
+        arrives without a client is dropped, see `_dispatch_output()`.
+
+        NOTE: A `SharedAudioRing` has a single consumer (the `AudioProcessor`),
+        so its audio isn't flushed here. Frames left in it are processed as
+        usual.
+        """
         print("🧹 Flushing queues...")
-        while not self._output_queue.empty():
-            self._output_queue.get()
-        while not self._audio_queue.empty():
-            self._audio_queue.get()
+        while not self._output.empty():
+            self._output.get_nowait()
+        while not isinstance(self._audio_queue, SharedAudioRing):
+            try:
+                self._audio_queue.get_nowait()
+            except queue.Empty:
+                break
         print("🧹 Queues flushed.")
 
 
@@ -19,16 +19,39 @@ def main():
     cfg = Config(
         device=args.device,
         whisper_model=args.whisper_model,
+        compute_type=args.compute_type,
+        cpu_threads=args.cpu_threads,
+        num_workers=args.num_workers,
+        transcriber_workers=args.transcriber_workers,
         trans_model=args.trans_model,
+        trans_backend=args.trans_backend,
+        trans_compute_type=args.trans_compute_type,
+        trans_cache_size=args.trans_cache_size,
+        trans_cache_path=args.trans_cache_path,
+        translation_batch_size=args.translation_batch_size,
+        translation_batch_timeout_ms=args.translation_batch_timeout_ms,
         src_lang=args.src_lang,
         tgt_lang=args.tgt_lang,
         log=args.log,
         ws_port=args.ws_port,
+        max_sessions=args.max_sessions,
+        processed_queue_size=args.processed_queue_size,
+        overload_policy=args.overload_policy,
+        trace=args.trace,
+        metrics_port=args.metrics_port,
+        verify_model_online=args.verify_model_online,
+        warmup=not args.no_warmup,
         silence_threshold=args.silence_threshold,
         vad_aggressiveness=args.vad_aggressiveness,
+        vad_streaming=args.vad_streaming,
+        vad_pregate=args.vad_pregate,
+        vad_backend=args.vad_backend,
+        vad_model_path=args.vad_model_path,
         max_buffer_duration=args.max_buffer_duration,
         transcribe_only=args.transcribe_only,
         codec=args.codec,
+        ipc_transport=args.ipc_transport,
+        transcription_mode=args.transcription_mode,
     )
 
     # Run the app with the CLI configuration
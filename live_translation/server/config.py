@@ -1,8 +1,44 @@
 # server/config.py
 
-import torch
-import huggingface_hub as hf_hub
-import huggingface_hub.errors as hf_errors
+import os
+import functools
+from .._audio import _settings
+from .._translation._registry import is_known_pair
+
+# Translation models verified to exist, so each is only checked once per process
+_verified_models = set()
+
+
+def _model_is_cached(model_name: str) -> bool:
+    """Whether the model is in the local Hugging Face cache."""
+    # Imported here so that the stages that import the config don't load it
+    import huggingface_hub as hf_hub
+
+    try:
+        path = hf_hub.try_to_load_from_cache(model_name, "config.json")
+    except Exception:
+        return False
+    return isinstance(path, str)
+
+
+def _cuda_available() -> bool:
+    import torch
+
+    return torch.cuda.is_available()
+
+
+@functools.lru_cache
+def _supported_compute_types(device: str) -> frozenset | None:
+    """
+    CTranslate2 compute types supported on a device, or None if CTranslate2
+    can't query it (e.g. a build or driver without CUDA).
+    """
+    import ctranslate2
+
+    try:
+        return frozenset(ctranslate2.get_supported_compute_types(device))
+    except RuntimeError:
+        return None
 
 
 class Config:
@@ -60,6 +96,145 @@ class Config:
 
         codec (str): Audio codec for WebSocket communication ('pcm', 'opus').
             Default is 'pcm'.
+
+        ipc_transport (str): Transport used to move audio between pipeline stages
+            ('queue', 'shm').
+            - 'queue': Pickle raw audio chunks and speech segments through
+            multiprocessing queues.
+            - 'shm': Copy raw audio chunks into a shared-memory ring buffer and
+            hand speech segments to the transcriber through a shared-memory
+            arena, sending only small descriptors through the queue.
+            Default is 'queue'.
+
+        vad_streaming (bool): Whether to run VAD as a continuous stream. Samples
+            that don't fill a whole VAD frame are carried over to the next chunk,
+            so every sample is scored exactly once and the model's state follows
+            the stream. Default is False (each chunk is scored on its own).
+
+        vad_pregate (bool): Whether to run a cheap energy/zero-crossing-rate check
+            with an adaptive noise floor before VAD. Chunks that are obviously
+            silent are not scored by the VAD model. Default is False.
+
+        vad_backend (str): Inference backend for the Silero VAD model
+            ('torch', 'onnx').
+            - 'torch': Load the model with PyTorch (through `torch.hub` unless
+            `vad_model_path` is set).
+            - 'onnx': Run the model with ONNX Runtime. Uses the Silero weights
+            bundled with faster-whisper unless `vad_model_path` is set, so it
+            starts without network access and without loading torch.
+            Default is 'torch'.
+
+        vad_model_path (str): Optional local path to the VAD model weights.
+            - 'torch': A TorchScript file or a local clone of silero-vad.
+            - 'onnx': A `silero_vad.onnx` file or a directory holding
+            `silero_encoder_v5.onnx` and `silero_decoder_v5.onnx`.
+            Default is None (see `vad_backend`).
+
+        transcription_mode (str): How speech is transcribed ('window', 'incremental').
+            - 'window': The whole speech buffer (up to `max_buffer_duration`) is
+            transcribed again for every second of new speech.
+            - 'incremental': Only new audio is sent to the transcriber, which
+            commits words once two consecutive transcriptions agree on them
+            (local agreement), and never transcribes committed audio again.
+            Output only holds newly committed text, plus the 'unstable' tail in
+            transcribe only mode.
+            Default is 'window'.
+
+        compute_type (str): CTranslate2 compute type for Whisper inference
+            (e.g. 'float32', 'int8', 'int8_float32', 'float16', 'default').
+            Quantized types like 'int8' are much faster on CPU with a small
+            accuracy loss. Must be supported by the CTranslate2 build on the
+            selected device. Default is 'float32'.
+
+        cpu_threads (int): Number of threads used by Whisper on CPU.
+            0 uses the CTranslate2 default (4, or OMP_NUM_THREADS if set).
+            With several transcriber workers, this is the total budget split
+            between them (all cores if 0). Default is 0.
+
+        num_workers (int): Number of Whisper model workers, allowing that many
+            transcriptions to run in parallel. Default is 1.
+
+        transcriber_workers (int): Number of Transcriber processes consuming speech
+            segments in parallel. Output order is restored before translation and
+            delivery. NOTE: 'incremental' transcription mode requires 1 worker.
+            Default is 1.
+
+        translation_batch_size (int): Max number of queued transcriptions the
+            translator translates together in one batch. Default is 1 (no
+            batching).
+
+        translation_batch_timeout_ms (int): Max time in milliseconds the
+            translator waits for more transcriptions once it has one, when
+            batching. Default is 50.
+
+        trans_backend (str): Inference backend for the translation model
+            ('transformers', 'ctranslate2').
+            - 'transformers': PyTorch `transformers` in float32.
+            - 'ctranslate2': CTranslate2, typically several times faster on CPU.
+            The model is converted once and cached in
+            `~/.cache/live_translation/ct2`.
+            Default is 'transformers'.
+
+        trans_compute_type (str): CTranslate2 compute type for translation
+            (e.g. 'int8', 'int8_float32', 'float32', 'default'). Only used by
+            the 'ctranslate2' backend. Default is 'int8'.
+
+        trans_cache_size (int): Max number of translations kept in the
+            translator's LRU cache. 0 disables caching. Default is 1024.
+
+        trans_cache_path (str): Optional JSON file to persist the translation
+            cache to on shutdown and load it from on startup.
+            Default is None (in-memory only).
+
+        max_sessions (int): Max number of clients served at once. Each client
+            gets its own session with its own VAD and audio buffer state, while
+            the transcriber and translator processes (and their models) are
+            shared. NOTE: More than 1 session requires the 'queue' IPC transport
+            and 'window' transcription mode. Default is 1.
+
+        processed_queue_size (int): Max speech segments waiting for the
+            transcriber, so a transcriber behind real time sheds load (see
+            `overload_policy`) instead of falling further behind. 0 makes the
+            queue unbounded. Default is 0.
+
+        overload_policy (str): What the audio processor does with a new speech
+            segment while the processed queue is full (the transcriber is
+            behind real time):
+            - 'coalesce': Hold the newest segment of each session back and send
+              it once there is room. Each new segment supersedes the held one
+              (its buffer is a superset), or is appended to it in 'incremental'
+              mode. The superseded segments are shed.
+            - 'drop': Drop new partial segments. Segments ending an utterance
+              are still sent. Requires 'window' transcription mode.
+            - 'downshift': Like 'coalesce', and also double the session's
+              enqueue interval while the queue is full, then restore it as the
+              transcriber catches up.
+            - 'block': Wait for room, so nothing is shed.
+            Only used with a bounded `processed_queue_size`. Default is 'block'.
+
+        trace (bool): Whether to trace the latency of each pipeline stage
+            (decode, VAD, queueing, transcription and translation). The
+            breakdown is added to each output entry as `trace` and per-stage
+            histograms are printed on shutdown. NOTE: Requires the 'queue' IPC
+            transport. Default is False.
+
+        metrics_port (int): Optional port of an HTTP listener serving pipeline
+            metrics in the Prometheus text format on `/metrics` (queue depths,
+            VAD, Whisper real-time factor, translation latency, cache, process
+            RSS/CPU and sessions). Process metrics need `psutil`, see the
+            'metrics' extra. Default is None (no metrics).
+
+        verify_model_online (bool): Whether to look the translation model up on
+            Hugging Face when its language pair is neither in the registry of
+            known OpusMT pairs nor in the local Hugging Face cache. Validation is
+            otherwise network-free, and each model is only checked once per
+            process. Default is False.
+
+        warmup (bool): Whether each pipeline stage runs a synthetic utterance
+            through its models (VAD, Whisper, translation) at startup, before
+            reporting ready, so the first real utterance doesn't pay for lazy
+            allocations and thread pool spin-up. The duration is printed in
+            the startup report. Default is True.
     """
 
     def __init__(
@@ -76,6 +251,29 @@ class Config:
         max_buffer_duration: int = 7,
         transcribe_only: bool = False,
         codec: str = "opus",
+        ipc_transport: str = "queue",
+        vad_streaming: bool = False,
+        vad_pregate: bool = False,
+        vad_backend: str = "torch",
+        vad_model_path: str = None,
+        transcription_mode: str = "window",
+        compute_type: str = "float32",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        transcriber_workers: int = 1,
+        translation_batch_size: int = 1,
+        translation_batch_timeout_ms: int = 50,
+        trans_backend: str = "transformers",
+        trans_compute_type: str = "int8",
+        trans_cache_size: int = 1024,
+        trans_cache_path: str = None,
+        max_sessions: int = 1,
+        processed_queue_size: int = 0,
+        overload_policy: str = "block",
+        trace: bool = False,
+        metrics_port: int = None,
+        verify_model_online: bool = False,
+        warmup: bool = True,
     ):
         """
         Initialize the configuration.
@@ -83,9 +281,9 @@ class Config:
 
         # Immutable Settings
         # Audio Settings, not all are modifiable for now
-        self._CHUNK_SIZE = 640  # 40 ms of audio at 16 kHz
-        self._SAMPLE_RATE = 16000  # 16 kHz
-        self._CHANNELS = 1  # Mono
+        self._CHUNK_SIZE = _settings.CHUNK_SIZE  # 40 ms of audio at 16 kHz
+        self._SAMPLE_RATE = _settings.SAMPLE_RATE  # 16 kHz
+        self._CHANNELS = _settings.CHANNELS  # Mono
         # Audio Processing Settings, not modifiable for now
         # Audio lentgh in seconds to trigger ENQUEUE that is
         # (send for transcription/translation)
@@ -111,6 +309,29 @@ class Config:
         self.MAX_BUFFER_DURATION = max_buffer_duration
         self.TRANSCRIBE_ONLY = transcribe_only
         self.CODEC = codec
+        self.IPC_TRANSPORT = ipc_transport
+        self.VAD_STREAMING = vad_streaming
+        self.VAD_PREGATE = vad_pregate
+        self.VAD_BACKEND = vad_backend
+        self.VAD_MODEL_PATH = vad_model_path
+        self.TRANSCRIPTION_MODE = transcription_mode
+        self.COMPUTE_TYPE = compute_type
+        self.CPU_THREADS = cpu_threads
+        self.NUM_WORKERS = num_workers
+        self.TRANSCRIBER_WORKERS = transcriber_workers
+        self.TRANSLATION_BATCH_SIZE = translation_batch_size
+        self.TRANSLATION_BATCH_TIMEOUT_MS = translation_batch_timeout_ms
+        self.TRANS_BACKEND = trans_backend
+        self.TRANS_COMPUTE_TYPE = trans_compute_type
+        self.TRANS_CACHE_SIZE = trans_cache_size
+        self.TRANS_CACHE_PATH = trans_cache_path
+        self.MAX_SESSIONS = max_sessions
+        self.PROCESSED_QUEUE_SIZE = processed_queue_size
+        self.OVERLOAD_POLICY = overload_policy
+        self.TRACE = trace
+        self.METRICS_PORT = metrics_port
+        self.VERIFY_MODEL_ONLINE = verify_model_online
+        self.WARMUP = warmup
 
         # Validate
         self._validate()
@@ -118,23 +339,6 @@ class Config:
     def _validate(self):
         """Validate arguments before applying them."""
 
-        # Validate OpusMT translation model and language pair if not transcribe only
-        if not self.TRANSCRIBE_ONLY:
-            model_name = f"{self.TRANS_MODEL}-{self.SRC_LANG}-{self.TGT_LANG}"
-            try:
-                hf_hub.model_info(model_name)  # Check if the model exists
-            except hf_errors.RepositoryNotFoundError:
-                raise ValueError(
-                    f"\n🚨 The model for the language pair "
-                    f"'{self.SRC_LANG}-{self.TGT_LANG}' could not be found. "
-                    "Ensure the language pair is supported by OpusMT on "
-                    "Hugging Face (Helsinki-NLP models)."
-                )
-            except Exception as e:
-                raise ValueError(
-                    f"🚨 An error when verifying the translation model: {str(e)}"
-                )
-
         # Validate silence_threshold (must be greater than or equal 1.5)
         if self.SILENCE_THRESHOLD < 1.5:
             raise ValueError(
@@ -155,8 +359,9 @@ class Config:
         if self.DEVICE not in ["cpu", "cuda"]:
             raise ValueError("🚨 'device' must be either 'cpu' or 'cuda'.")
 
-        # Validate CUDA availability
-        if self.DEVICE == "cuda" and not torch.cuda.is_available():
+        # Validate CUDA availability. torch is only imported for 'cuda', so that
+        # the stages that import the config don't load it.
+        if self.DEVICE == "cuda" and not _cuda_available():
             raise ValueError(
                 "🚨 'cuda' device is not available. "
                 "Please use 'cpu' or check your CUDA installation.\n"
@@ -166,6 +371,107 @@ class Config:
                 "https://download.pytorch.org/whl/cu126`"
             )
 
+        # Validate compute types against the CTranslate2 build, if it can tell.
+        # Otherwise, unsupported types fail when the models are loaded.
+        device_types = _supported_compute_types(self.DEVICE)
+        supported = {"default", "auto"} | (device_types or set())
+        if device_types is not None and self.COMPUTE_TYPE not in supported:
+            raise ValueError(
+                f"🚨 'compute_type' '{self.COMPUTE_TYPE}' is not supported on "
+                f"'{self.DEVICE}'. Supported types: {sorted(supported)}. "
+            )
+
+        # Validate translation backend
+        if self.TRANS_BACKEND not in ["transformers", "ctranslate2"]:
+            raise ValueError(
+                "🚨 'trans_backend' must be one of the following: "
+                "'transformers', 'ctranslate2'. "
+            )
+        if (
+            self.TRANS_BACKEND == "ctranslate2"
+            and device_types is not None
+            and self.TRANS_COMPUTE_TYPE not in supported
+        ):
+            raise ValueError(
+                f"🚨 'trans_compute_type' '{self.TRANS_COMPUTE_TYPE}' is not "
+                f"supported on '{self.DEVICE}'. Supported types: {sorted(supported)}. "
+            )
+
+        # Validate Whisper threads and workers
+        if self.CPU_THREADS < 0:
+            raise ValueError("🚨 'cpu_threads' must be greater than or equal 0. ")
+        if self.NUM_WORKERS < 1:
+            raise ValueError("🚨 'num_workers' must be greater than or equal 1. ")
+
+        # Validate transcriber workers
+        if self.TRANSCRIBER_WORKERS < 1:
+            raise ValueError(
+                "🚨 'transcriber_workers' must be greater than or equal 1. "
+            )
+        if self.TRANSCRIPTION_MODE == "incremental" and self.TRANSCRIBER_WORKERS > 1:
+            raise ValueError(
+                "🚨 'incremental' transcription mode requires 1 transcriber worker, "
+                "since each utterance is transcribed as one stream. "
+            )
+
+        # Validate sessions
+        if self.MAX_SESSIONS < 1:
+            raise ValueError("🚨 'max_sessions' must be greater than or equal 1. ")
+        if self.MAX_SESSIONS > 1 and self.IPC_TRANSPORT != "queue":
+            raise ValueError(
+                "🚨 More than 1 session requires the 'queue' IPC transport, "
+                "since shared-memory audio isn't tagged with a session. "
+            )
+        if self.MAX_SESSIONS > 1 and self.TRANSCRIPTION_MODE != "window":
+            raise ValueError(
+                "🚨 More than 1 session requires 'window' transcription mode, "
+                "since 'incremental' mode keeps a single stream. "
+            )
+
+        # Validate backpressure settings
+        if self.PROCESSED_QUEUE_SIZE < 0:
+            raise ValueError(
+                "🚨 'processed_queue_size' must be greater than or equal 0. "
+            )
+        if self.OVERLOAD_POLICY not in ["coalesce", "drop", "downshift", "block"]:
+            raise ValueError(
+                "🚨 'overload_policy' must be one of the following: "
+                "'coalesce', 'drop', 'downshift', 'block'. "
+            )
+        if self.OVERLOAD_POLICY == "drop" and self.TRANSCRIPTION_MODE != "window":
+            raise ValueError(
+                "🚨 'drop' overload policy requires 'window' transcription mode, "
+                "since 'incremental' segments only hold new audio. "
+            )
+
+        # Validate tracing
+        if self.TRACE and self.IPC_TRANSPORT != "queue":
+            raise ValueError(
+                "🚨 'trace' requires the 'queue' IPC transport, "
+                "since shared-memory audio can't carry a trace. "
+            )
+
+        # Validate metrics port
+        if self.METRICS_PORT is not None:
+            if not 1 <= self.METRICS_PORT <= 65535:
+                raise ValueError("🚨 'metrics_port' must be between 1 and 65535. ")
+            if self.METRICS_PORT == self.WS_PORT:
+                raise ValueError("🚨 'metrics_port' must differ from 'ws_port'. ")
+
+        # Validate translation cache size
+        if self.TRANS_CACHE_SIZE < 0:
+            raise ValueError("🚨 'trans_cache_size' must be greater than or equal 0. ")
+
+        # Validate translation batching
+        if self.TRANSLATION_BATCH_SIZE < 1:
+            raise ValueError(
+                "🚨 'translation_batch_size' must be greater than or equal 1. "
+            )
+        if self.TRANSLATION_BATCH_TIMEOUT_MS < 0:
+            raise ValueError(
+                "🚨 'translation_batch_timeout_ms' must be greater than or equal 0. "
+            )
+
         # Validate whisper model
         if self.WHISPER_MODEL not in [
             "tiny",
@@ -193,6 +499,11 @@ class Config:
                 "'Helsinki-NLP/opus-mt', 'Helsinki-NLP/opus-mt-tc-big'. "
             )
 
+        # Validate OpusMT translation model and language pair if not transcribe
+        # only, once the model itself is known to be supported
+        if not self.TRANSCRIBE_ONLY:
+            self._validate_trans_model()
+
         # Validate logging method
         if self.LOG not in [None, "print", "file"]:
             raise ValueError("🚨 'log' must be one of the following: 'print', 'file'. ")
@@ -208,6 +519,85 @@ class Config:
         if self.CODEC not in ["pcm", "opus"]:
             raise ValueError("🚨 'codec' must be one of the following: 'pcm', 'opus'. ")
 
+        # Validate IPC transport
+        if self.IPC_TRANSPORT not in ["queue", "shm"]:
+            raise ValueError(
+                "🚨 'ipc_transport' must be one of the following: 'queue', 'shm'. "
+            )
+
+        # Validate VAD backend
+        if self.VAD_BACKEND not in ["torch", "onnx"]:
+            raise ValueError(
+                "🚨 'vad_backend' must be one of the following: 'torch', 'onnx'. "
+            )
+
+        # Validate VAD model path
+        if self.VAD_MODEL_PATH is not None and not os.path.exists(self.VAD_MODEL_PATH):
+            raise ValueError(
+                f"🚨 'vad_model_path' does not exist: '{self.VAD_MODEL_PATH}'. "
+            )
+
+        # Validate transcription mode
+        if self.TRANSCRIPTION_MODE not in ["window", "incremental"]:
+            raise ValueError(
+                "🚨 'transcription_mode' must be one of the following: "
+                "'window', 'incremental'. "
+            )
+
+    def _validate_trans_model(self):
+        """
+        Check that the translation model exists for the language pair, without
+        network access unless `VERIFY_MODEL_ONLINE` is set: the pair must be in
+        the registry of known OpusMT pairs or the model in the local Hugging Face
+        cache, otherwise it is looked up on Hugging Face if allowed.
+        """
+        model_name = f"{self.TRANS_MODEL}-{self.SRC_LANG}-{self.TGT_LANG}"
+        if model_name in _verified_models:
+            return
+
+        if not (
+            is_known_pair(self.TRANS_MODEL, self.SRC_LANG, self.TGT_LANG)
+            or _model_is_cached(model_name)
+        ):
+            if not self.VERIFY_MODEL_ONLINE:
+                raise ValueError(
+                    f"🚨 The model '{model_name}' is not a known OpusMT language "
+                    "pair and is not in the local Hugging Face cache. Download it "
+                    "first, or set 'verify_model_online' to look it up on "
+                    "Hugging Face. "
+                )
+            import huggingface_hub as hf_hub
+            import huggingface_hub.errors as hf_errors
+
+            try:
+                hf_hub.model_info(model_name)  # Check if the model exists
+            except hf_errors.RepositoryNotFoundError:
+                raise ValueError(
+                    f"\n🚨 The model for the language pair "
+                    f"'{self.SRC_LANG}-{self.TGT_LANG}' could not be found. "
+                    "Ensure the language pair is supported by OpusMT on "
+                    "Hugging Face (Helsinki-NLP models)."
+                )
+            except Exception as e:
+                raise ValueError(
+                    f"🚨 An error when verifying the translation model: {str(e)}"
+                )
+
+        _verified_models.add(model_name)
+
+    def replace(self, **changes) -> "Config":
+        """
+        Return a new Config with the same settings except `changes`, given as
+        constructor arguments. The result is validated like any other Config.
+        """
+        settings = {
+            name.lower(): value
+            for name, value in vars(self).items()
+            if not name.startswith("_")
+        }
+        settings.update(changes)
+        return Config(**settings)
+
     @property
     def CHUNK_SIZE(self):
         return self._CHUNK_SIZE
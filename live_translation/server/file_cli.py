@@ -0,0 +1,50 @@
+# server/file_cli.py
+
+from live_translation import __version__ as package_version
+from .config import Config
+from ._file_args import get_args
+from ._offline import FileTranslator
+
+
+def main():
+    """CLI entry point."""
+
+    args = get_args()
+
+    if args.version:
+        print("live-translate-file ", package_version)
+        return
+
+    if not args.paths:
+        print("🚨 No audio files or directories given.")
+        return
+
+    # Define the configuration object based on CLI arguments
+    cfg = Config(
+        device=args.device,
+        whisper_model=args.whisper_model,
+        compute_type=args.compute_type,
+        cpu_threads=args.cpu_threads,
+        trans_model=args.trans_model,
+        trans_backend=args.trans_backend,
+        trans_compute_type=args.trans_compute_type,
+        trans_cache_size=args.trans_cache_size,
+        trans_cache_path=args.trans_cache_path,
+        translation_batch_size=args.translation_batch_size,
+        verify_model_online=args.verify_model_online,
+        src_lang=args.src_lang,
+        tgt_lang=args.tgt_lang,
+        vad_aggressiveness=args.vad_aggressiveness,
+        vad_backend=args.vad_backend,
+        vad_model_path=args.vad_model_path,
+        transcribe_only=args.transcribe_only,
+    )
+
+    translator = FileTranslator(
+        cfg, output_dir=args.output_dir, jobs=args.jobs, batch_size=args.batch_size
+    )
+    translator.run(args.paths)
+
+
+if __name__ == "__main__":
+    main()
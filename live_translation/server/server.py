@@ -21,13 +21,24 @@ class LiveTranslationServer:
 
         self.pipeline_manager = PipelineManager(self.cfg)
 
-    def run(self, blocking=True):
-        """Starts the translation pipeline in blocking or non-blocking mode."""
+    def run(self, blocking=True, on_ready=None):
+        """
+        Starts the translation pipeline in blocking or non-blocking mode.
+        `on_ready` is called with the load time (s) of each stage once all
+        models are loaded and the server accepts clients.
+        """
         print(f"🚀 Starting live-translation with config: {self.cfg.__dict__}")
         if blocking:
-            self.pipeline_manager.run()
+            self.pipeline_manager.run(on_ready=on_ready)
         else:
-            return self.pipeline_manager.run_async()
+            return self.pipeline_manager.run_async(on_ready=on_ready)
+
+    def wait_ready(self, timeout=None) -> bool:
+        """
+        Blocks until all models are loaded and the server accepts clients
+        (non-blocking mode). Returns False on timeout.
+        """
+        return self.pipeline_manager.wait_ready(timeout)
 
     def stop(self):
         """Stops the translation pipeline."""
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from live_translation._audio._buffer import AudioRingBuffer
+
+
+def test_buffer_append_and_view():
+    """Appended chunks are returned in order as one contiguous view."""
+    buffer = AudioRingBuffer(capacity=10)
+    buffer.append(np.arange(4, dtype=np.float32))
+    buffer.append(np.arange(4, 7, dtype=np.float32))
+
+    assert len(buffer) == 7
+    np.testing.assert_array_equal(buffer.view(), np.arange(7))
+    np.testing.assert_array_equal(buffer.view(start=5), [5, 6])
+
+
+def test_buffer_trim_and_wraparound():
+    """Trimming advances the head and wrapped data stays contiguous."""
+    buffer = AudioRingBuffer(capacity=8)
+    buffer.append(np.arange(6, dtype=np.float32))
+    buffer.trim(4)
+    buffer.append(np.arange(6, 12, dtype=np.float32))  # Wraps around
+
+    view = buffer.view()
+    assert len(buffer) == 8
+    assert view.flags.c_contiguous
+    assert not view.flags.owndata, "View should not copy"
+    np.testing.assert_array_equal(view, np.arange(4, 12))
+
+
+def test_buffer_overflow_drops_oldest():
+    """Appending past capacity keeps only the newest samples."""
+    buffer = AudioRingBuffer(capacity=5)
+    buffer.append(np.arange(4, dtype=np.float32))
+    buffer.append(np.arange(4, 7, dtype=np.float32))
+
+    np.testing.assert_array_equal(buffer.view(), np.arange(2, 7))
+
+    buffer.append(np.arange(10, dtype=np.float32))
+    np.testing.assert_array_equal(buffer.view(), np.arange(5, 10))
+
+
+def test_buffer_clear():
+    buffer = AudioRingBuffer(capacity=5)
+    buffer.append(np.ones(3, dtype=np.float32))
+    buffer.clear()
+
+    assert len(buffer) == 0
+    assert len(buffer.view()) == 0
+
+
+def test_buffer_invalid_capacity():
+    with pytest.raises(ValueError):
+        AudioRingBuffer(capacity=0)
@@ -3,8 +3,14 @@ import pytest
 import numpy as np
 import wave
 import multiprocessing as mp
+import queue
+import subprocess
+import sys
 import time
-from live_translation._audio._processor import AudioProcessor
+from live_translation._audio._processor import AudioProcessor, _SessionState
+from live_translation._audio._buffer import AudioRingBuffer
+from live_translation._audio._shm import SegmentArena, SegmentRef
+from live_translation.server._metrics import PipelineStats
 from live_translation.server.config import Config
 
 
@@ -34,6 +40,38 @@ def config():
     return Config()
 
 
+@pytest.fixture
+def mock_vad():
+    """Mocked VAD class of the processor. Tests script `return_value.is_speech`."""
+    with mock.patch("live_translation._audio._processor.VoiceActivityDetector") as vad:
+        yield vad
+
+
+def _run(config, items, processed_queue=None, **kwargs):
+    """
+    Run the processor in the test process until all raw audio `items` are
+    consumed. Returns the processor and the items it put on the processed queue.
+    """
+    audio_queue = queue.Queue()
+    for item in items:
+        audio_queue.put(item)
+    if processed_queue is None:
+        processed_queue = queue.Queue()
+    stop_event = mock.Mock()
+    stop_event.is_set.side_effect = lambda: audio_queue.empty()
+
+    processor = AudioProcessor(
+        audio_queue, processed_queue, stop_event, config, **kwargs
+    )
+    with mock.patch.object(processor, "_cleanup"):
+        processor.run()
+
+    segments = []
+    while not processed_queue.empty():
+        segments.append(processed_queue.get_nowait())
+    return processor, segments
+
+
 @pytest.fixture
 def real_speech():
     """Load a real speech sample."""
@@ -85,6 +123,7 @@ def test_audio_processor_pipeline(
     processed_data = processed_queue.get()
 
     stop_event.set()
+    audio_queue.put(None)  # Wake the processor up
     processor.join(timeout=3)
     processor._cleanup()
 
@@ -106,6 +145,7 @@ def test_audio_processor_empty_queue(audio_queue, processed_queue, stop_event, c
     time.sleep(5)
 
     stop_event.set()
+    audio_queue.put(None)  # Wake the processor up
     processor.join(timeout=3)
     processor._cleanup()
 
@@ -141,3 +181,261 @@ def test_audio_processor_seconds_to_chunks(config):
     expected_chunks = int(round(seconds / (config._CHUNK_SIZE / 16000)))
     actual_chunks = processor._seconds_to_chunks(seconds)
     assert actual_chunks == expected_chunks
+
+
+def test_audio_processor_enqueue_through_arena(config):
+    """With an arena, the buffer goes through shared memory as a SegmentRef."""
+    arena = SegmentArena(slots=1, slot_size=2000)
+    processed_queue = mock.Mock()
+    processed_queue.full.return_value = False
+    processor = AudioProcessor(None, processed_queue, None, config, arena=arena)
+    session = _SessionState(None, mock.Mock(), AudioRingBuffer(2000))
+    session.buffer.append(np.full(1280, 0.5, dtype=np.float32))
+
+    processor._enqueue_buffer(session)
+
+    ref = processed_queue.put.call_args.args[0]
+    assert isinstance(ref, SegmentRef)
+    assert ref.length == 1280
+    np.testing.assert_array_equal(arena.view(ref), np.full(1280, 0.5))
+
+    # Arena has no free slot left: fall back to sending the audio by value
+    processor._enqueue_buffer(session)
+
+    fallback = processed_queue.put.call_args.args[0]
+    assert isinstance(fallback, np.ndarray) and len(fallback) == 1280
+
+    arena.release(ref)
+    arena.close()
+
+
+def test_audio_processor_buffering(config, mock_vad):
+    """Check enqueue, trim and silence handling with a scripted VAD."""
+    # 8.4s of speech, 0.5s of silence (soft), then 1.5s more silence (reset)
+    speech_chunks = 210
+    pattern = [True] * speech_chunks + [False] * 50
+    mock_vad.return_value.is_speech.side_effect = pattern
+
+    processor, segments = _run(config, [np.ones(640, dtype=np.int16)] * len(pattern))
+
+    max_len = config.MAX_BUFFER_DURATION * config.SAMPLE_RATE + config.CHUNK_SIZE
+    # One segment per second of new speech, plus one at the soft silence for the
+    # remaining unsent audio
+    assert len(segments) == speech_chunks * 640 // 16000 + 1
+    assert all(len(segment) <= max_len for segment in segments)
+    assert all(segment.dtype == np.float32 for segment in segments)
+    # Buffer was reset by the long silence
+    assert len(processor._sessions[None].buffer) == 0
+
+
+def test_audio_processor_incremental_mode(mock_vad):
+    """In incremental mode, only new audio is sent, then an end-of-utterance flush."""
+    config = Config(transcription_mode="incremental")
+    # 2.4s of speech, then 0.5s of silence (soft)
+    pattern = [True] * 60 + [False] * 13
+    mock_vad.return_value.is_speech.side_effect = pattern
+
+    _, segments = _run(
+        config, [np.full(640, i, dtype=np.int16) for i in range(len(pattern))]
+    )
+
+    # 1s, 1s, the remaining 0.4s at the soft silence, then the flush
+    assert [len(segment) for segment in segments] == [16000, 16000, 6400, 0]
+    # Segments don't overlap
+    sent = np.concatenate(segments)
+    assert len(np.unique(sent)) == 60
+
+
+@pytest.mark.parametrize("max_sessions", [1, 2])
+def test_audio_processor_warms_up_vad(mock_vad, max_sessions):
+    """The shared VAD model is warmed up before the processor reports ready."""
+    ready_queue = queue.Queue()
+    config = Config(max_sessions=max_sessions)
+
+    _run(config, [None], ready_queue=ready_queue)
+
+    # Only the model the sessions use is loaded and warmed up
+    mock_vad.load_model.assert_called_once()
+    assert mock_vad.call_args.args == (config, mock_vad.load_model.return_value)
+    audio = mock_vad.return_value.warmup.call_args.args[0]
+    assert len(audio) == 2 * Config().SAMPLE_RATE
+    mock_vad.return_value.is_speech.assert_not_called()
+    name, _, warmup = ready_queue.get_nowait()
+    assert name == "audio_processor" and warmup >= 0
+
+
+def test_audio_processor_sessions(mock_vad):
+    """Each session has its own VAD and buffer, and segments carry its id."""
+    config = Config(max_sessions=2, warmup=False)
+    # Interleaved chunks: session 'a' speaks for 1s, session 'b' is silent
+    items = [("a", np.ones(640, dtype=np.int16)), ("b", np.zeros(640, dtype=np.int16))]
+    mock_vad.return_value.is_speech.side_effect = lambda audio: audio.any()
+
+    # Session 'b' disconnects at the end
+    processor, segments = _run(config, items * 25 + [("b", None)])
+
+    # One VAD stream per session, sharing a single model
+    mock_vad.load_model.assert_called_once()
+    model = mock_vad.load_model.return_value
+    assert mock_vad.call_args_list == [mock.call(config, model)] * 2
+    [(sid, segment)] = segments
+    assert sid == "a" and len(segment) == 16000
+    assert list(processor._sessions) == ["a"]
+
+
+def test_audio_processor_traces_segments(mock_vad):
+    """With tracing, segments carry the trace of the chunk that triggered them."""
+    mock_vad.return_value.is_speech.return_value = True
+    items = [(None, np.ones(640, dtype=np.int16), {"received": i}) for i in range(25)]
+
+    _, [(sid, segment, trace)] = _run(Config(trace=True), items)
+
+    assert sid is None and len(segment) == 16000
+    assert trace["received"] == 24  # The 25th chunk completes 1s of speech
+    assert trace["enqueued"] >= trace["vad"]
+
+
+def test_audio_processor_records_vad_stats(config, mock_vad):
+    """VAD decisions and model calls are counted for metrics."""
+    vad = mock_vad.return_value
+    vad.model_calls = 0
+
+    def is_speech(audio):
+        vad.model_calls += 1
+        return audio.any()
+
+    vad.is_speech.side_effect = is_speech
+    stats = PipelineStats()
+
+    _run(
+        config,
+        [np.ones(640, dtype=np.int16), np.zeros(640, dtype=np.int16)],
+        stats=stats,
+    )
+
+    assert stats.vad_chunks.value == 2
+    assert stats.vad_speech_chunks.value == 1
+    assert stats.vad_model_calls.value == 2
+
+
+class _OverloadedQueue(queue.Queue):
+    """Unbounded queue that reports being full while `overloaded` is set."""
+
+    overloaded = True
+
+    def full(self):
+        return self.overloaded
+
+
+def _run_overloaded(mock_vad, config, pattern, relieve_at=None):
+    """
+    Run the processor on scripted speech (True) / silence (False) chunks while
+    the processed queue is full. It has room again from chunk `relieve_at`.
+    """
+    processed_queue = _OverloadedQueue()
+    chunks = iter(enumerate(pattern))
+
+    def is_speech(audio):
+        i, speech = next(chunks)
+        if i == relieve_at:
+            processed_queue.overloaded = False
+        return speech
+
+    mock_vad.return_value.is_speech.side_effect = is_speech
+    return _run(config, [np.ones(640, dtype=np.int16)] * len(pattern), processed_queue)
+
+
+def _overload_config(policy="coalesce", **kwargs):
+    """Config with a bounded processed queue and the overload `policy`."""
+    return Config(processed_queue_size=4, overload_policy=policy, **kwargs)
+
+
+def test_audio_processor_coalesces_when_overloaded(mock_vad):
+    """Held segments are superseded by newer ones and sent once there is room."""
+    config = _overload_config()
+    # 3s of speech while the queue is full, then room again
+    processor, segments = _run_overloaded(mock_vad, config, [True] * 75 + [False], 75)
+
+    assert [len(segment) for segment in segments] == [48000]
+    assert processor.shed == 2
+
+
+def test_audio_processor_coalesces_incremental_audio(mock_vad):
+    """In incremental mode, held new audio is appended to, not superseded."""
+    config = _overload_config(transcription_mode="incremental")
+    processor, segments = _run_overloaded(mock_vad, config, [True] * 50 + [False], 50)
+
+    assert [len(segment) for segment in segments] == [32000]
+    assert processor.shed == 0
+
+
+def test_audio_processor_sends_held_segment_before_trim(mock_vad):
+    """A held segment isn't superseded by one of the trimmed buffer."""
+    config = _overload_config()
+    # 8s of speech while the queue is full: the buffer is trimmed after 7s
+    processor, segments = _run_overloaded(mock_vad, config, [True] * 200 + [False], 200)
+
+    # Held at 7s and sent before the trim, then the trimmed buffer's segment
+    assert [len(segment) for segment in segments] == [112000, 43520]
+    assert processor.shed == 6
+
+
+def test_audio_processor_not_overloaded_by_default(mock_vad):
+    """The processed queue is unbounded by default, nothing is held or shed."""
+    processor, segments = _run_overloaded(mock_vad, Config(), [True] * 75 + [False])
+
+    assert [len(segment) for segment in segments] == [16000, 32000, 48000]
+    assert processor.shed == 0
+
+
+def test_audio_processor_drops_partials_when_overloaded(mock_vad):
+    """With 'drop', partial segments are shed but the final one is sent."""
+    config = _overload_config("drop")
+    # 2.8s of speech, then the soft silence ends the utterance
+    processor, segments = _run_overloaded(mock_vad, config, [True] * 70 + [False] * 12)
+
+    assert [len(segment) for segment in segments] == [44800]
+    assert processor.shed == 2
+
+
+def test_audio_processor_downshifts_when_overloaded(mock_vad):
+    """With 'downshift', segments are sent less often while overloaded."""
+    config = _overload_config("downshift")
+    processor, segments = _run_overloaded(mock_vad, config, [True] * 75)
+
+    # Held at 1s, then superseded at 3s. The interval doubled twice, up to half
+    # the max buffer.
+    assert processor._sessions[None].enqueue_len == 56000
+    assert segments == []
+    assert processor.shed == 2  # Superseded, then still held on shutdown
+
+
+def test_audio_processor_onnx_does_not_import_torch():
+    """
+    With the ONNX VAD, the processor process started by the server's pipeline
+    never loads torch or transformers.
+    """
+    # Run in a fresh interpreter: the test process itself has loaded torch
+    code = """
+import sys
+from live_translation.server.server import LiveTranslationServer
+from live_translation.server._pipeline import PipelineManager
+from live_translation.server.config import Config
+from live_translation._audio import _processor
+
+def report_ready(ready_queue, name, started, warmup=None):
+    # Runs in the processor process, once its VAD is loaded
+    ready_queue.put(sorted(m for m in ("torch", "transformers") if m in sys.modules))
+
+_processor.report_ready = report_ready
+pipeline = PipelineManager(Config(vad_backend="onnx"))
+pipeline._audio_processor.start()
+print("loaded:", pipeline._ready_queue.get(timeout=60))
+pipeline._raw_audio_queue.put(None)
+pipeline._audio_processor.join(timeout=10)
+"""
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    # The processor prints its own messages to the same stdout
+    assert "loaded: []" in out.splitlines()
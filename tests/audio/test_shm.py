@@ -0,0 +1,180 @@
+import queue
+import multiprocessing as mp
+import time
+import numpy as np
+import pytest
+from live_translation._audio._shm import SegmentArena, SegmentRef, SharedAudioRing
+
+
+@pytest.fixture
+def ring():
+    ring = SharedAudioRing(capacity=4, frame_size=640)
+    yield ring
+    ring.close()
+
+
+@pytest.fixture
+def arena():
+    arena = SegmentArena(slots=2, slot_size=1600)
+    yield arena
+    arena.close()
+
+
+def _consume(ring, count, results):
+    """Read `count` frames from the ring in a child process."""
+    for _ in range(count):
+        frame = ring.get(timeout=5)
+        results.put((len(frame), int(frame[0])))
+    ring.close()
+
+
+def _read_segment(arena, ref, results):
+    """Read a segment from the arena in a child process and release it."""
+    audio = arena.view(ref)
+    results.put((audio.dtype.name, float(audio.sum()), audio.flags.writeable))
+    arena.release(ref)
+    arena.close()
+
+
+def test_ring_roundtrip(ring):
+    """Frames come out in order, with their length and content intact."""
+    first = np.arange(640, dtype=np.int16)
+    second = np.full(320, 7, dtype=np.int16)
+
+    ring.put(first)
+    ring.put(second)
+    assert ring.qsize() == 2
+
+    out_first = ring.get(timeout=1)
+    out_second = ring.get(timeout=1)
+
+    assert out_first.dtype == np.int16
+    np.testing.assert_array_equal(out_first, first)
+    np.testing.assert_array_equal(out_second, second)
+    assert ring.empty()
+
+
+def test_ring_sentinel(ring):
+    """put(None) is read back as None after the frames put before it."""
+    ring.put(np.ones(640, dtype=np.int16))
+    ring.put(None)
+
+    assert len(ring.get(timeout=1)) == 640
+    assert ring.get(timeout=1) is None
+
+
+def test_ring_splits_long_audio(ring):
+    """Audio longer than a slot is split into consecutive frames."""
+    ring.put(np.ones(1000, dtype=np.int16))
+
+    assert len(ring.get(timeout=1)) == 640
+    assert len(ring.get(timeout=1)) == 360
+    assert ring.empty()
+
+
+def test_ring_get_timeout(ring):
+    """An empty ring raises queue.Empty like mp.Queue."""
+    with pytest.raises(queue.Empty):
+        ring.get(timeout=0.1)
+    with pytest.raises(queue.Empty):
+        ring.get_nowait()
+
+
+def test_ring_drops_when_full(ring):
+    """A full ring drops new frames instead of blocking the producer."""
+    for i in range(6):
+        ring.put(np.full(640, i, dtype=np.int16))
+
+    assert ring.dropped == 2
+    assert [int(ring.get(timeout=1)[0]) for _ in range(4)] == [0, 1, 2, 3]
+
+    # Slots are reusable after being read
+    ring.put(np.full(640, 9, dtype=np.int16))
+    assert int(ring.get(timeout=1)[0]) == 9
+
+
+def test_ring_cross_process(ring):
+    """A child process attached by name reads frames written by the parent."""
+    results = mp.Queue()
+    consumer = mp.Process(target=_consume, args=(ring, 10, results))
+    consumer.start()
+
+    for i in range(10):
+        ring.put(np.full(640, i, dtype=np.int16))
+        # Keep the producer within capacity; the consumer frees slots as it reads
+        while ring.qsize() >= 4:
+            time.sleep(0.001)
+
+    received = [results.get(timeout=10) for _ in range(10)]
+    consumer.join(timeout=5)
+
+    assert received == [(640, i) for i in range(10)]
+    assert ring.dropped == 0
+
+
+def test_ring_invalid_size():
+    with pytest.raises(ValueError):
+        SharedAudioRing(capacity=0, frame_size=640)
+
+
+def test_arena_write_view_release(arena):
+    """Chunks are concatenated into a slot and read back without a copy."""
+    chunks = [np.full(640, 0.5, dtype=np.float32), np.full(320, 1.0, dtype=np.float32)]
+
+    ref = arena.write(chunks)
+
+    assert isinstance(ref, SegmentRef)
+    assert ref.length == 960
+    audio = arena.view(ref)
+    np.testing.assert_array_equal(audio, np.concatenate(chunks))
+    assert not audio.flags.writeable
+    assert not audio.flags.owndata, "View should point into shared memory"
+    assert arena.in_use() == 1
+
+    arena.release(ref)
+    assert arena.in_use() == 0
+
+
+def test_arena_full_or_oversized(arena):
+    """write() returns None when the segment can't be placed in a slot."""
+    chunk = np.zeros(800, dtype=np.float32)
+
+    assert arena.write([chunk, chunk, chunk]) is None  # 2400 > slot_size
+
+    first = arena.write([chunk])
+    second = arena.write([chunk])
+    assert first is not None and second is not None
+    assert arena.write([chunk]) is None  # All slots busy
+
+    arena.release(first)
+    third = arena.write([chunk])
+    assert third is not None
+    assert third.seq > second.seq
+
+
+def test_arena_stale_reference(arena):
+    """A reference to a released and reused slot is rejected."""
+    chunk = np.zeros(100, dtype=np.float32)
+    ref = arena.write([chunk])
+    arena.release(ref)
+    arena.write([chunk])
+    arena.write([chunk])  # Reuses ref's slot
+
+    with pytest.raises(ValueError, match="Stale segment reference"):
+        arena.view(ref)
+
+
+def test_arena_cross_process(arena):
+    """A child process reads a segment written by the parent and releases it."""
+    ref = arena.write([np.full(1000, 0.25, dtype=np.float32)])
+    results = mp.Queue()
+
+    reader = mp.Process(target=_read_segment, args=(arena, ref, results))
+    reader.start()
+    dtype, total, writeable = results.get(timeout=10)
+    reader.join(timeout=5)
+
+    assert dtype == "float32"
+    assert total == pytest.approx(250.0)
+    assert writeable is False
+    assert arena.in_use() == 0
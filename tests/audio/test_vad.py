@@ -1,4 +1,5 @@
 import pytest
+from unittest import mock
 import numpy as np
 import torchaudio
 from live_translation._audio._vad import VoiceActivityDetector
@@ -16,6 +17,37 @@ def vad(config):
     return VoiceActivityDetector(config)
 
 
+@pytest.fixture
+def streaming_vad():
+    """VAD in streaming mode with a mocked model that records every frame."""
+    model = mock.MagicMock()
+    model.frames = []
+
+    def score(frame, sample_rate):
+        model.frames.append(frame.numpy().copy())
+        # Frames starting with a positive sample are "speech"
+        return mock.MagicMock(item=mock.MagicMock(return_value=float(frame[0] > 0)))
+
+    model.side_effect = score
+    with mock.patch("torch.hub.load", return_value=(model, None)):
+        yield VoiceActivityDetector(Config(vad_streaming=True)), model
+
+
+@pytest.fixture
+def pregate_vad():
+    """VAD with the pre-gate enabled and a mocked model scoring silence."""
+    model = mock.MagicMock()
+    model.return_value.item.return_value = 0.0
+    with mock.patch("torch.hub.load", return_value=(model, None)):
+        yield VoiceActivityDetector(Config(vad_pregate=True)), model
+
+
+@pytest.fixture
+def onnx_vad():
+    """VAD with the ONNX backend and the bundled weights (no download)."""
+    return VoiceActivityDetector(Config(vad_backend="onnx", vad_streaming=True))
+
+
 @pytest.fixture
 def real_speech():
     """Load a real speech sample and return all chunks."""
@@ -86,3 +118,196 @@ def test_vad_slice_audio(vad, real_speech):
     assert len(chunks) == 2, "Should be two chunks for audio longer than 1024 samples"
     assert len(chunks[0]) == 512, "First chunk should be 512 samples"
     assert len(chunks[1]) == 512, "Second chunk should be 512 samples"
+
+
+def test_vad_streaming_scores_every_sample_once(streaming_vad):
+    """640-sample chunks are scored as consecutive, non-overlapping 512 frames."""
+    vad, model = streaming_vad
+    audio = np.arange(1, 640 * 4 + 1, dtype=np.float32)
+
+    for i in range(0, len(audio), 640):
+        vad.is_speech(audio[i : i + 640])
+
+    # 2560 samples -> exactly 5 frames, one model call each, no residual left
+    assert len(model.frames) == 5
+    np.testing.assert_array_equal(np.concatenate(model.frames), audio)
+    assert len(vad._residual) == 0
+
+
+def test_vad_streaming_short_chunk_keeps_decision(streaming_vad):
+    """A chunk that doesn't complete a frame is carried over, not padded."""
+    vad, model = streaming_vad
+
+    assert vad.is_speech(np.ones(640, dtype=np.float32)) is True
+    assert len(vad._residual) == 128
+
+    # 128 + 300 < 512: no model call, previous decision is kept
+    assert vad.is_speech(np.zeros(300, dtype=np.float32)) is True
+    assert len(model.frames) == 1
+
+    # 428 + 84 completes a frame that starts with carried-over speech samples
+    assert vad.is_speech(np.zeros(84, dtype=np.float32)) is True
+    assert len(model.frames) == 2
+
+
+def test_vad_streaming_reset(streaming_vad):
+    """reset() drops carried-over samples and resets the model's state."""
+    vad, model = streaming_vad
+    vad.is_speech(np.ones(640, dtype=np.float32))
+
+    vad.reset()
+
+    assert len(vad._residual) == 0
+    assert vad.is_speech(np.zeros(100, dtype=np.float32)) is False
+    # The next frame is scored from a fresh model state
+    model.reset_states.reset_mock()
+    vad.is_speech(np.zeros(512, dtype=np.float32))
+    model.reset_states.assert_called_once()
+
+
+def test_vad_streaming_detects_speech(real_speech):
+    """Streaming mode detects speech using the real model."""
+    vad = VoiceActivityDetector(Config(vad_streaming=True))
+    vad.reset()
+
+    detected_speech = any(
+        vad.is_speech(real_speech[i : i + 640])
+        for i in range(0, len(real_speech) - 640 + 1, 640)
+    )
+
+    assert detected_speech, "VAD should detect speech in at least one chunk"
+
+
+def test_vad_pregate_digital_silence(pregate_vad):
+    """Digital silence is declared silent without calling the model."""
+    vad, model = pregate_vad
+
+    assert vad.is_speech(np.zeros(640, dtype=np.float32)) is False
+
+    model.assert_not_called()
+    assert (vad.gated, vad.model_calls) == (1, 0)
+
+
+def test_vad_pregate_restarts_stream():
+    """In streaming mode, a gated chunk restarts the stream and the model's state."""
+    model = mock.MagicMock()
+    model.return_value.item.return_value = 0.0
+    with mock.patch("torch.hub.load", return_value=(model, None)):
+        vad = VoiceActivityDetector(Config(vad_streaming=True, vad_pregate=True))
+    vad.is_speech(np.full(640, 0.3, dtype=np.float32))
+    assert len(vad._residual) == 128
+
+    model.reset_states.reset_mock()
+    assert vad.is_speech(np.zeros(640, dtype=np.float32)) is False
+
+    assert len(vad._residual) == 0
+    model.reset_states.assert_not_called()
+    # The next scored chunk starts from a fresh model state
+    vad.is_speech(np.full(640, 0.3, dtype=np.float32))
+    model.reset_states.assert_called_once()
+
+
+def test_vad_pregate_adapts_to_noise(pregate_vad):
+    """Steady room noise is gated once the noise floor has adapted to it."""
+    vad, model = pregate_vad
+    rng = np.random.default_rng(0)
+
+    for _ in range(50):
+        vad.is_speech(rng.normal(0, 0.01, 640).astype(np.float32))
+
+    assert vad.model_calls + vad.gated == 50
+    assert vad.gated > 25, "Most noise chunks should skip the model"
+
+    # Louder audio above the noise floor still goes to the model
+    calls = vad.model_calls
+    vad.is_speech(rng.normal(0, 0.2, 640).astype(np.float32))
+    assert vad.model_calls == calls + 1
+
+
+def test_vad_pregate_hangover_after_speech(pregate_vad):
+    """Chunks right after speech always go through the model."""
+    vad, model = pregate_vad
+    model.return_value.item.return_value = 0.9
+    assert vad.is_speech(np.full(640, 0.3, dtype=np.float32)) is True
+
+    model.return_value.item.return_value = 0.0
+    silence = np.zeros(640, dtype=np.float32)
+    for _ in range(vad._PREGATE_HANGOVER):
+        vad.is_speech(silence)
+    assert vad.gated == 0
+
+    vad.is_speech(silence)
+    assert vad.gated == 1
+
+
+def test_vad_warmup_leaves_stream_and_stats(pregate_vad):
+    """Warm-up scores every frame with the model without counting chunks."""
+    vad, model = pregate_vad
+
+    vad.warmup(np.zeros(16000, dtype=np.float32))
+
+    assert model.call_count == 16000 // 512
+    model.reset_states.assert_called_once()
+    assert (vad.gated, vad.model_calls) == (0, 0)
+
+
+def test_vad_pregate_disabled_by_default(streaming_vad):
+    """Without the pre-gate, every chunk is scored by the model."""
+    vad, model = streaming_vad
+    vad.is_speech(np.zeros(1024, dtype=np.float32))
+
+    assert len(model.frames) == 2
+    assert vad.gated == 0
+
+
+def test_vad_onnx_detects_speech_and_silence(onnx_vad, real_speech):
+    """The ONNX backend detects speech and silence like the torch one."""
+    detected_speech = any(
+        onnx_vad.is_speech(real_speech[i : i + 640])
+        for i in range(0, len(real_speech) - 640 + 1, 640)
+    )
+    assert detected_speech, "VAD should detect speech in at least one chunk"
+
+    onnx_vad.reset()
+    assert onnx_vad.is_speech(np.zeros(640 * 10, dtype=np.float32)) is False
+
+
+def test_vad_shares_model_between_streams(real_speech):
+    """Detectors sharing one model keep their own stream state."""
+    cfg = Config(vad_backend="onnx", vad_streaming=True)
+    model = VoiceActivityDetector.load_model(cfg)
+    shared = [VoiceActivityDetector(cfg, model) for _ in range(2)]
+    separate = [VoiceActivityDetector(cfg) for _ in range(2)]
+    # One stream speaks, the other hears the same audio with a delay
+    streams = [real_speech, np.concatenate((np.zeros(8000), real_speech))]
+
+    for i in range(0, len(real_speech) - 640 + 1, 640):
+        for n, audio in enumerate(streams):
+            chunk = audio[i : i + 640].astype(np.float32)
+            assert shared[n].is_speech(chunk) == separate[n].is_speech(chunk)
+            np.testing.assert_allclose(
+                shared[n]._state[0], separate[n]._state[0], atol=1e-5
+            )
+
+
+def test_vad_onnx_matches_reference(real_speech):
+    """Frame by frame scoring matches faster-whisper's batch Silero model."""
+    from faster_whisper.utils import get_assets_path
+    from faster_whisper.vad import SileroVADModel
+    from live_translation._audio._vad_backends import OnnxVADBackend
+
+    audio = real_speech[: 512 * 200]
+    backend = OnnxVADBackend(16000)
+    frames = audio.reshape(-1, 512)
+    # Feed in uneven groups, state and context must carry across calls
+    probs = np.concatenate(
+        [backend(frames[:1]), backend(frames[1:75]), backend(frames[75:])]
+    )
+
+    assets = get_assets_path()
+    reference = SileroVADModel(
+        f"{assets}/silero_encoder_v5.onnx", f"{assets}/silero_decoder_v5.onnx"
+    )(audio[np.newaxis]).ravel()
+
+    assert reference.max() > 0.5, "Reference should contain speech"
+    np.testing.assert_allclose(probs, reference, atol=1e-3)
@@ -1,5 +1,7 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+import pyaudio
 from live_translation.client.client import LiveTranslationClient
 from live_translation.client.config import Config
 
@@ -9,6 +11,23 @@ def config():
     return Config(server_uri="ws://localhost:8764")
 
 
+def _mock_pyaudio(frames, statuses=None):
+    """
+    Mock PyAudio whose stream hands `frames` to its callback, as PortAudio's
+    thread would, when it is opened.
+    """
+    mock_stream = MagicMock()
+    mock_pa = MagicMock()
+
+    def open_stream(**kwargs):
+        for frame, status in zip(frames, statuses or [0] * len(frames)):
+            kwargs["stream_callback"](frame, 640, {}, status)
+        return mock_stream
+
+    mock_pa.open.side_effect = open_stream
+    return mock_pa, mock_stream
+
+
 @pytest.mark.asyncio
 async def test_receive_output_callback_exit(config):
     """Test that the client exits when callback returns True."""
@@ -107,14 +126,10 @@ async def test_receive_output_handles_json_error(config):
 
 @pytest.mark.asyncio
 async def test_send_audio_streams_once():
-    """Test that audio is read and sent once from the microphone when using PCM."""
+    """Test that audio is captured and sent once from the microphone when using PCM."""
 
     # Set up mocks
-    mock_stream = MagicMock()
-    mock_stream.read.return_value = b"fake-audio-bytes"
-
-    mock_pa = MagicMock()
-    mock_pa.open.return_value = mock_stream
+    mock_pa, mock_stream = _mock_pyaudio([b"fake-audio-bytes"])
 
     mock_websocket = AsyncMock()
 
@@ -133,8 +148,11 @@ async def test_send_audio_streams_once():
         await client._send_audio(mock_websocket)
 
     # Assertions
-    mock_stream.read.assert_called_once()
+    assert callable(mock_pa.open.call_args.kwargs["stream_callback"])
+    mock_stream.read.assert_not_called()  # Callback mode, no blocking reads
     mock_websocket.send.assert_called_once_with(b"fake-audio-bytes")
+    mock_stream.stop_stream.assert_called_once()
+    mock_pa.terminate.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -145,11 +163,7 @@ async def test_send_audio_opus_encoding():
     mock_codec = MagicMock()
     mock_codec.encode.return_value = b"encoded-audio"
 
-    mock_stream = MagicMock()
-    mock_stream.read.return_value = b"pcm-audio"
-
-    mock_pa = MagicMock()
-    mock_pa.open.return_value = mock_stream
+    mock_pa, _ = _mock_pyaudio([b"pcm-audio"])
 
     mock_websocket = AsyncMock()
 
@@ -183,11 +197,7 @@ async def test_audio_opus_encoding_exception(capfd):
     mock_codec = MagicMock()
     mock_codec.encode.side_effect = RuntimeError("fake encoding failure")
 
-    mock_stream = MagicMock()
-    mock_stream.read.return_value = b"pcm-audio"
-
-    mock_pa = MagicMock()
-    mock_pa.open.return_value = mock_stream
+    mock_pa, _ = _mock_pyaudio([b"pcm-audio"])
 
     mock_websocket = AsyncMock()
 
@@ -212,3 +222,49 @@ async def test_audio_opus_encoding_exception(capfd):
     captured = capfd.readouterr()
     assert "🚨 Opus encoding error: fake encoding failure" in captured.out
     mock_codec.encode.assert_called_once_with(b"pcm-audio")
+
+
+@pytest.mark.asyncio
+async def test_send_audio_drops_oldest_frames_when_behind(capfd):
+    """Frames beyond the queue size drop the oldest, and losses are counted."""
+    frames = [bytes([i]) for i in range(LiveTranslationClient.MAX_QUEUED_FRAMES + 5)]
+    statuses = [pyaudio.paInputOverflow] + [0] * (len(frames) - 1)
+    mock_pa, _ = _mock_pyaudio(frames, statuses)
+    mock_websocket = AsyncMock()
+
+    with patch("pyaudio.PyAudio", return_value=mock_pa):
+        client = LiveTranslationClient(
+            Config(server_uri="ws://localhost:8764", codec="pcm")
+        )
+
+        async def send_side_effect(data):
+            client._exit_requested = True
+
+        mock_websocket.send.side_effect = send_side_effect
+
+        await client._send_audio(mock_websocket)
+
+    # The 5 oldest frames were dropped
+    mock_websocket.send.assert_called_once_with(frames[5])
+    assert client.dropped_frames == 5
+    assert client.overflowed_frames == 1
+    assert "🚨 Audio frames lost: 5 dropped" in capfd.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_send_audio_exits_without_frames():
+    """The sender stops on exit even if the microphone delivers nothing."""
+    mock_pa, mock_stream = _mock_pyaudio([])
+    mock_websocket = AsyncMock()
+
+    with patch("pyaudio.PyAudio", return_value=mock_pa):
+        client = LiveTranslationClient(
+            Config(server_uri="ws://localhost:8764", codec="pcm")
+        )
+        asyncio.get_running_loop().call_later(
+            0.1, setattr, client, "_exit_requested", True
+        )
+        await asyncio.wait_for(client._send_audio(mock_websocket), timeout=2)
+
+    mock_websocket.send.assert_not_called()
+    mock_stream.close.assert_called_once()
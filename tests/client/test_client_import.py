@@ -0,0 +1,66 @@
+# tests/client/test_client_import.py
+
+import json
+import subprocess
+import sys
+import pytest
+
+# Server-only dependencies the client must not load
+SERVER_MODULES = (
+    "torch",
+    "torchaudio",
+    "huggingface_hub",
+    "transformers",
+    "faster_whisper",
+    "ctranslate2",
+)
+
+# Imports a module in a fresh interpreter, reporting the time and new modules
+_BENCHMARK = """
+import json, sys, time
+before = set(sys.modules)
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def _import(module: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _BENCHMARK.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "live_translation",
+        "live_translation.client.client",
+        "live_translation.client.cli",
+    ],
+)
+def test_client_import_is_lightweight(module):
+    """The client and the package don't import the server's dependencies."""
+    result = _import(module)
+
+    loaded = {m.split(".")[0] for m in result["modules"]} & set(SERVER_MODULES)
+    assert not loaded, f"Importing {module} loads server modules: {sorted(loaded)}"
+    # Report-only: wall-clock time is too noisy on shared runners to assert on
+    print(f"⏱️ Importing {module} took {result['seconds']:.2f}s")
+
+
+def test_package_exports_are_lazy():
+    """Exports of the package are imported on first access."""
+    import live_translation
+
+    assert "ServerConfig" in dir(live_translation)
+    from live_translation.server.config import Config
+
+    assert live_translation.ServerConfig is Config
+    with pytest.raises(AttributeError):
+        live_translation.missing
@@ -0,0 +1,122 @@
+# tests/server/test_file_cli.py
+
+from unittest import mock
+from live_translation.server import file_cli, _args, _file_args
+from live_translation import __version__ as package_version
+
+
+def test_file_cli_prints_version(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["file", "--version"])
+    file_cli.main()
+    out, _ = capsys.readouterr()
+    assert f"live-translate-file  {package_version}" in out
+
+
+def test_file_cli_requires_paths(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["file"])
+    with mock.patch("live_translation.server.file_cli.FileTranslator") as MockFiles:
+        file_cli.main()
+        MockFiles.assert_not_called()
+    assert "🚨 No audio files" in capsys.readouterr().out
+
+
+def test_file_cli_with_all_args(monkeypatch):
+    """Test CLI with all arguments explicitly set."""
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "file",
+            "recordings/",
+            "talk.opus",
+            "--output_dir",
+            "out",
+            "--jobs",
+            "3",
+            "--batch_size",
+            "4",
+            "--vad_aggressiveness",
+            "5",
+            "--vad_backend",
+            "onnx",
+            "--device",
+            "cpu",
+            "--whisper_model",
+            "tiny",
+            "--compute_type",
+            "int8",
+            "--cpu_threads",
+            "6",
+            "--trans_model",
+            "Helsinki-NLP/opus-mt-tc-big",
+            "--trans_backend",
+            "ctranslate2",
+            "--trans_compute_type",
+            "int8_float32",
+            "--trans_cache_size",
+            "64",
+            "--trans_cache_path",
+            "cache.json",
+            "--translation_batch_size",
+            "32",
+            "--verify_model_online",
+            "--src_lang",
+            "fr",
+            "--tgt_lang",
+            "de",
+            "--transcribe_only",
+        ],
+    )
+
+    with mock.patch("live_translation.server.file_cli.FileTranslator") as MockFiles:
+        file_cli.main()
+
+        cfg = MockFiles.call_args.args[0]
+        assert cfg.WHISPER_MODEL == "tiny"
+        assert cfg.COMPUTE_TYPE == "int8"
+        assert cfg.CPU_THREADS == 6
+        assert cfg.TRANS_MODEL == "Helsinki-NLP/opus-mt-tc-big"
+        assert cfg.TRANS_BACKEND == "ctranslate2"
+        assert cfg.TRANS_COMPUTE_TYPE == "int8_float32"
+        assert cfg.TRANS_CACHE_SIZE == 64
+        assert cfg.TRANS_CACHE_PATH == "cache.json"
+        assert cfg.TRANSLATION_BATCH_SIZE == 32
+        assert cfg.VERIFY_MODEL_ONLINE is True
+        assert cfg.SRC_LANG == "fr"
+        assert cfg.TGT_LANG == "de"
+        assert cfg.VAD_AGGRESSIVENESS == 5
+        assert cfg.VAD_BACKEND == "onnx"
+        assert cfg.TRANSCRIBE_ONLY is True
+        assert MockFiles.call_args.kwargs == {
+            "output_dir": "out",
+            "jobs": 3,
+            "batch_size": 4,
+        }
+        MockFiles.return_value.run.assert_called_once_with(["recordings/", "talk.opus"])
+
+
+def test_file_cli_help(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["file", "--help"])
+    try:
+        file_cli.main()
+    except SystemExit:
+        pass
+    out, _ = capsys.readouterr()
+    assert "--output_dir" in out
+    assert "--jobs" in out
+    assert "--batch_size" in out
+    assert "--translation_batch_size" in out
+
+
+def test_file_cli_shares_server_defaults(monkeypatch):
+    """Shared options default like the server's, except OFFLINE_DEFAULTS."""
+    monkeypatch.setattr("sys.argv", ["server"])
+    server = vars(_args.get_args())
+    monkeypatch.setattr("sys.argv", ["file"])
+    offline = vars(_file_args.get_args())
+
+    shared = server.keys() & offline.keys()
+    assert {"trans_cache_size", "verify_model_online", "vad_backend"} <= shared
+    for name in shared:
+        expected = _file_args.OFFLINE_DEFAULTS.get(name, server[name])
+        assert offline[name] == expected, name
+    assert offline["translation_batch_size"] == 16
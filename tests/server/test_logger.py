@@ -70,3 +70,18 @@ def test_logger_skip_file_when_log_none(tmp_path):
     logger.close()
     print("temp_path:", tmp_path)
     assert not any(tmp_path.iterdir()), "Logger should not write when log=None"
+
+
+def test_logger_path(tmp_path):
+    """A path logs to that file whatever cfg.LOG is, overwriting it."""
+    cfg = Config(log=None)
+    path = tmp_path / "out" / "recording.jsonl"
+
+    for text in ("First", "Second"):
+        logger = OutputLogger(cfg, path=str(path))
+        logger.write({"timestamp": "", "transcription": text, "translation": ""})
+        logger.close()
+
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert [e["transcription"] for e in lines] == ["Second"]
@@ -0,0 +1,121 @@
+# tests/server/test_metrics.py
+
+import multiprocessing as mp
+import os
+import time
+import urllib.error
+import urllib.request
+from unittest import mock
+import pytest
+from live_translation.server._metrics import (
+    MetricsServer,
+    PipelineStats,
+    SharedHistogram,
+)
+from live_translation.server._trace import LatencyHistograms
+
+
+def test_shared_histogram():
+    """Observations are counted in cumulative buckets with their sum."""
+    histogram = SharedHistogram((1, 2, 5))
+    for value in (0.5, 1.5, 1.5, 10):
+        histogram.observe(value)
+
+    cumulative, total = histogram.snapshot()
+    assert cumulative == [1, 3, 3, 4]
+    assert total == 13.5
+
+
+def test_pipeline_stats_records():
+    """Stages record VAD, transcription and translation stats."""
+    stats = PipelineStats()
+    stats.record_vad(True, 1)
+    stats.record_vad(False, 0)
+    stats.record_shed()
+    stats.record_transcription(2.0, 0.5)
+    stats.record_translation(0.03, 3, 1)
+
+    assert stats.vad_chunks.value == 2
+    assert stats.vad_speech_chunks.value == 1
+    assert stats.vad_model_calls.value == 1
+    assert stats.shed_segments.value == 1
+    assert stats.audio_seconds.value == 2.0
+    assert stats.whisper_rtf.snapshot() == ([0, 0, 1, 1, 1, 1, 1, 1, 1, 1], 0.25)
+    assert stats.translation_latency.snapshot()[1] == 0.03
+    assert (stats.cache_hits.value, stats.cache_misses.value) == (3, 1)
+
+
+def test_metrics_server_renders_prometheus_text():
+    """Metrics are rendered in the Prometheus text format."""
+    stats = PipelineStats()
+    stats.record_vad(True, 1)
+    stats.record_vad(False, 1)
+    stats.record_transcription(1.0, 0.5)
+    stats.record_translation(0.03, 3, 1)
+    latency = LatencyHistograms()
+    latency.record({"total_ms": 250})
+    ws_io = mock.Mock(session_count=1, latency=latency)
+    queue_ = mock.Mock()
+    queue_.qsize.return_value = 2
+    broken_queue = mock.Mock()
+    broken_queue.qsize.side_effect = NotImplementedError
+    processes = {
+        "transcriber_0": mock.Mock(pid=os.getpid()),
+        "translator": mock.Mock(pid=None),  # Not started
+    }
+
+    server = MetricsServer(
+        9100,
+        mp.Event(),
+        stats,
+        {"raw": queue_, "output": broken_queue},
+        processes,
+        ws_io,
+    )
+    text = server.render()
+
+    assert "# TYPE live_translation_queue_depth gauge" in text
+    assert 'live_translation_queue_depth{queue="raw"} 2' in text
+    assert 'queue="output"' not in text
+    assert "live_translation_sessions 1" in text
+    assert "live_translation_vad_speech_ratio 0.5" in text
+    assert "live_translation_vad_model_calls_total 2" in text
+    assert "live_translation_whisper_real_time_factor 0.5" in text
+    assert (
+        'live_translation_whisper_segment_real_time_factor_bucket{le="0.5"} 1' in text
+    )
+    assert 'live_translation_translation_seconds_bucket{le="+Inf"} 1' in text
+    assert "live_translation_translation_cache_hit_ratio 0.75" in text
+    assert (
+        'live_translation_stage_latency_seconds_bucket{stage="total",le="0.5"} 1'
+        in text
+    )
+    assert 'live_translation_stage_latency_seconds_sum{stage="total"} 0.25' in text
+    if server._psutil is not None:
+        assert 'process_resident_memory_bytes{process="server"}' in text
+        assert 'process_cpu_seconds_total{process="transcriber_0"}' in text
+        assert 'process="translator"' not in text
+
+
+def test_metrics_server_http():
+    """The listener serves /metrics until the stop event is set."""
+    port = 8884
+    stop_event = mp.Event()
+    ws_io = mock.Mock(session_count=0, latency=None)
+    server = MetricsServer(port, stop_event, PipelineStats(), {}, {}, ws_io)
+    server.daemon = True
+    server.start()
+    time.sleep(0.5)
+
+    url = f"http://localhost:{port}"
+    with urllib.request.urlopen(f"{url}/metrics", timeout=2) as response:
+        assert response.status == 200
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert "live_translation_sessions 0" in response.read().decode()
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(f"{url}/other", timeout=2)
+    assert e.value.code == 404
+
+    stop_event.set()
+    server.join(timeout=2)
+    assert not server.is_alive()
@@ -0,0 +1,166 @@
+# tests/server/test_offline.py
+
+import json
+from types import SimpleNamespace
+from unittest import mock
+import numpy as np
+import pytest
+from live_translation.server._offline import FileTranslator, _FileWorker
+from live_translation.server.config import Config
+
+SAMPLE_RATE = 16000
+
+
+def _speech_audio(pattern):
+    """Audio of (seconds, is_speech) parts: a tone for speech, else silence."""
+    parts = [
+        np.full(int(seconds * SAMPLE_RATE), 0.5 if speech else 0.0, dtype=np.float32)
+        for seconds, speech in pattern
+    ]
+    return np.concatenate(parts)
+
+
+@pytest.fixture
+def models():
+    """Mock the VAD (loud chunks are speech), Whisper and the translator."""
+    with (
+        mock.patch("live_translation.server._offline.VoiceActivityDetector") as vad,
+        mock.patch("live_translation.server._offline.Transcriber"),
+        mock.patch("live_translation.server._offline.BatchedInferencePipeline") as bip,
+        mock.patch("live_translation.server._offline.Translator") as translator,
+    ):
+        vad.return_value.is_speech.side_effect = lambda chunk: chunk.max() > 0.1
+        translator.return_value.translate_all.side_effect = lambda texts: [
+            t.upper() for t in texts
+        ]
+        yield SimpleNamespace(
+            whisper=bip.return_value, translator=translator.return_value
+        )
+
+
+def test_file_translator_collects_audio_files(tmp_path):
+    """Directories are expanded into their audio files, in order."""
+    (tmp_path / "b").mkdir()
+    for name in ("b/2.opus", "a.wav", "notes.txt", "c.WAV"):
+        (tmp_path / name).touch()
+    extra = tmp_path / "extra.raw"
+    extra.touch()
+
+    files = FileTranslator.collect([str(tmp_path), str(extra)])
+
+    assert files == [
+        str(tmp_path / "a.wav"),
+        str(tmp_path / "c.WAV"),
+        str(tmp_path / "b" / "2.opus"),
+        str(extra),
+    ]
+    with pytest.raises(ValueError, match="not found"):
+        FileTranslator.collect([str(tmp_path / "missing.wav")])
+
+
+def test_file_translator_invalid_args():
+    with pytest.raises(ValueError, match="jobs"):
+        FileTranslator(Config(), jobs=0)
+    with pytest.raises(ValueError, match="batch_size"):
+        FileTranslator(Config(), batch_size=0)
+
+
+def test_file_worker_segments_speech(models):
+    """Segments end at soft silence and are split at the max segment duration."""
+    worker = _FileWorker(Config(), batch_size=8)
+
+    audio = _speech_audio([(1, False), (2, True), (0.2, False), (1, True), (1, False)])
+    # A short pause doesn't end the segment
+    assert worker.segment(audio) == [{"start": 1.0, "end": 4.2}]
+
+    audio = _speech_audio([(1, False), (1, True), (1, False), (1, True)])
+    assert worker.segment(audio) == [
+        {"start": 1.0, "end": 2.0},
+        {"start": 3.0, "end": 4.0},
+    ]
+
+    audio = _speech_audio([(70, True)])
+    assert worker.segment(audio) == [
+        {"start": 0.0, "end": 30.0},
+        {"start": 30.0, "end": 60.0},
+        {"start": 60.0, "end": 70.0},
+    ]
+
+    assert worker.segment(_speech_audio([(2, False)])) == []
+
+
+def test_file_translator_writes_jsonl(models, tmp_path):
+    """Each file is transcribed in batches and written in the logger format."""
+    models.whisper.transcribe.return_value = (
+        iter(
+            [
+                SimpleNamespace(start=1.0, end=2.0, text=" Hello."),
+                SimpleNamespace(start=3.0, end=3.5, text=" "),
+                SimpleNamespace(start=3.5, end=4.0, text=" World."),
+            ]
+        ),
+        None,
+    )
+    audio = _speech_audio([(1, False), (1, True), (1, False), (1, True)])
+    (tmp_path / "recording.wav").touch()
+
+    with mock.patch(
+        "live_translation.server._offline.decode_audio", return_value=audio
+    ):
+        translator = FileTranslator(
+            Config(), output_dir=str(tmp_path / "out"), batch_size=4
+        )
+        outputs = translator.run([str(tmp_path / "recording.wav")])
+
+    assert outputs == [str(tmp_path / "out" / "recording.jsonl")]
+    kwargs = models.whisper.transcribe.call_args.kwargs
+    assert kwargs["batch_size"] == 4
+    assert kwargs["clip_timestamps"] == [
+        {"start": 1.0, "end": 2.0},
+        {"start": 3.0, "end": 4.0},
+    ]
+    # Empty segments are skipped before translation
+    models.translator.translate_all.assert_called_once_with(["Hello.", "World."])
+
+    with open(outputs[0], encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    assert [
+        (e["transcription"], e["translation"], e["start"], e["end"]) for e in entries
+    ] == [("Hello.", "HELLO.", 1.0, 2.0), ("World.", "WORLD.", 3.5, 4.0)]
+    assert all("timestamp" in e for e in entries)
+
+
+def test_file_translator_skips_failed_files(models, tmp_path, capsys):
+    """A file that can't be decoded is reported and the others still processed."""
+    models.whisper.transcribe.return_value = (iter([]), None)
+    for name in ("bad.wav", "good.wav"):
+        (tmp_path / name).touch()
+
+    def decode(path, sampling_rate):
+        if path.endswith("bad.wav"):
+            raise RuntimeError("invalid data")
+        return _speech_audio([(1, True)])
+
+    with mock.patch("live_translation.server._offline.decode_audio", decode):
+        outputs = FileTranslator(
+            Config(transcribe_only=True), output_dir=str(tmp_path)
+        ).run([str(tmp_path)])
+
+    assert outputs == [None, str(tmp_path / "good.jsonl")]
+    assert "🚨 FileTranslator Error:" in capsys.readouterr().out
+
+
+def test_file_translator_merges_worker_caches(tmp_path):
+    """The parent merges the workers' translation caches and saves them once."""
+    path = tmp_path / "cache.json"
+    translator = FileTranslator(Config(trans_cache_path=str(path)), jobs=2)
+
+    translator._save_cache(
+        [[("m\none", "uno")], [("m\ntwo", "dos")], [("m\none", "uno")]]
+    )
+
+    with open(path, encoding="utf-8") as f:
+        assert sorted(map(tuple, json.load(f))) == [
+            ("m\none", "uno"),
+            ("m\ntwo", "dos"),
+        ]
@@ -1,5 +1,8 @@
 import os
+import signal
+import threading
 from unittest.mock import patch, MagicMock
+from live_translation._audio._shm import SegmentArena, SharedAudioRing
 from live_translation.server._pipeline import PipelineManager
 from live_translation.server.config import Config
 
@@ -82,11 +85,36 @@ def test_signal_handler_parent_sets_stop_event():
     # Confirm test is running in parent process
     assert os.getpid() == pipeline._parent_pid
 
-    pipeline._stop_event = MagicMock()
-
     pipeline.signal_handler(sig=2, frame=None)  # SIGINT
 
-    pipeline._stop_event.set.assert_called_once()
+    # Set from another thread, see signal_handler()
+    assert pipeline._stop_event.wait(timeout=5)
+
+
+def test_pipeline_run_stops_on_sigint():
+    """Ctrl+C stops a blocking run(), whose thread runs the signal handler."""
+
+    def timeout(sig, frame):
+        raise TimeoutError("run() did not stop on SIGINT")
+
+    previous_alarm = signal.signal(signal.SIGALRM, timeout)
+    previous_int = signal.getsignal(signal.SIGINT)
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO"),
+        patch("live_translation.server._pipeline.AudioProcessor"),
+        patch("live_translation.server._pipeline.Transcriber"),
+    ):
+        pipeline = PipelineManager(Config(transcribe_only=True))
+        threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGINT)).start()
+        signal.alarm(10)
+        try:
+            pipeline.run()
+        finally:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous_alarm)
+            signal.signal(signal.SIGINT, previous_int)
+
+    assert pipeline._stop_event.is_set()
 
 
 def test_signal_handler_ignored_in_child():
@@ -99,3 +127,140 @@ def test_signal_handler_ignored_in_child():
         pipeline.signal_handler(sig=2, frame=None)
 
         pipeline._stop_event.set.assert_not_called()
+
+
+def test_pipeline_shm_transport():
+    """ipc_transport='shm' uses shared memory for raw audio and speech segments."""
+    cfg = Config(transcribe_only=True, ipc_transport="shm")
+
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO") as MockWS,
+        patch("live_translation.server._pipeline.AudioProcessor") as MockAP,
+        patch("live_translation.server._pipeline.Transcriber") as MockTR,
+    ):
+        pipeline = PipelineManager(cfg)
+
+        ring = pipeline._raw_audio_queue
+        arena = pipeline._segment_arena
+        assert isinstance(ring, SharedAudioRing)
+        assert isinstance(arena, SegmentArena)
+        # Same transport is handed to the producer and the consumer
+        assert MockWS.call_args.args[1] is ring
+        assert MockAP.call_args.args[0] is ring
+        assert MockAP.call_args.kwargs["arena"] is arena
+        assert MockTR.call_args.kwargs["arena"] is arena
+
+        pipeline.run_async()
+        pipeline.stop()
+
+    # Shared memory is released on stop
+    assert ring._shm is None
+    assert arena._shm is None
+
+
+def test_pipeline_transcriber_workers():
+    """Several transcriber workers share the processed queue and a seq counter."""
+    cfg = Config(transcribe_only=True, transcriber_workers=3)
+
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO"),
+        patch("live_translation.server._pipeline.AudioProcessor"),
+        patch("live_translation.server._pipeline.Transcriber") as MockTR,
+    ):
+        pipeline = PipelineManager(cfg)
+
+    assert MockTR.call_count == 3
+    calls = MockTR.call_args_list
+    assert [c.kwargs["worker_id"] for c in calls] == [0, 1, 2]
+    assert all(c.args[0] is pipeline._processed_audio_queue for c in calls)
+    assert all(c.kwargs["seq_counter"] is pipeline._segment_seq for c in calls)
+    assert len(pipeline._processes) == 4
+
+
+def test_pipeline_stop_wakes_stages_with_sentinels():
+    """stop() puts a `None` sentinel on each stage's input queue."""
+    cfg = Config(transcriber_workers=2)
+
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO"),
+        patch("live_translation.server._pipeline.AudioProcessor"),
+        patch("live_translation.server._pipeline.Transcriber"),
+        patch("live_translation.server._pipeline.Translator"),
+    ):
+        pipeline = PipelineManager(cfg)
+        pipeline.run_async()
+        pipeline.stop()
+
+    assert pipeline._stop_event.is_set()
+    assert pipeline._raw_audio_queue.get(timeout=1) is None
+    assert pipeline._processed_audio_queue.get(timeout=1) is None
+    assert pipeline._processed_audio_queue.get(timeout=1) is None
+    assert pipeline._transcription_queue.get(timeout=1) is None
+
+
+def test_pipeline_bounds_processed_queue():
+    """The processed queue is bounded by `processed_queue_size`."""
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO"),
+        patch("live_translation.server._pipeline.AudioProcessor"),
+        patch("live_translation.server._pipeline.Transcriber"),
+    ):
+        pipeline = PipelineManager(Config(transcribe_only=True, processed_queue_size=2))
+
+    pipeline._processed_audio_queue.put(1)
+    pipeline._processed_audio_queue.put(2)
+    assert pipeline._processed_audio_queue.full()
+
+
+def test_pipeline_metrics():
+    """With a metrics port, the stages share stats and a listener is started."""
+    cfg = Config(transcribe_only=True, metrics_port=9100)
+
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO"),
+        patch("live_translation.server._pipeline.AudioProcessor") as MockAP,
+        patch("live_translation.server._pipeline.Transcriber") as MockTR,
+        patch("live_translation.server._pipeline.MetricsServer") as MockMetrics,
+    ):
+        pipeline = PipelineManager(cfg)
+
+    assert MockAP.call_args.kwargs["stats"] is pipeline._stats
+    assert MockTR.call_args.kwargs["stats"] is pipeline._stats
+    assert MockMetrics.call_args.args[0] == 9100
+    assert list(MockMetrics.call_args.args[3]) == [
+        "raw",
+        "processed",
+        "transcription",
+        "output",
+    ]
+    assert list(MockMetrics.call_args.args[4]) == ["audio_processor", "transcriber_0"]
+    assert pipeline._threads[-1] is MockMetrics.return_value
+
+
+def test_pipeline_wait_ready():
+    """The pipeline is ready once every stage reported itself ready."""
+    cfg = Config()
+    on_ready = MagicMock()
+
+    with (
+        patch("live_translation.server._pipeline.WebSocketIO") as MockWS,
+        patch("live_translation.server._pipeline.AudioProcessor") as MockAP,
+        patch("live_translation.server._pipeline.Transcriber") as MockTR,
+        patch("live_translation.server._pipeline.Translator") as MockTX,
+    ):
+        pipeline = PipelineManager(cfg)
+        for Mock in (MockAP, MockTR, MockTX):
+            assert Mock.call_args.kwargs["ready_queue"] is pipeline._ready_queue
+        assert MockWS.call_args.kwargs["ready_event"] is pipeline._ready_event
+        assert MockWS.call_args.kwargs["startup_done"] is pipeline._startup_done
+
+        pipeline.run_async(on_ready=on_ready)
+        assert not pipeline.wait_ready(timeout=0.1)
+        for name in ("audio_processor", "transcriber_0", "translator"):
+            pipeline._ready_queue.put((name, 1.0, None))
+        assert pipeline.wait_ready(timeout=5)
+        on_ready.assert_called_once_with(
+            {"audio_processor": 1.0, "transcriber_0": 1.0, "translator": 1.0}
+        )
+        assert pipeline._startup_done.wait(timeout=5)
+        pipeline.stop()
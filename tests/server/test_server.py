@@ -33,6 +33,22 @@ def test_server_run_blocking(MockPipelineManager):
     MockPipelineManager.return_value.run.assert_called_once()
 
 
+@mock.patch("live_translation.server.server.PipelineManager")
+def test_server_ready(MockPipelineManager):
+    cfg = Config()
+    server = LiveTranslationServer(cfg)
+    on_ready = mock.Mock()
+
+    server.run(blocking=False, on_ready=on_ready)
+    MockPipelineManager.return_value.run_async.assert_called_once_with(
+        on_ready=on_ready
+    )
+
+    MockPipelineManager.return_value.wait_ready.return_value = True
+    assert server.wait_ready(timeout=3) is True
+    MockPipelineManager.return_value.wait_ready.assert_called_once_with(3)
+
+
 @mock.patch("live_translation.server.server.PipelineManager")
 def test_server_run_non_blocking(MockPipelineManager):
     cfg = Config()
@@ -62,9 +62,47 @@ def test_server_cli_with_all_args(monkeypatch):
             "4",
             "--vad_aggressiveness",
             "5",
+            "--vad_streaming",
+            "--vad_pregate",
+            "--vad_backend",
+            "onnx",
             "--max_buffer_duration",
             "10",
             "--transcribe_only",
+            "--ipc_transport",
+            "shm",
+            "--transcription_mode",
+            "incremental",
+            "--compute_type",
+            "int8",
+            "--cpu_threads",
+            "8",
+            "--num_workers",
+            "2",
+            "--transcriber_workers",
+            "1",
+            "--trans_backend",
+            "ctranslate2",
+            "--trans_compute_type",
+            "int8_float32",
+            "--max_sessions",
+            "1",
+            "--processed_queue_size",
+            "8",
+            "--overload_policy",
+            "block",
+            "--metrics_port",
+            "9100",
+            "--trans_cache_size",
+            "256",
+            "--trans_cache_path",
+            "/tmp/cache.json",
+            "--translation_batch_size",
+            "4",
+            "--translation_batch_timeout_ms",
+            "20",
+            "--verify_model_online",
+            "--no_warmup",
         ],
     )
 
@@ -91,6 +129,29 @@ def test_server_cli_help(monkeypatch, capsys):
     assert "--log" in out
     assert "--ws_port" in out
     assert "--transcribe_only" in out
+    assert "--max_sessions" in out
+    assert "--trace" in out
+    assert "--metrics_port" in out
+    assert "--processed_queue_size" in out
+    assert "--overload_policy" in out
+    assert "--ipc_transport" in out
+    assert "--vad_streaming" in out
+    assert "--vad_pregate" in out
+    assert "--vad_backend" in out
+    assert "--vad_model_path" in out
+    assert "--transcription_mode" in out
+    assert "--compute_type" in out
+    assert "--cpu_threads" in out
+    assert "--num_workers" in out
+    assert "--transcriber_workers" in out
+    assert "--trans_backend" in out
+    assert "--trans_compute_type" in out
+    assert "--trans_cache_size" in out
+    assert "--trans_cache_path" in out
+    assert "--translation_batch_size" in out
+    assert "--translation_batch_timeout_ms" in out
+    assert "--verify_model_online" in out
+    assert "--no_warmup" in out
     assert "--version" in out
 
 
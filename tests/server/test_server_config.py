@@ -22,6 +22,29 @@ def test_config_defaults(default_config):
     assert default_config.VAD_AGGRESSIVENESS == 8
     assert default_config.MAX_BUFFER_DURATION == 7
     assert default_config.TRANSCRIBE_ONLY is False
+    assert default_config.IPC_TRANSPORT == "queue"
+    assert default_config.VAD_STREAMING is False
+    assert default_config.VAD_PREGATE is False
+    assert default_config.VAD_BACKEND == "torch"
+    assert default_config.VAD_MODEL_PATH is None
+    assert default_config.TRANSCRIPTION_MODE == "window"
+    assert default_config.COMPUTE_TYPE == "float32"
+    assert default_config.CPU_THREADS == 0
+    assert default_config.NUM_WORKERS == 1
+    assert default_config.TRANSCRIBER_WORKERS == 1
+    assert default_config.TRANSLATION_BATCH_SIZE == 1
+    assert default_config.TRANSLATION_BATCH_TIMEOUT_MS == 50
+    assert default_config.TRANS_BACKEND == "transformers"
+    assert default_config.TRANS_COMPUTE_TYPE == "int8"
+    assert default_config.TRANS_CACHE_SIZE == 1024
+    assert default_config.TRANS_CACHE_PATH is None
+    assert default_config.MAX_SESSIONS == 1
+    assert default_config.PROCESSED_QUEUE_SIZE == 0
+    assert default_config.OVERLOAD_POLICY == "block"
+    assert default_config.TRACE is False
+    assert default_config.METRICS_PORT is None
+    assert default_config.VERIFY_MODEL_ONLINE is False
+    assert default_config.WARMUP is True
 
 
 def test_config_modifiable_attributes():
@@ -88,6 +111,29 @@ def test_config_validate():
         {"max_buffer_duration": 4},
         {"silence_threshold": 1},
         {"codec": "random"},
+        {"ipc_transport": "random"},
+        {"vad_backend": "random"},
+        {"vad_model_path": "/does/not/exist.onnx"},
+        {"transcription_mode": "random"},
+        {"compute_type": "random"},
+        {"cpu_threads": -1},
+        {"num_workers": 0},
+        {"transcriber_workers": 0},
+        {"transcriber_workers": 2, "transcription_mode": "incremental"},
+        {"translation_batch_size": 0},
+        {"trans_cache_size": -1},
+        {"max_sessions": 0},
+        {"max_sessions": 2, "ipc_transport": "shm"},
+        {"max_sessions": 2, "transcription_mode": "incremental"},
+        {"processed_queue_size": -1},
+        {"overload_policy": "random"},
+        {"overload_policy": "drop", "transcription_mode": "incremental"},
+        {"trace": True, "ipc_transport": "shm"},
+        {"metrics_port": 0},
+        {"metrics_port": 8765},
+        {"translation_batch_timeout_ms": -1},
+        {"trans_backend": "random"},
+        {"trans_backend": "ctranslate2", "trans_compute_type": "random"},
     ]
 
     for config in invalid_configs:
@@ -117,13 +163,101 @@ def test_config_transcribe_only_skips_model_check():
 
 
 def test_general_exception():
-    with mock.patch(
-        "live_translation.server.config.hf_hub.model_info"
-    ) as mock_model_info:
+    with mock.patch("huggingface_hub.model_info") as mock_model_info:
         mock_model_info.side_effect = Exception("network timeout")
 
         with pytest.raises(
             ValueError,
             match="🚨 An error when verifying the translation model: network timeout",
         ):
-            Config(transcribe_only=False)
+            # A pair that is not in the registry is looked up online
+            Config(transcribe_only=False, tgt_lang="xx", verify_model_online=True)
+
+
+def test_config_known_pair_skips_network():
+    """Known OpusMT pairs are validated without a network round-trip."""
+    with mock.patch(
+        "huggingface_hub.model_info",
+        side_effect=RuntimeError("should not be called"),
+    ):
+        Config(src_lang="fr", tgt_lang="en", verify_model_online=True)
+
+
+def test_config_cached_model_skips_network():
+    """Models in the local Hugging Face cache are validated without a lookup."""
+    with (
+        mock.patch(
+            "huggingface_hub.try_to_load_from_cache",
+            return_value="/cache/config.json",
+        ),
+        mock.patch(
+            "huggingface_hub.model_info",
+            side_effect=RuntimeError("should not be called"),
+        ),
+    ):
+        Config(src_lang="en", tgt_lang="yy", verify_model_online=True)
+
+
+def test_config_unknown_pair_offline():
+    """Unknown, uncached pairs are rejected unless the online lookup is enabled."""
+    with (
+        mock.patch(
+            "huggingface_hub.try_to_load_from_cache",
+            return_value=None,
+        ),
+        mock.patch("huggingface_hub.model_info") as model_info,
+    ):
+        with pytest.raises(ValueError, match="verify_model_online"):
+            Config(src_lang="en", tgt_lang="zz")
+        model_info.assert_not_called()
+
+        # The online result is remembered for the process
+        Config(src_lang="en", tgt_lang="zz", verify_model_online=True)
+        Config(src_lang="en", tgt_lang="zz", verify_model_online=True)
+        Config(src_lang="en", tgt_lang="zz")
+        model_info.assert_called_once_with("Helsinki-NLP/opus-mt-en-zz")
+
+
+def test_config_compute_types_unknown_on_device():
+    """Compute types aren't checked if CTranslate2 can't query the device."""
+    from live_translation.server.config import _supported_compute_types
+
+    _supported_compute_types.cache_clear()
+    with (
+        mock.patch("torch.cuda.is_available", return_value=True),
+        mock.patch(
+            "ctranslate2.get_supported_compute_types",
+            side_effect=RuntimeError("CUDA driver version is insufficient"),
+        ),
+    ):
+        cfg = Config(device="cuda", compute_type="float16")
+    _supported_compute_types.cache_clear()
+    assert cfg.COMPUTE_TYPE == "float16"
+
+
+def test_config_replace():
+    """replace() copies the settings, applies the changes and validates them."""
+    cfg = Config(whisper_model="tiny", trans_cache_size=16)
+
+    replaced = cfg.replace(transcriber_workers=3)
+
+    assert replaced is not cfg
+    assert replaced.TRANSCRIBER_WORKERS == 3
+    assert replaced.WHISPER_MODEL == "tiny"
+    assert replaced.TRANS_CACHE_SIZE == 16
+    assert cfg.TRANSCRIBER_WORKERS == 1
+
+    with pytest.raises(ValueError, match="transcriber_workers"):
+        cfg.replace(transcriber_workers=0)
+
+
+def test_config_unsupported_trans_model_checked_first():
+    """An unsupported trans_model is rejected before looking the model up."""
+    with (
+        mock.patch("huggingface_hub.try_to_load_from_cache") as from_cache,
+        mock.patch("huggingface_hub.model_info") as model_info,
+    ):
+        with pytest.raises(ValueError, match="'trans_model' must be one of"):
+            Config(trans_model="facebook/nllb", verify_model_online=True)
+    from_cache.assert_not_called()
+    model_info.assert_not_called()
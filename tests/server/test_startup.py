@@ -0,0 +1,101 @@
+# tests/server/test_startup.py
+
+import queue
+import threading
+from unittest import mock
+import numpy as np
+from live_translation.server._startup import StartupMonitor, report_ready, warmup_audio
+
+
+def _stage(alive=True):
+    process = mock.Mock()
+    process.is_alive.return_value = alive
+    return process
+
+
+def test_report_ready():
+    ready_queue = queue.Queue()
+    report_ready(ready_queue, "translator", started=0.0)
+    name, seconds, warmup = ready_queue.get_nowait()
+    assert name == "translator"
+    assert seconds > 0
+    assert warmup is None
+
+    report_ready(ready_queue, "translator", started=0.0, warmup=0.25)
+    assert ready_queue.get_nowait()[2] == 0.25
+
+    report_ready(None, "translator", started=0.0)  # No-op without a queue
+
+
+def test_startup_monitor_ready(capsys):
+    """Once every stage is ready, the event is set and the callback called."""
+    ready_queue = queue.Queue()
+    ready_queue.put(("transcriber_0", 2.5, 0.75))
+    ready_queue.put(("audio_processor", 0.5, None))
+    ready_event = threading.Event()
+    done_event = threading.Event()
+    on_ready = mock.Mock()
+
+    monitor = StartupMonitor(
+        ready_queue,
+        {"audio_processor": _stage(), "transcriber_0": _stage()},
+        threading.Event(),
+        ready_event,
+        on_ready,
+        done_event=done_event,
+    )
+    monitor.run()
+
+    assert ready_event.is_set()
+    assert done_event.is_set()
+    on_ready.assert_called_once_with({"transcriber_0": 2.5, "audio_processor": 0.5})
+    out = capsys.readouterr().out
+    assert "⏱️ Startup: audio_processor loaded in 0.50s" in out
+    assert "⏱️ Startup: transcriber_0 loaded in 2.50s (warm-up 0.75s)" in out
+    assert "✅ Pipeline ready in" in out
+
+
+def test_startup_monitor_failed_stage(capsys):
+    """A stage that exits before being ready stops the pipeline."""
+    ready_queue = queue.Queue()
+    ready_queue.put(("audio_processor", 0.5, None))
+    stop_event = threading.Event()
+    ready_event = threading.Event()
+
+    monitor = StartupMonitor(
+        ready_queue,
+        {"audio_processor": _stage(), "translator": _stage(alive=False)},
+        stop_event,
+        ready_event,
+    )
+    monitor.run()
+
+    assert stop_event.is_set()
+    assert not ready_event.is_set()
+    assert "🚨 Startup: translator stopped before being ready" in (
+        capsys.readouterr().out
+    )
+
+
+def test_startup_monitor_stopped():
+    """The monitor returns without being ready when the pipeline is stopped."""
+    stop_event = threading.Event()
+    stop_event.set()
+    ready_event = threading.Event()
+    done_event = threading.Event()
+
+    StartupMonitor(
+        queue.Queue(), {"a": _stage()}, stop_event, ready_event, done_event=done_event
+    ).run()
+
+    assert not ready_event.is_set()
+    assert done_event.is_set()
+
+
+def test_warmup_audio():
+    """The warm-up utterance is a tone between two silences."""
+    audio = warmup_audio(16000)
+    assert audio.dtype == np.float32
+    assert len(audio) == 32000
+    assert not audio[:8000].any() and not audio[-8000:].any()
+    assert np.abs(audio[8000:24000]).max() > 0.1
@@ -0,0 +1,56 @@
+# tests/server/test_trace.py
+
+from live_translation.server._trace import LatencyHistograms, breakdown, stamp
+
+
+def test_stamp():
+    """Stamps record monotonic times, and are a no-op without a trace."""
+    trace = stamp({}, "received")
+    stamp(trace, "decoded")
+    assert trace["decoded"] >= trace["received"]
+    assert stamp(None, "received") is None
+
+
+def test_breakdown():
+    """Only stages with both stamps are broken down, in milliseconds."""
+    trace = {
+        "received": 10.0,
+        "decoded": 10.001,
+        "vad": 10.003,
+        "enqueued": 10.003,
+        "transcribe_start": 10.013,
+        "transcribe_end": 10.513,
+        "sent": 10.6,
+    }
+    assert breakdown(trace) == {
+        "decode_ms": 1.0,
+        "vad_ms": 2.0,
+        "buffer_ms": 0.0,
+        "transcribe_wait_ms": 10.0,
+        "transcribe_ms": 500.0,
+        "total_ms": 600.0,
+    }
+
+
+def test_latency_histograms(capfd):
+    """Durations are counted per stage in cumulative buckets."""
+    histograms = LatencyHistograms()
+    for ms in (0.5, 3, 3, 40, 90000):
+        histograms.record({"total_ms": ms, "decode_ms": 0.1})
+
+    assert histograms.stages() == ["decode", "total"]
+    assert histograms.count("total") == 5
+    assert histograms.total("total") == 90046.5
+    cumulative = histograms.cumulative("total")
+    assert cumulative[0] == 1  # <= 1 ms
+    assert cumulative[2] == 3  # <= 5 ms
+    assert cumulative[-2] == 4  # <= 30 s
+    assert cumulative[-1] == 5  # Overall
+    assert histograms.percentile("total", 0.5) == 5
+    assert histograms.percentile("total", 0.99) == float("inf")
+    assert histograms.percentile("vad", 0.5) == 0
+
+    histograms.report()
+    out = capfd.readouterr().out
+    assert "⏱️ Latency decode: n=5" in out
+    assert "⏱️ Latency total: n=5" in out
@@ -5,8 +5,11 @@ from unittest.mock import MagicMock, patch
 import wave
 import numpy as np
 import pytest
+import threading
+import time
 import websockets
 import multiprocessing as mp
+from live_translation._audio._shm import SharedAudioRing
 from live_translation.server._ws import ClientDisconnected, WebSocketIO
 from live_translation.server.config import Config
 
@@ -208,6 +211,8 @@ async def test_websocketio_logger_called(capsys):
         decoded = json.loads(msg)
         assert decoded["transcription"] == "hello"
 
+        # The entry is logged once it has been sent
+        await asyncio.sleep(0.1)
         out, _ = capsys.readouterr()
         assert "📝 hello" in out
         assert "🌍 bonjour" in out
@@ -268,23 +273,242 @@ def test_websocketio_flush_queues(capsys):
     output_queue = mp.Queue()
     cfg = Config(ws_port=port)
 
+    ws = WebSocketIO(port, audio_queue, output_queue, stop_event, cfg)
+
     # Put dummy data into queues
     for _ in range(3):
         audio_queue.put(b"audio")
-        output_queue.put({"transcription": "dummy", "translation": "dummy"})
-
-    ws = WebSocketIO(port, audio_queue, output_queue, stop_event, cfg)
+        ws._output.put_nowait({"transcription": "dummy", "translation": "dummy"})
+    time.sleep(0.1)  # Let the queue's feeder thread flush
 
     assert not audio_queue.empty()
-    assert not output_queue.empty()
 
     ws._flush_queues()
 
     # Validate queues are flushed
     assert audio_queue.empty()
-    assert output_queue.empty()
+    assert ws._output.empty()
 
     # Capture and check printed output
     out, _ = capsys.readouterr()
     assert "🧹 Flushing queues..." in out
     assert "🧹 Queues flushed." in out
+
+
+def test_websocketio_flush_leaves_shared_ring():
+    """The shared-memory ring is only consumed by the audio processor."""
+    ring = SharedAudioRing(8, 640)
+    try:
+        ring.put(np.ones(640, dtype=np.int16))
+        ws = WebSocketIO(8883, ring, mp.Queue(), mp.Event(), Config())
+        ws._flush_queues()
+        assert ring.qsize() == 1
+    finally:
+        ring.close()
+
+
+@pytest.mark.asyncio
+async def test_websocketio_drops_output_without_client():
+    """Output arriving while no client is connected is dropped, not queued."""
+    ws_io = WebSocketIO(8881, mp.Queue(), mp.Queue(), mp.Event(), Config())
+    entry = {"transcription": "hello", "translation": "hola"}
+
+    ws_io._dispatch_output(dict(entry))
+    assert ws_io._output.empty()
+
+    async with ws_io._connection_lock:
+        ws_io._dispatch_output(dict(entry))
+    assert ws_io._output.get_nowait() == entry
+
+
+def test_websocketio_orders_worker_output():
+    """Transcribe only output from several workers is sent in `seq` order."""
+    cfg = Config(transcribe_only=True, transcriber_workers=2)
+    ws_io = WebSocketIO(8880, mp.Queue(), mp.Queue(), mp.Event(), cfg)
+
+    assert ws_io._ordered({"seq": 1, "transcription": "b"}) == []
+    assert ws_io._ordered({"seq": 2, "transcription": ""}) == []
+    assert ws_io._ordered({"seq": 0, "transcription": "a"}) == [
+        {"transcription": "a"},
+        {"transcription": "b"},
+    ]
+    # An unstable tail alone is still sent
+    assert ws_io._ordered({"seq": 3, "transcription": "", "unstable": "c"}) == [
+        {"transcription": "", "unstable": "c"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_websocketio_sessions():
+    """Each client gets a session: audio is tagged and output is routed back."""
+    port = 8881
+    stop_event = mp.Event()
+    audio_queue = mp.Queue()
+    output_queue = mp.Queue()
+    cfg = Config(ws_port=port, codec="pcm", max_sessions=2)
+
+    ws_io = WebSocketIO(port, audio_queue, output_queue, stop_event, cfg)
+    ws_io.daemon = True
+    ws_io.start()
+
+    await asyncio.sleep(0.5)
+
+    uri = f"ws://localhost:{port}"
+    client0 = await websockets.connect(uri)
+    await asyncio.sleep(0.1)
+    client1 = await websockets.connect(uri)
+
+    # A third client is over the limit
+    client2 = await websockets.connect(uri)
+    with pytest.raises(websockets.exceptions.ConnectionClosedError) as e:
+        await asyncio.wait_for(client2.recv(), timeout=2)
+    assert e.value.rcvd.code == 1008
+    assert "Only 2 clients allowed" in e.value.rcvd.reason
+
+    await client1.send(np.ones(640, dtype=np.int16).tobytes())
+    sid, audio = audio_queue.get(timeout=2)
+    assert sid == 1 and len(audio) == 640
+
+    for session in (1, 0):
+        output_queue.put(
+            {"transcription": f"for {session}", "translation": "", "session": session}
+        )
+    msg0 = json.loads(await asyncio.wait_for(client0.recv(), timeout=2))
+    msg1 = json.loads(await asyncio.wait_for(client1.recv(), timeout=2))
+    assert msg0 == {"transcription": "for 0", "translation": ""}
+    assert msg1 == {"transcription": "for 1", "translation": ""}
+
+    # Disconnecting ends the session in the audio processor, once the heartbeat
+    # notices it
+    await client0.close()
+    assert audio_queue.get(timeout=7) == (0, None)
+
+    await client1.close()
+    stop_event.set()
+    ws_io.join(timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_websocketio_trace():
+    """Audio frames get a trace, and output carries its per-stage breakdown."""
+    port = 8883
+    stop_event = mp.Event()
+    audio_queue = mp.Queue()
+    output_queue = mp.Queue()
+    cfg = Config(ws_port=port, codec="pcm", trace=True)
+
+    ws_io = WebSocketIO(port, audio_queue, output_queue, stop_event, cfg)
+    ws_io.daemon = True
+    ws_io.start()
+
+    await asyncio.sleep(0.5)
+
+    async with websockets.connect(f"ws://localhost:{port}") as client:
+        await client.send(np.ones(640, dtype=np.int16).tobytes())
+        sid, audio, trace = audio_queue.get(timeout=2)
+        assert sid is None and len(audio) == 640
+        assert trace["decoded"] >= trace["received"]
+
+        output_queue.put(
+            {
+                "transcription": "hello",
+                "translation": "hola",
+                "trace": {**trace, "translate_start": trace["decoded"]},
+            }
+        )
+        msg = json.loads(await asyncio.wait_for(client.recv(), timeout=2))
+        assert set(msg["trace"]) == {"decode_ms", "total_ms"}
+        assert msg["trace"]["total_ms"] >= msg["trace"]["decode_ms"]
+        assert ws_io._latency.count("total") == 1
+
+    stop_event.set()
+    ws_io.join(timeout=2)
+
+
+def test_websocketio_bridge_output():
+    """The bridge thread hands output entries to the event loop as they arrive."""
+    stop_event = mp.Event()
+    output_queue = mp.Queue()
+    ws_io = WebSocketIO(8882, mp.Queue(), output_queue, stop_event, Config())
+    loop = asyncio.new_event_loop()
+    # A client is connected, output without one is dropped
+    loop.run_until_complete(ws_io._connection_lock.acquire())
+    bridge = threading.Thread(target=ws_io._bridge_output, args=(loop,))
+    bridge.start()
+
+    output_queue.put({"seq": 0, "transcription": "hello", "translation": "hola"})
+    entry = loop.run_until_complete(asyncio.wait_for(ws_io._output.get(), timeout=2))
+    assert entry == {"transcription": "hello", "translation": "hola"}
+
+    output_queue.put(None)  # Stops the bridge
+    bridge.join(timeout=2)
+    assert not bridge.is_alive()
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_websocketio_waits_for_ready():
+    """Clients are only accepted once the pipeline is ready."""
+    port = 8885
+    stop_event = mp.Event()
+    ready_event = threading.Event()
+    cfg = Config(ws_port=port, codec="pcm")
+
+    ws_io = WebSocketIO(
+        port, mp.Queue(), mp.Queue(), stop_event, cfg, ready_event=ready_event
+    )
+    ws_io.daemon = True
+    ws_io.start()
+
+    await asyncio.sleep(0.5)
+    with pytest.raises(OSError):
+        await websockets.connect(f"ws://localhost:{port}")
+
+    ready_event.set()
+    await asyncio.sleep(0.5)
+    async with websockets.connect(f"ws://localhost:{port}"):
+        pass
+
+    stop_event.set()
+    ws_io.join(timeout=2)
+
+
+def test_websocketio_stopped_before_ready():
+    """The listener isn't started if the pipeline stops while starting."""
+    stop_event = mp.Event()
+    stop_event.set()
+    startup_done = threading.Event()
+    startup_done.set()
+    ws_io = WebSocketIO(
+        8886,
+        mp.Queue(),
+        mp.Queue(),
+        stop_event,
+        Config(),
+        ready_event=threading.Event(),
+        startup_done=startup_done,
+    )
+    ws_io.run()
+    assert ws_io._loop is None
+
+
+@pytest.mark.asyncio
+async def test_websocketio_stops_with_client_connected():
+    """A connected client's sender, waiting for output, is cancelled on stop."""
+    port = 8887
+    stop_event = mp.Event()
+    cfg = Config(ws_port=port, codec="pcm")
+
+    ws_io = WebSocketIO(port, mp.Queue(), mp.Queue(), stop_event, cfg)
+    ws_io.daemon = True
+    ws_io.start()
+
+    await asyncio.sleep(0.5)
+    async with websockets.connect(f"ws://localhost:{port}"):
+        await asyncio.sleep(0.2)
+        assert len(ws_io._senders) == 1
+
+        stop_event.set()
+        await asyncio.sleep(0.2)
+        assert not ws_io._senders
+    ws_io.join(timeout=2)
@@ -0,0 +1,52 @@
+from live_translation._transcription._agreement import LocalAgreement, Word
+
+
+def _words(*items):
+    """Build words from (start, text) pairs, each word lasting 0.4s."""
+    return [Word(start, start + 0.4, text) for start, text in items]
+
+
+def test_agreement_commits_common_prefix():
+    """Words are committed once two consecutive hypotheses agree on them."""
+    agreement = LocalAgreement()
+
+    committed, unstable = agreement.update(_words((0.0, " Hello"), (0.5, " word")))
+    assert committed == []
+    assert [w.text for w in unstable] == [" Hello", " word"]
+
+    committed, unstable = agreement.update(
+        _words((0.0, " hello,"), (0.5, " world"), (1.0, " again"))
+    )
+    # Case and punctuation don't matter, the latest spelling is committed
+    assert [w.text for w in committed] == [" hello,"]
+    assert [w.text for w in unstable] == [" world", " again"]
+    assert agreement.committed_end == 0.4
+
+
+def test_agreement_ignores_committed_words():
+    """Committed words are never emitted again, even if re-transcribed."""
+    agreement = LocalAgreement()
+    agreement.update(_words((0.0, " one"), (0.5, " two")))
+    agreement.update(_words((0.0, " one"), (0.5, " two")))
+
+    # Buffer trimmed at 0.9s: 'two' is transcribed again with a shifted timestamp
+    committed, unstable = agreement.update(_words((0.6, " two"), (1.0, " three")))
+    assert committed == []
+    assert [w.text for w in unstable] == [" three"]
+
+    committed, _ = agreement.update(_words((0.6, " two"), (1.0, " three")))
+    assert [w.text for w in committed] == [" three"]
+
+
+def test_agreement_complete_and_committed_before():
+    """complete() commits the latest hypothesis and starts a new utterance."""
+    agreement = LocalAgreement()
+    agreement.update(_words((0.0, " a"), (0.5, " b")))
+    agreement.update(_words((0.0, " a"), (0.5, " c")))
+
+    assert [w.text for w in agreement.committed_before(0.4)] == [" a"]
+    assert agreement.committed_before(0.3) == []
+
+    assert [w.text for w in agreement.complete()] == [" c"]
+    assert agreement.committed_end == 0.0
+    assert agreement.complete() == []
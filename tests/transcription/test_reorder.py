@@ -0,0 +1,24 @@
+from live_translation._transcription._reorder import SequenceReorderer
+
+
+def test_reorderer_releases_in_order():
+    """Items are held until all earlier sequence numbers have arrived."""
+    reorderer = SequenceReorderer()
+
+    assert reorderer.push(1, "b") == []
+    assert reorderer.push(2, "c") == []
+    assert len(reorderer) == 2
+    assert reorderer.push(0, "a") == ["a", "b", "c"]
+    assert reorderer.push(3, "d") == ["d"]
+    assert len(reorderer) == 0
+
+
+def test_reorderer_skips_missing_item():
+    """A missing item doesn't stall the output once too many items wait on it."""
+    reorderer = SequenceReorderer(max_pending=2)
+
+    assert reorderer.push(1, "b") == []
+    assert reorderer.push(2, "c") == []
+    assert reorderer.push(3, "d") == ["b", "c", "d"]
+    # The missing item arriving late is dropped
+    assert reorderer.push(0, "a") == []
@@ -2,9 +2,14 @@ from unittest import mock
 import pytest
 import numpy as np
 import multiprocessing as mp
+import queue
 import time
 import torchaudio
+from live_translation._audio._buffer import AudioRingBuffer
+from live_translation._audio._shm import SegmentArena
+from live_translation._transcription._agreement import LocalAgreement
 from live_translation._transcription._transcriber import Transcriber
+from live_translation.server._metrics import PipelineStats
 from live_translation.server.config import Config
 
 
@@ -79,6 +84,7 @@ def test_transcriber_pipeline_output_queue(
 
     entry = output_queue.get()
     stop_event.set()
+    processed_audio_queue.put(None)  # Wake the transcriber up
     transcriber.join(timeout=3)
     if transcriber.is_alive():
         transcriber.terminate()
@@ -99,7 +105,7 @@ def test_transcriber_pipeline_transcription_queue(
     transcription_queue,
     real_speech,
 ):
-    # Transcriber in full pipeline mode → sends plain text to transcription_queue
+    # Transcriber in full pipeline mode → sends text items to transcription_queue
     config = Config(transcribe_only=False)
     output_queue = mp.Queue()  # still required but unused
 
@@ -127,12 +133,14 @@ def test_transcriber_pipeline_transcription_queue(
     assert output_queue.empty(), "Output queue should be empty"
     transcription = transcription_queue.get()
     stop_event.set()
+    processed_audio_queue.put(None)  # Wake the transcriber up
     transcriber.join(timeout=3)
     if transcriber.is_alive():
         transcriber.terminate()
 
-    assert isinstance(transcription, str)
-    assert len(transcription.strip()) > 0
+    assert isinstance(transcription, dict)
+    assert transcription["seq"] == 0
+    assert len(transcription["transcription"].strip()) > 0
 
 
 def test_transcriber_skip_empty_transcription():
@@ -166,6 +174,7 @@ def test_transcriber_skip_empty_transcription():
         time.sleep(0.1)
 
     stop_event.set()
+    processed_audio_queue.put(None)  # Wake the transcriber up
     transcriber.join(timeout=5)
     if transcriber.is_alive():
         transcriber.terminate()
@@ -216,3 +225,369 @@ def test_transcriber_cleanup_exception(capfd):
 
     out, _ = capfd.readouterr()
     assert "🚨 Transcriber Cleanup Error: fail on close" in out
+
+
+def test_transcriber_reads_segment_from_arena():
+    """A SegmentRef is transcribed from shared memory and its slot released."""
+    arena = SegmentArena(slots=1, slot_size=16000)
+    ref = arena.write([np.full(16000, 0.1, dtype=np.float32)])
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put(ref)
+    output_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+
+    transcriber = Transcriber(
+        processed_audio_queue=processed_audio_queue,
+        transcription_queue=mock.Mock(),
+        stop_event=stop_event,
+        cfg=Config(transcribe_only=True, warmup=False),
+        output_queue=output_queue,
+        arena=arena,
+    )
+
+    seen = {}
+
+    def fake_transcribe(audio, language):
+        seen["owndata"] = audio.flags.owndata
+        seen["dtype"] = audio.dtype
+        return [mock.Mock(text=" hello")], None
+
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.side_effect = fake_transcribe
+        transcriber.run()
+
+    assert seen == {"owndata": False, "dtype": np.float32}
+    assert output_queue.get_nowait()["transcription"] == " hello"
+    assert arena.in_use() == 0, "Slot should be released after transcription"
+    arena.close()
+
+
+def test_transcriber_incremental_mode():
+    """Only newly committed text is emitted, with the unstable tail."""
+    processed_audio_queue = queue.Queue()
+    for _ in range(3):
+        processed_audio_queue.put(np.full(16000, 0.1, dtype=np.float32))
+    processed_audio_queue.put(np.empty(0, dtype=np.float32))  # End of utterance
+    output_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+
+    transcriber = Transcriber(
+        processed_audio_queue=processed_audio_queue,
+        transcription_queue=mock.Mock(),
+        stop_event=stop_event,
+        cfg=Config(
+            transcribe_only=True, transcription_mode="incremental", warmup=False
+        ),
+        output_queue=output_queue,
+    )
+
+    def word(start, text):
+        return mock.Mock(start=start, end=start + 0.4, word=text)
+
+    # Hypotheses for 1s, 2s and 3s of buffered audio
+    hypotheses = [
+        [word(0.0, " Hello")],
+        [word(0.0, " Hello"), word(0.5, " there"), word(1.2, " my")],
+        [word(0.0, " Hello"), word(0.5, " there"), word(1.2, " friend")],
+    ]
+    buffer_lengths = []
+
+    def fake_transcribe(audio, **kwargs):
+        buffer_lengths.append(len(audio))
+        assert kwargs["word_timestamps"] is True
+        return [mock.Mock(words=hypotheses.pop(0))], None
+
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.side_effect = fake_transcribe
+        transcriber.run()
+
+    entries = []
+    while not output_queue.empty():
+        entries.append(output_queue.get_nowait())
+
+    assert buffer_lengths == [16000, 32000, 48000]
+    assert [(e["transcription"], e["unstable"]) for e in entries] == [
+        ("", "Hello"),  # Nothing committed yet, only the unstable tail
+        ("Hello", "there my"),
+        ("there", "friend"),
+        ("friend", ""),  # Committed by the end of utterance
+    ]
+    assert len(transcriber._stream) == 0
+
+
+def test_transcriber_incremental_trims_committed_audio():
+    """Past MAX_BUFFER_DURATION, committed audio is trimmed from the stream."""
+    transcriber = Transcriber(
+        processed_audio_queue=mock.Mock(),
+        transcription_queue=mock.Mock(),
+        stop_event=mock.Mock(),
+        cfg=Config(transcribe_only=True, transcription_mode="incremental"),
+        output_queue=mock.Mock(),
+    )
+    transcriber._stream = AudioRingBuffer(16000 * 14)
+    transcriber._agreement = LocalAgreement()
+    transcriber.whisper_model = mock.Mock()
+    words = [mock.Mock(start=float(i), end=i + 0.5, word=f" w{i}") for i in range(8)]
+    transcriber.whisper_model.transcribe.return_value = (
+        [mock.Mock(words=words)],
+        None,
+    )
+
+    transcriber._transcribe_incremental(np.zeros(16000 * 8, dtype=np.float32))
+    assert len(transcriber._stream) == 16000 * 8, "Nothing committed yet"
+
+    committed, _ = transcriber._transcribe_incremental(
+        np.zeros(16000, dtype=np.float32)
+    )
+
+    assert committed.startswith("w0 w1")
+    # Trimmed up to the end of the last committed word (7.5s)
+    assert transcriber._stream_offset == 7.5
+    assert len(transcriber._stream) == 16000 * 9 - 16000 * 7.5
+    # Committed words out of the stream are passed as the prompt
+    transcriber._transcribe_incremental(np.zeros(16000, dtype=np.float32))
+    prompt = transcriber.whisper_model.transcribe.call_args.kwargs["initial_prompt"]
+    assert prompt.endswith("w6 w7")
+
+
+def test_transcriber_whisper_settings(capfd):
+    """Compute type, threads and workers are passed to Whisper and reported."""
+    stop_event = mp.Event()
+    stop_event.set()
+    transcriber = Transcriber(
+        processed_audio_queue=queue.Queue(),
+        transcription_queue=mock.Mock(),
+        stop_event=stop_event,
+        cfg=Config(compute_type="int8", cpu_threads=4, num_workers=2),
+        output_queue=mock.Mock(),
+    )
+
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.model.compute_type = "int8_float32"
+        transcriber.run()
+
+    MockWhisper.assert_called_once_with(
+        "base", device="cpu", compute_type="int8", cpu_threads=4, num_workers=2
+    )
+    out, _ = capfd.readouterr()
+    assert "compute_type=int8_float32, cpu_threads=4, num_workers=2" in out
+
+
+def test_transcriber_workers_share_sequence():
+    """Workers number segments in queue order and keep empty placeholders."""
+    processed_audio_queue = queue.Queue()
+    for _ in range(3):
+        processed_audio_queue.put(np.zeros(16000, dtype=np.float32))
+    output_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+    seq_counter = mp.Value("q", 0)
+    cfg = Config(
+        transcriber_workers=2, cpu_threads=8, transcribe_only=True, warmup=False
+    )
+
+    workers = [
+        Transcriber(
+            processed_audio_queue,
+            transcription_queue=mock.Mock(),
+            stop_event=stop_event,
+            cfg=cfg,
+            output_queue=output_queue,
+            worker_id=i,
+            seq_counter=seq_counter,
+        )
+        for i in range(2)
+    ]
+    texts = iter([" one", "", " three"])
+
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.side_effect = lambda audio, language: (
+            [mock.Mock(text=next(texts))],
+            None,
+        )
+        # First worker takes one segment, the second one drains the rest
+        workers[0]._audio_queue = mock.Mock(wraps=processed_audio_queue)
+        workers[0]._audio_queue.empty.side_effect = [False, True]
+        workers[0].run()
+        workers[1].run()
+
+    # The thread budget is split between workers
+    assert MockWhisper.call_args.kwargs["cpu_threads"] == 4
+
+    items = []
+    while not output_queue.empty():
+        items.append(output_queue.get_nowait())
+    assert [(item["seq"], item["transcription"]) for item in items] == [
+        (0, " one"),
+        (1, ""),
+        (2, " three"),
+    ]
+
+
+def test_transcriber_tags_session():
+    """With several sessions, items carry the session of their segment."""
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put((3, np.zeros(16000, dtype=np.float32)))
+    transcription_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+
+    transcriber = Transcriber(
+        processed_audio_queue,
+        transcription_queue=transcription_queue,
+        stop_event=stop_event,
+        cfg=Config(max_sessions=2),
+        output_queue=mock.Mock(),
+    )
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.return_value = (
+            [mock.Mock(text=" hello")],
+            None,
+        )
+        transcriber.run()
+
+    assert transcription_queue.get_nowait() == {
+        "seq": 0,
+        "transcription": " hello",
+        "session": 3,
+    }
+
+
+def test_transcriber_stamps_trace():
+    """With tracing, items carry the segment's trace with transcription times."""
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put(
+        (None, np.zeros(16000, dtype=np.float32), {"enqueued": 1.0})
+    )
+    transcription_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+
+    transcriber = Transcriber(
+        processed_audio_queue,
+        transcription_queue=transcription_queue,
+        stop_event=stop_event,
+        cfg=Config(trace=True),
+        output_queue=mock.Mock(),
+    )
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.return_value = (
+            [mock.Mock(text=" hello")],
+            None,
+        )
+        transcriber.run()
+
+    item = transcription_queue.get_nowait()
+    assert "session" not in item
+    trace = item["trace"]
+    assert trace["enqueued"] == 1.0
+    assert trace["transcribe_end"] >= trace["transcribe_start"]
+
+
+def test_transcriber_records_real_time_factor():
+    """Transcription times are recorded against the audio duration."""
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put(np.zeros(32000, dtype=np.float32))
+    processed_audio_queue.put(None)
+    stats = PipelineStats()
+
+    transcriber = Transcriber(
+        processed_audio_queue,
+        transcription_queue=queue.Queue(),
+        stop_event=mp.Event(),
+        cfg=Config(),
+        output_queue=mock.Mock(),
+        stats=stats,
+    )
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.return_value = ([], None)
+        transcriber.run()
+
+    assert stats.audio_seconds.value == 2.0
+    assert stats.whisper_rtf.snapshot()[0][-1] == 1
+
+
+def test_transcriber_stops_on_sentinel():
+    """A `None` segment stops the worker without consuming a sequence number."""
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put(None)
+    seq_counter = mp.Value("q", 0)
+
+    transcriber = Transcriber(
+        processed_audio_queue,
+        transcription_queue=mock.Mock(),
+        stop_event=mp.Event(),
+        cfg=Config(),
+        output_queue=mock.Mock(),
+        seq_counter=seq_counter,
+    )
+    with mock.patch("live_translation._transcription._transcriber.WhisperModel"):
+        transcriber.run()  # Returns without the stop event being set
+
+    assert seq_counter.value == 0
+
+
+@pytest.mark.parametrize("mode", ["window", "incremental"])
+def test_transcriber_warms_up(mode):
+    """A synthetic utterance is transcribed before the worker reports ready."""
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put(None)
+    ready_queue = queue.Queue()
+
+    transcriber = Transcriber(
+        processed_audio_queue,
+        transcription_queue=mock.Mock(),
+        stop_event=mp.Event(),
+        cfg=Config(transcription_mode=mode),
+        output_queue=mock.Mock(),
+        ready_queue=ready_queue,
+    )
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        MockWhisper.return_value.transcribe.return_value = ([], None)
+        transcriber.run()
+
+    call = MockWhisper.return_value.transcribe.call_args
+    assert len(call.args[0]) == 32000
+    assert call.kwargs["word_timestamps"] == (mode == "incremental")
+    name, _, warmup = ready_queue.get_nowait()
+    assert name == "transcriber_0" and warmup >= 0
+
+
+def test_transcriber_warmup_disabled():
+    processed_audio_queue = queue.Queue()
+    processed_audio_queue.put(None)
+    ready_queue = queue.Queue()
+
+    transcriber = Transcriber(
+        processed_audio_queue,
+        transcription_queue=mock.Mock(),
+        stop_event=mp.Event(),
+        cfg=Config(warmup=False),
+        output_queue=mock.Mock(),
+        ready_queue=ready_queue,
+    )
+    with mock.patch(
+        "live_translation._transcription._transcriber.WhisperModel"
+    ) as MockWhisper:
+        transcriber.run()
+
+    MockWhisper.return_value.transcribe.assert_not_called()
+    assert ready_queue.get_nowait()[2] is None
@@ -0,0 +1,71 @@
+from unittest import mock
+import pytest
+from live_translation._translation import _backends
+from live_translation._translation._backends import (
+    CTranslate2Backend,
+    TransformersBackend,
+)
+from live_translation.server.config import Config
+
+
+@pytest.fixture
+def tokenizer():
+    return mock.Mock()
+
+
+def test_transformers_backend_pads_and_splits(tokenizer):
+    """One padded generate call, decoded back into one translation per text."""
+    with mock.patch("transformers.MarianMTModel.from_pretrained"):
+        backend = TransformersBackend("model", tokenizer, Config())
+    tokenizer.return_value.to.return_value = {"input_ids": "ids"}
+    tokenizer.batch_decode.return_value = ["uno", "dos"]
+
+    assert backend.translate_batch(["one", "two"]) == ["uno", "dos"]
+
+    tokenizer.assert_called_once_with(["one", "two"], return_tensors="pt", padding=True)
+    backend.model.generate.assert_called_once_with(input_ids="ids")
+
+
+def test_ctranslate2_backend_converts_once(tmp_path, monkeypatch):
+    """The model is converted on first use and loaded from the cache after."""
+    monkeypatch.setattr(_backends, "CT2_CACHE_DIR", str(tmp_path))
+
+    def fake_convert(output_dir, force):
+        (tmp_path / output_dir / "model.bin").write_bytes(b"")
+
+    with mock.patch("ctranslate2.converters.TransformersConverter") as Converter:
+        Converter.return_value.convert.side_effect = fake_convert
+        first = CTranslate2Backend.converted_model("Helsinki-NLP/opus-mt-en-es")
+        second = CTranslate2Backend.converted_model("Helsinki-NLP/opus-mt-en-es")
+
+    assert first == second == str(tmp_path / "Helsinki-NLP--opus-mt-en-es")
+    assert (tmp_path / "Helsinki-NLP--opus-mt-en-es" / "model.bin").exists()
+    Converter.assert_called_once_with("Helsinki-NLP/opus-mt-en-es")
+    # No temporary conversion directory is left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["Helsinki-NLP--opus-mt-en-es"]
+
+
+def test_ctranslate2_backend_translate_batch(tokenizer):
+    """Texts are translated as token batches and decoded back to text."""
+    cfg = Config(trans_backend="ctranslate2", trans_compute_type="int8")
+    tokenizer.encode.side_effect = lambda text: [len(text)]
+    tokenizer.convert_ids_to_tokens.side_effect = lambda ids: [f"tok{ids[0]}"]
+    tokenizer.convert_tokens_to_ids.side_effect = lambda tokens: tokens
+    tokenizer.decode.side_effect = lambda ids, skip_special_tokens: "-".join(ids)
+
+    with (
+        mock.patch.object(CTranslate2Backend, "converted_model", return_value="m"),
+        mock.patch("ctranslate2.Translator") as Translator,
+    ):
+        backend = CTranslate2Backend("model", tokenizer, cfg)
+        Translator.return_value.translate_batch.return_value = [
+            mock.Mock(hypotheses=[["uno"]]),
+            mock.Mock(hypotheses=[["dos", "tres"]]),
+        ]
+        result = backend.translate_batch(["one", "three"])
+
+    Translator.assert_called_once_with("m", device="cpu", compute_type="int8")
+    Translator.return_value.translate_batch.assert_called_once_with(
+        [["tok3"], ["tok5"]]
+    )
+    assert result == ["uno", "dos-tres"]
@@ -0,0 +1,94 @@
+from live_translation._translation._cache import TranslationCache
+
+
+def test_cache_hits_and_misses():
+    """Lookups are counted and keyed by model and normalized text."""
+    cache = TranslationCache(capacity=4)
+    assert cache.get("model", "Hello world") is None
+
+    cache.put("model", "Hello world", "Hola mundo")
+    # Whitespace differences share an entry, other models don't
+    assert cache.get("model", "  Hello   world ") == "Hola mundo"
+    assert cache.get("other-model", "Hello world") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_evicts_least_recently_used():
+    """The least recently used entry is evicted when the cache is full."""
+    cache = TranslationCache(capacity=2)
+    cache.put("model", "a", "A")
+    cache.put("model", "b", "B")
+    cache.get("model", "a")  # 'b' is now the least recently used
+    cache.put("model", "c", "C")
+
+    assert len(cache) == 2
+    assert cache.get("model", "b") is None
+    assert cache.get("model", "a") == "A"
+    assert cache.get("model", "c") == "C"
+
+
+def test_cache_disabled():
+    """A capacity of 0 disables caching."""
+    cache = TranslationCache(capacity=0)
+    cache.put("model", "a", "A")
+    assert len(cache) == 0
+    assert cache.get("model", "a") is None
+
+
+def test_cache_save_and_load(tmp_path):
+    """A saved cache is loaded back with its entries and their LRU order."""
+    path = tmp_path / "cache" / "translations.json"
+    cache = TranslationCache(capacity=3, path=str(path))
+    cache.put("model", "a", "A")
+    cache.put("model", "b", "B")
+    cache.put("model", "c", "C")
+    cache.get("model", "a")
+    cache.save()
+
+    # A smaller cache keeps the most recently used entries
+    loaded = TranslationCache(capacity=2, path=str(path))
+    loaded.load()
+    assert len(loaded) == 2
+    assert loaded.get("model", "a") == "A"
+    assert loaded.get("model", "c") == "C"
+    assert loaded.get("model", "b") is None
+
+
+def test_cache_load_invalid_file(tmp_path, capsys):
+    """An unreadable cache file is reported and ignored."""
+    path = tmp_path / "translations.json"
+    path.write_text("not json")
+    cache = TranslationCache(capacity=2, path=str(path))
+    cache.load()
+
+    assert len(cache) == 0
+    assert "🚨 Translation cache: Could not load" in capsys.readouterr().out
+
+
+def test_cache_save_uses_unique_temp_file(tmp_path):
+    """Saves don't share a temporary file, and leave none behind."""
+    path = tmp_path / "translations.json"
+    (tmp_path / "translations.json.tmp").write_text("another writer")
+    cache = TranslationCache(capacity=2, path=str(path))
+    cache.put("model", "a", "A")
+    cache.save()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "translations.json",
+        "translations.json.tmp",
+    ]
+    assert cache.items() == [("model\na", "A")]
+
+
+def test_cache_update_merges_entries():
+    """Entries of another cache are merged, least recently used first."""
+    other = TranslationCache(capacity=4)
+    other.put("model", "a", "A")
+    other.put("model", "b", "B")
+    cache = TranslationCache(capacity=2)
+    cache.put("model", "c", "C")
+
+    cache.update(other.items())
+
+    assert cache.get("model", "c") is None  # Evicted
+    assert cache.get("model", "b") == "B"
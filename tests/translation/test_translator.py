@@ -1,8 +1,11 @@
 from unittest import mock
 import pytest
 import multiprocessing as mp
+import queue
 import time
 from live_translation._translation._translator import Translator
+from live_translation.server._startup import WARMUP_SENTENCE
+from live_translation.server._metrics import PipelineStats
 from live_translation.server.config import Config
 
 
@@ -37,12 +40,31 @@ def test_text():
     return "Hello, how are you?"
 
 
+@pytest.fixture
+def make_translator():
+    """
+    Build a Translator whose backend upper-cases its input instead of loading
+    a model. load() is a no-op so run() keeps the fake backend.
+    """
+
+    def make(*args, **kwargs):
+        translator = Translator(*args, **kwargs)
+        translator.load = mock.Mock()
+        translator._backend = mock.Mock()
+        translator._backend.translate_batch.side_effect = lambda texts: [
+            t.upper() for t in texts
+        ]
+        return translator
+
+    return make
+
+
 def test_translator_pipeline(
     transcription_queue, output_queue, stop_event, config, test_text
 ):
     """Test Translator in full pipeline mode with output queue."""
 
-    transcription_queue.put(test_text)
+    transcription_queue.put({"seq": 0, "transcription": test_text})
 
     translator = Translator(transcription_queue, stop_event, config, output_queue)
     translator.start()
@@ -57,6 +79,7 @@ def test_translator_pipeline(
     assert not output_queue.empty(), "Output queue should contain an entry"
 
     stop_event.set()
+    transcription_queue.put(None)  # Wake the translator up
     translator.join(timeout=3)
 
     if translator.is_alive():
@@ -74,18 +97,18 @@ def test_translator_pipeline(
     assert "Hola, ¿cómo estás?" in entry["translation"], "Translation should match"
 
 
-def test_translate_skips_empty_text(config):
-    """_translate should return '' for empty/whitespace-only input."""
+def test_translate_skips_empty_text(config, make_translator):
+    """Empty/whitespace-only input translates to '' without the backend."""
 
-    translator = Translator(
+    translator = make_translator(
         transcription_queue=mp.Queue(),
         stop_event=mp.Event(),
         cfg=config,
         output_queue=mp.Queue(),
     )
 
-    result = translator._translate("   ")
-    assert result == ""
+    assert translator._translate_texts(["   ", ""]) == ["", ""]
+    translator._backend.translate_batch.assert_not_called()
 
 
 def test_translator_critical_error(config, capfd):
@@ -110,3 +133,249 @@ def test_translator_critical_error(config, capfd):
 
     out, _ = capfd.readouterr()
     assert "🚨 Critical Translator Error: load fail" in out
+
+
+def test_translator_restores_worker_order(make_translator):
+    """With several transcriber workers, items are translated in `seq` order."""
+    transcription_queue = queue.Queue()
+    for seq, text in [(1, "second"), (2, ""), (0, "first"), (3, "third")]:
+        transcription_queue.put({"seq": seq, "transcription": text})
+    output_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+
+    translator = make_translator(
+        transcription_queue, stop_event, Config(transcriber_workers=2), output_queue
+    )
+    translator.run()
+
+    entries = []
+    while not output_queue.empty():
+        entries.append(output_queue.get_nowait())
+
+    # The empty placeholder keeps the order but produces no output
+    assert [(e["transcription"], e["translation"]) for e in entries] == [
+        ("first", "FIRST"),
+        ("second", "SECOND"),
+        ("third", "THIRD"),
+    ]
+
+
+def test_translator_batches_queued_transcriptions(make_translator):
+    """Queued transcriptions are translated in batches, in order."""
+    transcription_queue = queue.Queue()
+    texts = ["one", "two", "three", "four", "five"]
+    for seq, text in enumerate(texts):
+        transcription_queue.put({"seq": seq, "transcription": text})
+    output_queue = queue.Queue()
+    stop_event = mp.Event()
+    stop_event.set()  # Drain the queue, then exit
+
+    translator = make_translator(
+        transcription_queue,
+        stop_event,
+        Config(translation_batch_size=3, translation_batch_timeout_ms=0, warmup=False),
+        output_queue,
+    )
+    translator.run()
+
+    assert [c.args[0] for c in translator._backend.translate_batch.call_args_list] == [
+        ["one", "two", "three"],
+        ["four", "five"],
+    ]
+    entries = []
+    while not output_queue.empty():
+        entries.append(output_queue.get_nowait())
+    assert [e["translation"] for e in entries] == [t.upper() for t in texts]
+    # Each entry keeps the time its own transcription was received
+    assert [e["timestamp"] for e in entries] == sorted(e["timestamp"] for e in entries)
+
+
+def test_translator_cache_skips_backend(make_translator):
+    """Cached translations are not sent to the translation backend again."""
+    translator = make_translator(mp.Queue(), mp.Event(), Config(), mp.Queue())
+
+    assert translator._translate_batch(["one", "two", "one"]) == ["ONE", "TWO", "ONE"]
+    # A missing text is translated once per batch
+    translator._backend.translate_batch.assert_called_once_with(["one", "two"])
+
+    assert translator._translate_batch(["two", "three"]) == ["TWO", "THREE"]
+    translator._backend.translate_batch.assert_called_with(["three"])
+    assert translator._cache.hits == 1
+
+
+def test_translator_translates_only_new_sentences(make_translator):
+    """Sentences of the previous transcription are not translated again."""
+    translator = make_translator(
+        mp.Queue(), mp.Event(), Config(trans_cache_size=0), mp.Queue()
+    )
+
+    assert translator._translate_texts(["Hi there. How are"]) == ["HI THERE. HOW ARE"]
+    assert translator._translate_texts(
+        ["Hi there. How are you? Fine", "Hi there. How are you? Fine, thanks."]
+    ) == [
+        "HI THERE. HOW ARE YOU? FINE",
+        "HI THERE. HOW ARE YOU? FINE, THANKS.",
+    ]
+
+    assert [c.args[0] for c in translator._backend.translate_batch.call_args_list] == [
+        ["Hi there.", "How are"],
+        ["How are you?", "Fine", "Fine, thanks."],
+    ]
+
+
+def test_split_sentences():
+    """Text is split after sentence-ending punctuation."""
+    assert Translator._split_sentences(" Hello world.  It is 3.5 degrees! Ok? ") == [
+        "Hello world.",
+        "It is 3.5 degrees!",
+        "Ok?",
+    ]
+    assert Translator._split_sentences("你好。你好吗？") == ["你好。", "你好吗？"]
+    assert Translator._split_sentences("   ") == []
+
+
+def test_translator_keeps_sentences_per_session(make_translator):
+    """Sentences are only reused from the previous transcription of a session."""
+    translator = make_translator(
+        mp.Queue(), mp.Event(), Config(trans_cache_size=0, max_sessions=2), mp.Queue()
+    )
+
+    translator._translate_texts(["Hi. One", "Hi. Two"], [0, 1])
+    translator._translate_texts(["Hi. One more", "Hi."], [0, 1])
+    # The oldest session is forgotten beyond `max_sessions`
+    translator._translate_texts(["Hi."], [2])
+
+    assert [c.args[0] for c in translator._backend.translate_batch.call_args_list] == [
+        ["Hi.", "One", "Two"],
+        ["One more"],
+        ["Hi."],
+    ]
+    assert list(translator._previous) == [1, 2]
+
+
+def test_translator_passes_unstable_tail_on(make_translator):
+    """Items with only an unstable tail reach the output, untranslated."""
+    transcription_queue = queue.Queue()
+    transcription_queue.put({"seq": 0, "transcription": "", "unstable": "Hel"})
+    transcription_queue.put(None)
+    output_queue = queue.Queue()
+    translator = make_translator(
+        transcription_queue, mp.Event(), Config(), output_queue
+    )
+
+    translator._process_batch(translator._next_batch())
+
+    entry = output_queue.get_nowait()
+    assert (entry["transcription"], entry["translation"]) == ("", "")
+    assert entry["unstable"] == "Hel"
+    translator._backend.translate_batch.assert_not_called()
+
+
+def test_translator_stops_on_sentinel(make_translator):
+    """A `None` item stops the translator after the items queued before it."""
+    transcription_queue = queue.Queue()
+    transcription_queue.put({"seq": 0, "transcription": "last"})
+    transcription_queue.put(None)
+    output_queue = queue.Queue()
+
+    translator = make_translator(
+        transcription_queue, mp.Event(), Config(), output_queue
+    )
+    translator.run()  # Returns without the stop event being set
+
+    assert output_queue.get_nowait()["translation"] == "LAST"
+    assert output_queue.empty()
+
+
+def test_translator_stamps_trace(make_translator):
+    """Traces are passed on to the output with the translation times."""
+    transcription_queue = queue.Queue()
+    transcription_queue.put(
+        {"seq": 0, "transcription": "hello", "trace": {"transcribe_end": 1.0}}
+    )
+    transcription_queue.put(None)
+    output_queue = queue.Queue()
+
+    translator = make_translator(
+        transcription_queue, mp.Event(), Config(trace=True), output_queue
+    )
+    translator.run()
+
+    trace = output_queue.get_nowait()["trace"]
+    assert trace["transcribe_end"] == 1.0
+    assert trace["translate_end"] >= trace["translate_start"]
+
+
+def test_translator_records_stats(make_translator):
+    """Batch latencies and cache totals are recorded for metrics."""
+    stats = PipelineStats()
+    translator = make_translator(
+        mp.Queue(), mp.Event(), Config(), queue.Queue(), stats=stats
+    )
+
+    translator._process_batch([{"transcription": "hello", "timestamp": "t"}])
+    translator._process_batch([{"transcription": "hello again", "timestamp": "t"}])
+
+    assert stats.translation_latency.snapshot()[0][-1] == 2
+    assert (stats.cache_hits.value, stats.cache_misses.value) == (0, 2)
+
+
+def test_translator_translate_all_batches(make_translator):
+    """translate_all() translates independent texts in batches of the batch size."""
+    translator = make_translator(
+        None, None, Config(translation_batch_size=2, trans_cache_size=0), None
+    )
+
+    texts = ["one.", "two.", "three. four."]
+    assert translator.translate_all(texts) == ["ONE.", "TWO.", "THREE. FOUR."]
+    assert translator._backend.translate_batch.call_args_list == [
+        mock.call(["one.", "two."]),
+        mock.call(["three.", "four."]),
+    ]
+
+
+def test_translator_loads_tokenizer_in_child():
+    """The tokenizer is loaded by load() (in the child), not by the parent."""
+    with (
+        mock.patch("transformers.MarianTokenizer.from_pretrained") as from_pretrained,
+        mock.patch.dict(
+            "live_translation._translation._translator.TRANSLATION_BACKENDS",
+            {"transformers": mock.Mock()},
+        ),
+    ):
+        ready_queue = queue.Queue()
+        translator = Translator(None, None, Config(), None, ready_queue=ready_queue)
+        from_pretrained.assert_not_called()
+
+        translator.load()
+        from_pretrained.assert_called_once_with("Helsinki-NLP/opus-mt-en-es")
+
+
+def test_translator_warms_up():
+    """A fixed sentence is translated, bypassing the cache, before ready."""
+    transcription_queue = queue.Queue()
+    transcription_queue.put(None)
+    ready_queue = queue.Queue()
+    backend = mock.Mock()
+
+    with (
+        mock.patch("transformers.MarianTokenizer.from_pretrained"),
+        mock.patch.dict(
+            "live_translation._translation._translator.TRANSLATION_BACKENDS",
+            {"transformers": backend},
+        ),
+    ):
+        translator = Translator(
+            transcription_queue,
+            mp.Event(),
+            Config(),
+            queue.Queue(),
+            ready_queue=ready_queue,
+        )
+        translator.run()
+
+    backend.return_value.translate_batch.assert_called_once_with([WARMUP_SENTENCE])
+    assert translator._cache.misses == 0
+    name, _, warmup = ready_queue.get_nowait()
+    assert name == "translator" and warmup >= 0